@@ -9,6 +9,7 @@ import json
 import logging
 import subprocess
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -16,6 +17,9 @@ from typing import Dict, List, Tuple
 from unitxt.catalog import get_from_catalog
 from unitxt.ui.load_catalog_data import get_catalog_items
 
+from auto_benchmarkcard.config import Config
+from auto_benchmarkcard.session_index import SessionIndex
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -34,8 +38,10 @@ class BatchJobRunner:
             "skipped": 0,
             "start_time": None,
             "end_time": None,
+            "card_seconds": {},
         }
         self.failed_cards = []
+        self.session_index = SessionIndex(Path(Config.OUTPUT_DIR))
 
     def get_all_cards(self) -> List[str]:
         """Get all unitxt cards from catalog."""
@@ -67,12 +73,21 @@ class BatchJobRunner:
         if not self.skip_existing:
             return False
 
-        # Check for existing output directory for this card
-        # Look for pattern: output/{card_name}_{timestamp}/
-        output_base = Path("output")
+        # Look for a session output/{card_name}_{timestamp}/ in the sessions index
+        output_base = Path(Config.OUTPUT_DIR)
         if not output_base.exists():
             return False
 
+        if self.session_index.exists():
+            session_dir = self.session_index.find_session(
+                card_name.replace("/", "_").replace(" ", "_")
+            )
+            if session_dir:
+                logger.debug(f"Card {card_name} already processed in {session_dir}")
+                return True
+            return False
+
+        # No index yet: scan the output directory
         for dir_path in output_base.iterdir():
             if dir_path.is_dir() and dir_path.name.startswith(f"{card_name}_"):
                 # Check if it has both tool_output and benchmarkcard directories
@@ -92,10 +107,13 @@ class BatchJobRunner:
             # Run agents.py with the card name
             cmd = [sys.executable, "agents.py", card_name]
 
+            start_time = time.perf_counter()
             result = subprocess.run(cmd, capture_output=True, text=True)
+            elapsed = time.perf_counter() - start_time
+            self.stats["card_seconds"][card_name] = round(elapsed, 1)
 
             if result.returncode == 0:
-                logger.info(f"✓ Successfully processed: {card_name}")
+                logger.info(f"✓ Successfully processed: {card_name} ({elapsed:.1f}s)")
                 return True, "Success"
             else:
                 error_msg = result.stderr.strip() if result.stderr else "Unknown error"
@@ -169,6 +187,9 @@ class BatchJobRunner:
         if self.stats["start_time"] and self.stats["end_time"]:
             duration = self.stats["end_time"] - self.stats["start_time"]
             print(f"Total runtime: {str(duration).split('.')[0]}")
+        if self.stats["card_seconds"]:
+            card_seconds = self.stats["card_seconds"].values()
+            print(f"Wall-clock per card: {sum(card_seconds) / len(card_seconds):.1f}s average")
 
         print("=" * 60)
 
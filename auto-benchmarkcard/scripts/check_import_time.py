@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Check that the CLI imports quickly and without the heavy pipeline dependencies.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and fails when
+the cumulative import time exceeds the budget, or when any of the heavy subsystems
+(LangGraph, docling, the RAG stack, FactReasoner, the inference engines) is imported.
+Those should only load once `process` runs the workflow, so `list`, `show` and
+`--help` stay fast.
+
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --budget-ms 500
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+# Top-level packages the lightweight commands must not import
+HEAVY_MODULES = [
+    "ai_atlas_nexus",
+    "chromadb",
+    "docling",
+    "fact_reasoner",
+    "langchain",
+    "langchain_community",
+    "langgraph",
+    "litellm",
+    "matplotlib",
+    "sentence_transformers",
+    "torch",
+    "transformers",
+    "unitxt",
+]
+
+
+def measure_imports(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter and record every import.
+
+    Args:
+        module: Module to import.
+
+    Returns:
+        Dictionary mapping each imported module to its cumulative import time in microseconds.
+    """
+    src_dir = Path(__file__).resolve().parent.parent / "src"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(src_dir), os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        sys.exit(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="auto_benchmarkcard.cli", help="module to import")
+    parser.add_argument(
+        "--budget-ms", type=float, default=1000, help="maximum cumulative import time (default 1000)"
+    )
+    args = parser.parse_args()
+
+    imports = measure_imports(args.module)
+    total_ms = imports.get(args.module, 0) / 1000
+    heavy = sorted(name for name in imports if name.split(".")[0] in HEAVY_MODULES)
+
+    slowest = sorted(imports.items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative in slowest[:10]:
+        print(f"{cumulative / 1000:8.1f} ms  {name}")
+    print(f"import {args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import time over budget by {total_ms - args.budget_ms:.1f} ms")
+        failed = True
+    top_level_heavy = sorted({name.split(".")[0] for name in heavy})
+    if top_level_heavy:
+        print(f"FAIL: heavy modules imported: {', '.join(top_level_heavy)}")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Check the marginal to atom mapping and the field statistics of the FactReasoner step.
+
+Builds synthetic cards with hundreds of atoms whose IDs are prefixes of each other
+(a1, a10, a17, a170) and whose marginals use plain and wrapped variable names
+(a3, atom_a3), then checks that every variable maps to exactly the expected atom and
+that the NumPy field statistics equal a plain per-atom loop.
+
+    python scripts/check_marginal_mapping.py
+"""
+
+import math
+import random
+from typing import Any, Dict, List
+
+from auto_benchmarkcard.tools.factreasoner.factreasoner_tool import (
+    analyze_factuality_by_field,
+    build_variable_atom_map,
+)
+
+FIELDS = [
+    "benchmark_details.name",
+    "benchmark_details.overview",
+    "purpose_and_intended_users.goal",
+    "data.source",
+    "data.size",
+    "methodology.metrics",
+    "ethical_and_legal_considerations.licensing",
+    "targeted_risks.risk_categories",
+]
+
+# p_true values on and around the confidence level boundaries, and the neutral 0.5
+PROBABILITIES = [0.0, 0.1, 0.2, 0.2001, 0.3, 0.4, 0.45, 0.5, 0.55, 0.6, 0.6001, 0.7, 0.8, 0.81, 1.0]
+
+STAT_KEYS = [
+    "total_atoms",
+    "high_confidence_correct",
+    "likely_correct",
+    "uncertain",
+    "likely_incorrect",
+    "high_confidence_incorrect",
+    "non_neutral_count",
+    "neutral_count",
+    "all_neutral",
+]
+
+
+def make_card(n_atoms: int, seed: int) -> Dict[str, Any]:
+    """Build a synthetic card and its marginals.
+
+    Every third atom's marginal uses a wrapped variable name, every fifth stores its
+    probability as [p_false, p_true], every seventh atom has no marginal, and the last
+    field only gets neutral scores. Context variables that mention no atom, or more
+    than one, are mixed in and must stay unmapped.
+
+    Returns:
+        Dictionary with the formatted RAG results, the marginals and the expected
+        variable to atom map.
+    """
+    rng = random.Random(seed)
+    atoms, marginals, expected = [], [], {}
+    for i in range(1, n_atoms + 1):
+        atom_id = f"a{i}"
+        field = FIELDS[i % len(FIELDS)]
+        atoms.append({"id": atom_id, "text": f"Claim {i} about {field}", "field": field})
+        if i % 7 == 0:
+            continue
+
+        variable = f"atom_{atom_id}" if i % 3 == 0 else atom_id
+        p_true = 0.5 if field == FIELDS[-1] else rng.choice(PROBABILITIES)
+        if i % 5 == 0:
+            marginals.append({"variable": variable, "probabilities": [1 - p_true, p_true]})
+        else:
+            marginals.append({"variable": variable, "p_true": p_true})
+        expected[variable] = atom_id
+
+    marginals.extend(
+        [
+            {"variable": "c12", "p_true": 0.9},
+            {"variable": "context_17_b", "p_true": 0.1},
+            {"variable": "a1_a10", "p_true": 0.9},
+        ]
+    )
+    rng.shuffle(marginals)
+    return {"results": {"atoms": atoms}, "marginals": marginals, "expected": expected}
+
+
+def reference_field_stats(
+    atoms: List[Dict[str, Any]], marginals: List[Dict[str, Any]], variable_atom_map: Dict[str, str]
+) -> Dict[str, Dict[str, Any]]:
+    """Field statistics computed one atom at a time."""
+    p_true_by_atom = {}
+    for marginal in marginals:
+        atom_id = variable_atom_map.get(marginal["variable"])
+        if atom_id is not None and atom_id not in p_true_by_atom:
+            p_true_by_atom[atom_id] = marginal.get(
+                "p_true", marginal.get("probabilities", [0, 0])[1]
+            )
+
+    stats = {}
+    for atom in atoms:
+        if atom["id"] not in p_true_by_atom:
+            continue
+        p_true = p_true_by_atom[atom["id"]]
+        field = stats.setdefault(
+            atom["field"], {key: 0 for key in STAT_KEYS[:-1]} | {"probabilities": []}
+        )
+        field["total_atoms"] += 1
+        field["probabilities"].append(p_true)
+        if p_true > 0.8:
+            field["high_confidence_correct"] += 1
+        elif p_true > 0.6:
+            field["likely_correct"] += 1
+        elif p_true >= 0.4:
+            field["uncertain"] += 1
+        elif p_true >= 0.2:
+            field["likely_incorrect"] += 1
+        else:
+            field["high_confidence_incorrect"] += 1
+
+    for field in stats.values():
+        non_neutral = [p for p in field["probabilities"] if p != 0.5]
+        field["non_neutral_count"] = len(non_neutral)
+        field["neutral_count"] = field["total_atoms"] - len(non_neutral)
+        field["all_neutral"] = not non_neutral
+        field["avg_probability"] = sum(non_neutral) / len(non_neutral) if non_neutral else 0.5
+        accurate = field["high_confidence_correct"] + field["likely_correct"]
+        errors = field["likely_incorrect"] + field["high_confidence_incorrect"]
+        field["accuracy_percentage"] = accurate / field["total_atoms"] * 100
+        field["error_percentage"] = errors / field["total_atoms"] * 100
+    return stats
+
+
+def check_variable_atom_map():
+    atom_ids = [f"a{i}" for i in range(1, 400)]
+    variables = ["a1", "a10", "a17", "a170", "atom_a3", "atom_a17", "a170_var", "c12", "a1_a10"]
+    expected = {
+        "a1": "a1",
+        "a10": "a10",
+        "a17": "a17",
+        "a170": "a170",
+        "atom_a3": "a3",
+        "atom_a17": "a17",
+        "a170_var": "a170",
+    }
+    variable_atom_map = build_variable_atom_map(atom_ids, variables)
+    assert variable_atom_map == expected, variable_atom_map
+
+    for n_atoms, seed in [(320, 0), (750, 1)]:
+        card = make_card(n_atoms, seed)
+        atom_ids = [atom["id"] for atom in card["results"]["atoms"]]
+        variables = [marginal["variable"] for marginal in card["marginals"]]
+        variable_atom_map = build_variable_atom_map(atom_ids, variables)
+        assert variable_atom_map == card["expected"], (n_atoms, seed)
+
+
+def check_field_stats():
+    for n_atoms, seed in [(320, 0), (750, 1), (1000, 2)]:
+        card = make_card(n_atoms, seed)
+        atoms = card["results"]["atoms"]
+        analysis = analyze_factuality_by_field(card["results"], card["marginals"])
+        expected = reference_field_stats(atoms, card["marginals"], card["expected"])
+
+        details = analysis["field_details"]
+        assert list(details) == list(expected), (list(details), list(expected))
+        assert analysis["summary"]["total_fields"] == len(expected)
+        for field, stats in details.items():
+            for key in STAT_KEYS:
+                assert stats[key] == expected[field][key], (field, key, stats[key])
+            for key in ["avg_probability", "accuracy_percentage", "error_percentage"]:
+                assert math.isclose(stats[key], expected[field][key]), (field, key, stats[key])
+            assert stats["probabilities"] == expected[field]["probabilities"], field
+            assert isinstance(stats["total_atoms"], int) and isinstance(stats["uncertain"], int)
+        assert details[FIELDS[-1]]["all_neutral"] and details[FIELDS[-1]]["avg_probability"] == 0.5
+
+        fields_with_errors = sum(
+            stats["likely_incorrect"] + stats["high_confidence_incorrect"] > 0
+            for stats in expected.values()
+        )
+        assert analysis["summary"]["fields_with_errors"] == fields_with_errors
+
+
+def check_no_marginals():
+    # no atom has a marginal, so there are no fields to compute statistics for
+    card = make_card(300, 3)
+    unrelated = [{"variable": "c12", "p_true": 0.9}, {"variable": "a1_a10", "p_true": 0.1}]
+    for marginals in [[], unrelated]:
+        analysis = analyze_factuality_by_field(card["results"], marginals)
+        assert analysis["field_details"] == {}
+        assert analysis["summary"] == {
+            "total_fields": 0,
+            "fields_with_errors": 0,
+            "most_problematic_field": None,
+            "most_accurate_field": None,
+            "overall_field_accuracy": {},
+        }, analysis["summary"]
+
+    analysis = analyze_factuality_by_field({"atoms": []}, [])
+    assert analysis["summary"]["total_fields"] == 0
+
+
+if __name__ == "__main__":
+    check_variable_atom_map()
+    check_field_stats()
+    check_no_marginals()
+    print("Marginal mapping checks passed")
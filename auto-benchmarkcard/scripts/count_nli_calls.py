@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Count contexts and NLI calls of formatted RAG results before and after context deduplication.
+
+Reads the formatted_rag_results_*.jsonl files written by the RAG step (per-atom contexts
+as well as content-addressed contexts) and reports, per card, the context entries and
+the atom-context NLI calls FactReasoner makes with one context per (atom, chunk) pair
+and with one context per unique chunk text.
+
+    python scripts/count_nli_calls.py output/
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+def count_card(formatted_results: Dict[str, Any]) -> Dict[str, int]:
+    """Count contexts and atom-context NLI pairs of one card.
+
+    Args:
+        formatted_results: Formatted RAG results with atoms and contexts.
+
+    Returns:
+        Dictionary with the counts before and after deduplication.
+    """
+    context_texts = {context["id"]: context["text"] for context in formatted_results["contexts"]}
+    per_atom_pairs = []
+    for atom in formatted_results["atoms"]:
+        for context_id in atom.get("contexts", []):
+            per_atom_pairs.append((context_texts.get(context_id, context_id), atom["text"]))
+
+    return {
+        "atoms": len(formatted_results["atoms"]),
+        "contexts_before": len(per_atom_pairs),
+        "contexts_after": len({text for text, _ in per_atom_pairs}),
+        "nli_calls_before": len(per_atom_pairs),
+        "nli_calls_after": len(set(per_atom_pairs)),
+    }
+
+
+def find_result_files(paths: List[str]) -> List[Path]:
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob("formatted_rag_results_*.jsonl")))
+        else:
+            files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("paths", nargs="+", help="formatted RAG result files or output directories")
+    args = parser.parse_args()
+
+    totals = {}
+    for path in find_result_files(args.paths):
+        with open(path, "r") as f:
+            formatted_results = json.loads(f.readline())
+        counts = count_card(formatted_results)
+        for key, value in counts.items():
+            totals[key] = totals.get(key, 0) + value
+        print(
+            f"{formatted_results.get('topic', path.stem)}: {counts['atoms']} atoms, "
+            f"contexts {counts['contexts_before']} -> {counts['contexts_after']}, "
+            f"NLI calls {counts['nli_calls_before']} -> {counts['nli_calls_after']}"
+        )
+
+    if totals:
+        print(
+            f"total: {totals['atoms']} atoms, "
+            f"contexts {totals['contexts_before']} -> {totals['contexts_after']}, "
+            f"NLI calls {totals['nli_calls_before']} -> {totals['nli_calls_after']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
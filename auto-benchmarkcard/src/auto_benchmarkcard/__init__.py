@@ -9,10 +9,23 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 
 from auto_benchmarkcard.config import Config
-from auto_benchmarkcard.workflow import OutputManager, build_workflow
 
 __all__ = [
     "Config",
     "build_workflow",
     "OutputManager",
 ]
+
+
+def __getattr__(name: str):
+    """Import the workflow on first use.
+
+    The workflow pulls in LangGraph, docling, the RAG stack and FactReasoner,
+    so importing the package (e.g. for the CLI's list and show commands) does
+    not load them until build_workflow or OutputManager is accessed.
+    """
+    if name in ("build_workflow", "OutputManager"):
+        from auto_benchmarkcard import workflow
+
+        return getattr(workflow, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,250 @@
+"""Local cache of downloaded artifacts shared across benchmark runs.
+
+Holds raw paper PDFs, docling conversions and HuggingFace metadata so that
+cards sharing a paper or dataset repo only fetch and convert it once, and a
+pre-warmed cache lets batch runs work offline.
+"""
+
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from auto_benchmarkcard.config import Config
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_TIMEOUT = 60
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+
+def content_hash(path: str) -> str:
+    """SHA-256 of a file's contents.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """Directory of cached artifacts, one JSON record per (namespace, key).
+
+    Records carry the time they were fetched. Records younger than the TTL are
+    served without any network access; older ones are revalidated by the caller
+    (HTTP ETag/Last-Modified for downloads, the repo commit for HuggingFace
+    metadata) and served as they are when the network is unavailable.
+
+    Attributes:
+        root: Cache directory.
+        ttl: Seconds a record is served without revalidation.
+        offline: Serve cached records without ever revalidating them.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        ttl: Optional[float] = None,
+        offline: Optional[bool] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            root: Cache directory, defaults to Config.ARTIFACT_CACHE_DIR.
+            ttl: Seconds a record is served without revalidation, defaults to
+                Config.ARTIFACT_CACHE_TTL.
+            offline: Never revalidate cached records, defaults to
+                Config.ARTIFACT_CACHE_OFFLINE.
+        """
+        self.root = root or Config.ARTIFACT_CACHE_DIR
+        self.ttl = Config.ARTIFACT_CACHE_TTL if ttl is None else ttl
+        self.offline = Config.ARTIFACT_CACHE_OFFLINE if offline is None else offline
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def path(self, namespace: str, key: str, suffix: str = ".json") -> str:
+        """Location of an artifact in the cache.
+
+        Args:
+            namespace: Artifact kind, e.g. 'url', 'docling' or 'hf'.
+            key: Artifact identifier, e.g. a URL or repo ID.
+            suffix: File suffix.
+
+        Returns:
+            Path of the artifact file.
+        """
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, namespace, digest + suffix)
+
+    def lock(self, namespace: str, key: str) -> threading.Lock:
+        """Lock serializing concurrent fetches of the same artifact.
+
+        Args:
+            namespace: Artifact kind.
+            key: Artifact identifier.
+
+        Returns:
+            Lock shared by all callers fetching this artifact.
+        """
+        with self._locks_guard:
+            return self._locks.setdefault(f"{namespace}:{key}", threading.Lock())
+
+    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """Load a cached record.
+
+        Args:
+            namespace: Artifact kind.
+            key: Artifact identifier.
+
+        Returns:
+            The record, or None if it is not cached.
+        """
+        try:
+            with open(self.path(namespace, key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, namespace: str, key: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a record, stamped with the current time.
+
+        Args:
+            namespace: Artifact kind.
+            key: Artifact identifier.
+            record: JSON-serializable record.
+
+        Returns:
+            The stored record.
+        """
+        record = {**record, "fetched_at": time.time()}
+        self._write_atomic(self.path(namespace, key), json.dumps(record, default=str).encode())
+        return record
+
+    def is_fresh(self, record: Dict[str, Any]) -> bool:
+        """Whether a record can be served without revalidation.
+
+        Args:
+            record: Cached record.
+
+        Returns:
+            True if the cache is offline or the record is younger than the TTL.
+        """
+        return self.offline or time.time() - record.get("fetched_at", 0) < self.ttl
+
+    def fetch_url(self, url: str) -> Tuple[str, str]:
+        """Download a URL into the cache, revalidating stale copies.
+
+        A cached copy younger than the TTL is used as is. An older copy is
+        revalidated with a conditional request and kept when the server answers
+        304 Not Modified or cannot be reached.
+
+        Args:
+            url: URL to download.
+
+        Returns:
+            Tuple of (local file path, SHA-256 of the file contents).
+
+        Raises:
+            requests.RequestException: If the URL is not cached and cannot be
+                downloaded.
+        """
+        with self.lock("url", url):
+            record = self.get("url", url)
+            if record and os.path.exists(record["path"]):
+                if self.is_fresh(record):
+                    return record["path"], record["sha256"]
+                headers = {}
+                if record.get("etag"):
+                    headers["If-None-Match"] = record["etag"]
+                if record.get("last_modified"):
+                    headers["If-Modified-Since"] = record["last_modified"]
+            else:
+                record, headers = None, {}
+
+            try:
+                response = requests.get(
+                    url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT
+                )
+                if record and response.status_code == 304:
+                    response.close()
+                    record = self.put("url", url, record)
+                    return record["path"], record["sha256"]
+                response.raise_for_status()
+            except requests.RequestException as e:
+                if record:
+                    logger.warning("Could not revalidate %s, using cached copy: %s", url, e)
+                    return record["path"], record["sha256"]
+                raise
+
+            download_path = self.path("url", url, suffix=".download")
+            with response:
+                self._write_atomic(
+                    download_path, response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+                )
+            sha256 = content_hash(download_path)
+            # keep a file extension so converters can detect the format
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+            suffix = mimetypes.guess_extension(content_type) or os.path.splitext(
+                urlparse(url).path
+            )[1]
+            blob_path = self.path("blob", sha256, suffix=suffix[:8])
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            os.replace(download_path, blob_path)
+
+            self.put(
+                "url",
+                url,
+                {
+                    "url": url,
+                    "path": blob_path,
+                    "sha256": sha256,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                },
+            )
+            logger.debug("Downloaded %s to %s", url, blob_path)
+            return blob_path, sha256
+
+    @staticmethod
+    def _write_atomic(path: str, data) -> None:
+        """Write bytes, or an iterable of byte chunks, to path atomically."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if isinstance(data, bytes):
+                    f.write(data)
+                else:
+                    for chunk in data:
+                        f.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Get or create the shared artifact cache (lazy initialization).
+
+    Returns:
+        ArtifactCache: Cache configured from Config.
+    """
+    if not hasattr(get_artifact_cache, "_instance"):
+        get_artifact_cache._instance = ArtifactCache()
+    return get_artifact_cache._instance
@@ -69,7 +69,8 @@ logging.root.setLevel(logging.WARNING)
 try:
     from auto_benchmarkcard.cli_logger import WorkflowCLILogger
     from auto_benchmarkcard.config import Config
-    from auto_benchmarkcard.workflow import main as run_workflow
+    from auto_benchmarkcard.session_index import SessionIndex, read_manifest, scan_session
+    from auto_benchmarkcard.stage_cache import STAGES
 except ImportError as e:
     print(f"❌ Import Error: {e}")
     print("Please ensure all dependencies are installed and the project is properly set up.")
@@ -421,6 +422,26 @@ def validate_benchmark_name(benchmark: str) -> str:
     return sanitized
 
 
+def validate_stage(stage: Optional[str]) -> Optional[str]:
+    """Validate a workflow stage name.
+
+    Args:
+        stage: Stage name from user input, or None.
+
+    Returns:
+        The stage name.
+
+    Raises:
+        typer.BadParameter: If the stage is not a workflow stage.
+    """
+    if stage is not None and stage not in STAGES:
+        raise typer.BadParameter(
+            f"[red]Unknown stage: {stage}[/red]\n"
+            f"[dim]Stages: {', '.join(STAGES)}[/dim]"
+        )
+    return stage
+
+
 def validate_path(path: str, must_exist: bool = False) -> Path:
     """Validate file or directory path.
 
@@ -468,6 +489,8 @@ def execute_workflow_with_cli_integration(
     catalog: Optional[str] = None,
     output_dir: Optional[str] = None,
     debug: bool = False,
+    from_stage: Optional[str] = None,
+    stage_cache: bool = True,
 ) -> None:
     """Execute the main workflow with CLI integration.
 
@@ -479,6 +502,8 @@ def execute_workflow_with_cli_integration(
         catalog: Optional custom catalog path.
         output_dir: Optional custom output directory.
         debug: Whether to enable debug mode.
+        from_stage: Optional stage to re-run from, reusing cached earlier stages.
+        stage_cache: Whether to reuse and store cached stage outputs.
     """
     # Prepare arguments for the main workflow
     original_argv = sys.argv.copy()
@@ -490,6 +515,10 @@ def execute_workflow_with_cli_integration(
         sys.argv.extend(["--output", str(output_dir)])
     if debug:
         sys.argv.append("--debug")
+    if from_stage:
+        sys.argv.extend(["--from-stage", from_stage])
+    if not stage_cache:
+        sys.argv.append("--no-stage-cache")
 
     console.print(f"\n[dim]Starting workflow execution...[/dim]")
 
@@ -509,7 +538,7 @@ def execute_workflow_with_cli_integration(
 
         try:
             # Execute the main workflow
-            run_workflow()
+            agents.main()
         finally:
             # Restore original logger and argv
             agents.logger = original_agents_logger
@@ -519,6 +548,9 @@ def execute_workflow_with_cli_integration(
 def get_session_info(session_dir: Path) -> Dict[str, Union[str, int, bool]]:
     """Extract comprehensive session information from a directory.
 
+    Reads the manifest written when the session finished, and only walks the
+    directory for sessions without one.
+
     Args:
         session_dir: Path to the session directory to analyze.
 
@@ -527,30 +559,15 @@ def get_session_info(session_dir: Path) -> Dict[str, Union[str, int, bool]]:
         completion status, file counts, and sizes.
     """
     try:
-        # Parse directory name
-        parts = session_dir.name.rsplit("_", 2)
-        benchmark = "_".join(parts[:-2]) if len(parts) > 2 else parts[0]
-        timestamp = "_".join(parts[-2:]) if len(parts) >= 2 else "unknown"
-
-        # Check completion status
-        benchmark_card_dir = session_dir / "benchmarkcard"
-        tool_output_dir = session_dir / "tool_output"
-
-        completed = benchmark_card_dir.exists() and any(benchmark_card_dir.glob("*.json"))
-        tool_count = len(list(tool_output_dir.iterdir())) if tool_output_dir.exists() else 0
-
-        # Get file statistics
-        total_size = sum(f.stat().st_size for f in session_dir.rglob("*") if f.is_file())
-        file_count = len(list(session_dir.rglob("*")))
-
+        info = read_manifest(session_dir) or scan_session(session_dir)
         return {
-            "benchmark": benchmark,
-            "timestamp": timestamp,
-            "completed": completed,
-            "tool_count": tool_count,
-            "total_size_mb": total_size / (1024 * 1024),
-            "file_count": file_count,
-            "modified_time": session_dir.stat().st_mtime,
+            "benchmark": info["benchmark"],
+            "timestamp": info["timestamp"],
+            "completed": info["completed"],
+            "tool_count": info["tool_count"],
+            "total_size_mb": info["total_size_mb"],
+            "file_count": info["file_count"],
+            "modified_time": info["modified_time"],
         }
     except Exception:
         return {
@@ -635,6 +652,23 @@ def process_benchmark(
             rich_help_panel="⚙️ Processing Options",
         ),
     ] = False,
+    from_stage: Annotated[
+        Optional[str],
+        typer.Option(
+            "--from-stage",
+            help=f"Re-run this stage and all later ones, reusing cached earlier stages ({', '.join(STAGES)})",
+            callback=validate_stage,
+            rich_help_panel="⚙️ Processing Options",
+        ),
+    ] = None,
+    no_stage_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-stage-cache",
+            help="Run every stage from scratch without reading or writing the stage cache",
+            rich_help_panel="⚙️ Processing Options",
+        ),
+    ] = False,
 ) -> None:
     """
     🚀 Process a benchmark through the complete metadata extraction and validation pipeline.
@@ -659,6 +693,9 @@ def process_benchmark(
 
         [dim]# Using custom catalog with log file[/dim]
         benchmarkcard process ethos_binary --catalog ./custom --log-file process.log
+
+        [dim]# Retry fact-checking, reusing cached extraction and composition[/dim]
+        benchmarkcard process glue --from-stage factreasoner
     """
     # Setup logging
     logger = setup_logging(verbose=verbose, log_file=log_file)
@@ -772,6 +809,8 @@ def process_benchmark(
             catalog=str(catalog_path) if catalog else None,
             output_dir=str(output_path) if output_dir else None,
             debug=debug,
+            from_stage=from_stage,
+            stage_cache=not no_stage_cache,
         )
 
         # Mark overall success
@@ -902,9 +941,14 @@ def list_outputs(
     with workflow_substep("Scanning processing sessions", show_completion=False):
         sessions = []
         session_count = 0
+        # Finished sessions come from the index, the rest are read or scanned
+        indexed = SessionIndex(output_path).entries()
         for item in output_path.iterdir():
             if item.is_dir() and "_" in item.name:
-                session_info = get_session_info(item)
+                if item.name in indexed:
+                    session_info = dict(indexed[item.name])
+                else:
+                    session_info = get_session_info(item)
                 if session_info["benchmark"] != "unknown":
                     session_info["path"] = item
                     sessions.append(session_info)
@@ -1064,6 +1108,8 @@ def show_session(
 
     # Get comprehensive session info
     session_info = get_session_info(session_dir)
+    # Without --detailed, finished sessions are shown from their manifest
+    manifest = None if detailed else read_manifest(session_dir)
 
     # Header
     console.print(Rule(f"[bold cyan]Session Details: {session_dir.name}[/bold cyan]", style="cyan"))
@@ -1117,28 +1163,35 @@ def show_session(
             "factreasoner": "Factuality verification scores",
         }
 
-        for tool_dir in sorted(tool_output_dir.iterdir()):
-            if tool_dir.is_dir():
-                files = list(tool_dir.glob("*"))
-                file_count = len(files)
-                total_size = sum(f.stat().st_size for f in files if f.is_file()) / 1024  # KB
-                description = tool_descriptions.get(tool_dir.name, "Tool output")
-
+        if manifest:
+            for tool_name, stats in sorted(manifest["tools"].items()):
+                total_size = stats["size"] / 1024  # KB
+                description = tool_descriptions.get(tool_name, "Tool output")
                 size_str = f"{total_size:.1f} KB" if total_size > 0 else "0 KB"
-                tools_table.add_row(tool_dir.name, str(file_count), size_str, description)
-
-                # Show detailed file info if requested
-                if detailed and files:
-                    console.print(f"\n[dim]Files in {tool_dir.name}:[/dim]")
-                    for file in sorted(files):
-                        if file.is_file():
-                            size_kb = file.stat().st_size / 1024
-                            mtime = datetime.fromtimestamp(file.stat().st_mtime).strftime(
-                                "%Y-%m-%d %H:%M"
-                            )
-                            console.print(
-                                f"  📄 [blue]{file.name}[/blue] ({size_kb:.1f} KB, {mtime})"
-                            )
+                tools_table.add_row(tool_name, str(stats["files"]), size_str, description)
+        else:
+            for tool_dir in sorted(tool_output_dir.iterdir()):
+                if tool_dir.is_dir():
+                    files = list(tool_dir.glob("*"))
+                    file_count = len(files)
+                    total_size = sum(f.stat().st_size for f in files if f.is_file()) / 1024  # KB
+                    description = tool_descriptions.get(tool_dir.name, "Tool output")
+
+                    size_str = f"{total_size:.1f} KB" if total_size > 0 else "0 KB"
+                    tools_table.add_row(tool_dir.name, str(file_count), size_str, description)
+
+                    # Show detailed file info if requested
+                    if detailed and files:
+                        console.print(f"\n[dim]Files in {tool_dir.name}:[/dim]")
+                        for file in sorted(files):
+                            if file.is_file():
+                                size_kb = file.stat().st_size / 1024
+                                mtime = datetime.fromtimestamp(file.stat().st_mtime).strftime(
+                                    "%Y-%m-%d %H:%M"
+                                )
+                                console.print(
+                                    f"  📄 [blue]{file.name}[/blue] ({size_kb:.1f} KB, {mtime})"
+                                )
 
         console.print(tools_table)
         console.print()
@@ -1152,31 +1205,40 @@ def show_session(
         cards_table.add_column("Size", style="yellow", width=10, justify="right")
         cards_table.add_column("Modified", style="blue", width=16)
 
-        for card_file in sorted(benchmark_card_dir.glob("*.json")):
-            size_kb = card_file.stat().st_size / 1024
-            mtime = datetime.fromtimestamp(card_file.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
-            cards_table.add_row(card_file.name, f"{size_kb:.1f} KB", mtime)
-
-            # Show content preview if detailed
-            if detailed:
-                try:
-                    with open(card_file) as f:
-                        data = json.load(f)
-
-                    if "benchmark_card" in data:
-                        card = data["benchmark_card"]
-                        details = card.get("benchmark_details", {})
-                        console.print(f"\n[dim]Preview of {card_file.name}:[/dim]")
-                        console.print(f"  📝 Name: [cyan]{details.get('name', 'N/A')}[/cyan]")
-                        console.print(f"  🏷️ Domains: {', '.join(details.get('domains', []))}")
-                        console.print(f"  🌐 Languages: {', '.join(details.get('languages', []))}")
-
-                        overview = details.get("overview", "")
-                        if overview:
-                            preview = overview[:150] + "..." if len(overview) > 150 else overview
-                            console.print(f"  📖 Overview: [dim]{preview}[/dim]")
-                except Exception as e:
-                    console.print(f"  [red]Error reading {card_file.name}: {e}[/red]")
+        if manifest:
+            for card in manifest["cards"]:
+                mtime = datetime.fromtimestamp(card["modified_time"]).strftime("%Y-%m-%d %H:%M")
+                cards_table.add_row(card["name"], f"{card['size'] / 1024:.1f} KB", mtime)
+        else:
+            for card_file in sorted(benchmark_card_dir.glob("*.json")):
+                size_kb = card_file.stat().st_size / 1024
+                mtime = datetime.fromtimestamp(card_file.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
+                cards_table.add_row(card_file.name, f"{size_kb:.1f} KB", mtime)
+
+                # Show content preview if detailed
+                if detailed:
+                    try:
+                        with open(card_file) as f:
+                            data = json.load(f)
+
+                        if "benchmark_card" in data:
+                            card = data["benchmark_card"]
+                            details = card.get("benchmark_details", {})
+                            console.print(f"\n[dim]Preview of {card_file.name}:[/dim]")
+                            console.print(f"  📝 Name: [cyan]{details.get('name', 'N/A')}[/cyan]")
+                            domains = ", ".join(details.get("domains", []))
+                            languages = ", ".join(details.get("languages", []))
+                            console.print(f"  🏷️ Domains: {domains}")
+                            console.print(f"  🌐 Languages: {languages}")
+
+                            overview = details.get("overview", "")
+                            if overview:
+                                preview = (
+                                    overview[:150] + "..." if len(overview) > 150 else overview
+                                )
+                                console.print(f"  📖 Overview: [dim]{preview}[/dim]")
+                    except Exception as e:
+                        console.print(f"  [red]Error reading {card_file.name}: {e}[/red]")
 
         console.print(cards_table)
         console.print()
@@ -1,6 +1,7 @@
 """Configuration management for benchmark metadata processing."""
 
 import os
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -28,11 +29,18 @@ class Config:
     # Processing Configuration
     DEFAULT_FACTUALITY_THRESHOLD: float = 0.8
     DEFAULT_TOP_K: int = 4
+    NLI_BATCH_SIZE: int = 16  # atom-context pairs per NLI model call
+    COMPOSER_MAX_WORKERS: int = 5  # card sections generated in parallel
+    HF_MAX_WORKERS: int = 4  # HuggingFace repos fetched in parallel
+    ATOMIZER_SECTION_SPLIT_CHARS: int = 4000  # larger cards are atomized per section
 
     # RAG Configuration
     ENABLE_LLM_RERANKING: bool = True
     ENABLE_HYBRID_SEARCH: bool = True
     ENABLE_QUERY_EXPANSION: bool = True
+    PROMPT_TOKEN_BUDGET: int = 3000  # max tokens per reformulation or rerank prompt
+    PROMPT_PACK_MAX_RETRIES: int = 2  # retry rounds for prompts with unparseable answers
+    PROMPT_TOKENIZER_ENCODING: str = "cl100k_base"  # tiktoken encoding used to count tokens
 
     # Chunking Configuration
     PARENT_CHUNK_SIZE: int = 2048
@@ -40,6 +48,13 @@ class Config:
 
     # Directory Configuration (string-based for backward compatibility)
     FACTREASONER_CACHE_DIR: str = "factreasoner_cache"
+    STAGE_CACHE_DIR: str = "stage_cache"  # content-addressed workflow stage outputs
+    ARTIFACT_CACHE_DIR: str = "artifact_cache"  # papers, docling conversions, HF metadata
+
+    # Artifact Cache Configuration
+    ARTIFACT_CACHE_TTL: int = 7 * 24 * 3600  # seconds before cached artifacts are revalidated
+    # serve cached artifacts without revalidating, e.g. for batch runs from a pre-warmed cache
+    ARTIFACT_CACHE_OFFLINE: bool = os.getenv("ARTIFACT_CACHE_OFFLINE", "").lower() in ("1", "true")
     MERLIN_PATH: str = "external/merlin/bin/merlin"  # Deprecated: use MERLIN_BIN
 
     # File Extensions
@@ -53,6 +68,8 @@ class Config:
     TOOL_OUTPUT_DIR: str = "tool_output"
     BENCHMARK_CARD_DIR: str = "benchmarkcard"
     OUTPUT_DIR: str = "output"
+    SESSION_MANIFEST_FILE: str = "manifest.json"  # per-session summary written when a run ends
+    SESSION_INDEX_FILE: str = "sessions.jsonl"  # append-only index of finished sessions
 
     @classmethod
     def get_env_var(cls, key: str, default: Optional[str] = None) -> Optional[str]:
@@ -81,6 +98,9 @@ class Config:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
 
 
+_llm_handler_lock = threading.Lock()
+
+
 def get_llm_handler():
     """Get or create LLM handler instance (lazy initialization).
 
@@ -92,16 +112,25 @@ def get_llm_handler():
     """
     from auto_benchmarkcard.llm_handler import LLMHandler
 
-    if not hasattr(get_llm_handler, "_instance"):
-        try:
-            get_llm_handler._instance = LLMHandler(
-                engine_type=Config.LLM_ENGINE_TYPE,
-                verbose=False  # Disable progress bars for cleaner output
-            )
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize LLM handler: {e}") from e
+    with _llm_handler_lock:
+        if not hasattr(get_llm_handler, "_instance"):
+            try:
+                get_llm_handler._instance = LLMHandler(
+                    engine_type=Config.LLM_ENGINE_TYPE,
+                    verbose=False  # Disable progress bars for cleaner output
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to initialize LLM handler: {e}") from e
     return get_llm_handler._instance
 
 
-# Backward compatibility
-LLM = get_llm_handler()
+def __getattr__(name: str):
+    """Create the shared LLM handler on first access of ``config.LLM``.
+
+    Building the handler sets up an inference engine, so it is deferred until
+    a tool actually needs it instead of happening when config is imported.
+    """
+    # Backward compatibility
+    if name == "LLM":
+        return get_llm_handler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
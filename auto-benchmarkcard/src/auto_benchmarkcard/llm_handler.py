@@ -124,6 +124,25 @@ class LLMHandler:
         result = self.engine.generate([prompt], response_format=response_format, verbose=self.verbose)
         return result[0].prediction
 
+    def generate_batch(
+        self, prompts: List[str], response_format: Optional[Dict] = None
+    ) -> List[str]:
+        """Generate text responses for many prompts in one engine request.
+
+        The engine sends the prompts concurrently, up to its concurrency limit.
+
+        Args:
+            prompts: Text prompts for generation
+            response_format: Optional JSON schema for structured output, shared by all prompts
+
+        Returns:
+            Generated text strings, in prompt order
+        """
+        if not prompts:
+            return []
+        result = self.engine.generate(prompts, response_format=response_format, verbose=self.verbose)
+        return [output.prediction for output in result]
+
     def chat(
         self,
         messages: Union[List[Dict[str, str]], str],
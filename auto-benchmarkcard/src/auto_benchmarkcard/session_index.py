@@ -0,0 +1,270 @@
+"""Manifests and an index of finished benchmark processing sessions.
+
+When a run finishes, the session directory gets a manifest with its status,
+file counts and sizes, and one line is appended to a JSONL index in the output
+directory. Listing sessions, showing one and checking whether a benchmark was
+already processed then read these instead of walking every session directory.
+Sessions without a manifest, e.g. runs that are still in progress, crashed, or
+predate the index, are scanned as before.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from auto_benchmarkcard.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the manifest layout changes
+SESSION_MANIFEST_VERSION = 1
+
+
+def parse_session_name(name: str) -> Dict[str, str]:
+    """Split a session directory name into benchmark name and timestamp.
+
+    Args:
+        name: Session directory name, <benchmark_name>_<date>_<time>.
+
+    Returns:
+        Dictionary with the benchmark name and timestamp.
+    """
+    parts = name.rsplit("_", 2)
+    return {
+        "benchmark": "_".join(parts[:-2]) if len(parts) > 2 else parts[0],
+        "timestamp": "_".join(parts[-2:]) if len(parts) >= 2 else "unknown",
+    }
+
+
+def scan_session(session_dir: Path) -> Dict[str, Any]:
+    """Collect session statistics by walking the session directory once.
+
+    Args:
+        session_dir: Session directory to scan.
+
+    Returns:
+        Dictionary with the benchmark name, timestamp, completion status, tool
+        and file counts, total size, per-tool statistics and benchmark cards.
+    """
+    tool_output_dir = session_dir / Config.TOOL_OUTPUT_DIR
+    benchmark_card_dir = session_dir / Config.BENCHMARK_CARD_DIR
+
+    tools: Dict[str, Dict[str, int]] = {}
+    cards: List[Dict[str, Any]] = []
+    total_size = 0
+    file_count = 0
+    for root, dirs, files in os.walk(session_dir):
+        root_path = Path(root)
+        # count directories like the recursive listing the CLI used to do
+        file_count += len(dirs) + len(files)
+        for filename in files:
+            if root_path == session_dir and filename == Config.SESSION_MANIFEST_FILE:
+                file_count -= 1
+                continue
+            stat = (root_path / filename).stat()
+            total_size += stat.st_size
+            if root_path.parent == tool_output_dir:
+                tool = tools.setdefault(root_path.name, {"files": 0, "size": 0})
+                tool["files"] += 1
+                tool["size"] += stat.st_size
+            elif root_path == benchmark_card_dir and filename.endswith(Config.JSON_EXTENSION):
+                cards.append({"name": filename, "size": stat.st_size, "modified_time": stat.st_mtime})
+        if root_path == tool_output_dir:
+            for tool_name in dirs:
+                tools.setdefault(tool_name, {"files": 0, "size": 0})
+
+    return {
+        **parse_session_name(session_dir.name),
+        "completed": bool(cards),
+        "tool_count": len(tools),
+        "total_size_mb": total_size / (1024 * 1024),
+        "file_count": file_count,
+        "modified_time": session_dir.stat().st_mtime,
+        "tools": tools,
+        "cards": sorted(cards, key=lambda card: card["name"]),
+    }
+
+
+def read_manifest(session_dir: Path) -> Optional[Dict[str, Any]]:
+    """Load a session's manifest.
+
+    Args:
+        session_dir: Session directory.
+
+    Returns:
+        The manifest, or None if the session has no readable manifest.
+    """
+    try:
+        with open(session_dir / Config.SESSION_MANIFEST_FILE, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != SESSION_MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def write_session_manifest(
+    session_dir: Path, errors: Optional[List[str]] = None, elapsed: Optional[float] = None
+) -> Dict[str, Any]:
+    """Write a finished session's manifest and add it to the sessions index.
+
+    Args:
+        session_dir: Session directory.
+        errors: Errors the run reported.
+        elapsed: Wall-clock time of the run in seconds.
+
+    Returns:
+        The manifest.
+    """
+    session_dir = Path(session_dir)
+    manifest = {
+        "version": SESSION_MANIFEST_VERSION,
+        **scan_session(session_dir),
+        "errors": errors or [],
+        "elapsed_seconds": round(elapsed, 1) if elapsed is not None else None,
+        "finished_at": time.time(),
+    }
+    manifest["modified_time"] = manifest["finished_at"]
+
+    fd, tmp_path = tempfile.mkstemp(dir=session_dir, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, session_dir / Config.SESSION_MANIFEST_FILE)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    index = SessionIndex(session_dir.parent)
+    if not index.exists():
+        index.backfill(exclude=session_dir.name)
+    index.append(session_dir.name, manifest)
+    return manifest
+
+
+class SessionIndex:
+    """Append-only JSONL index of finished sessions in an output directory.
+
+    Each line holds the summary of one session manifest. A session that is
+    indexed more than once, e.g. after a re-run, is represented by its last
+    line.
+
+    Attributes:
+        output_dir: Output directory holding the session directories.
+        path: Index file.
+    """
+
+    def __init__(self, output_dir: Path):
+        """Initialize the index.
+
+        Args:
+            output_dir: Output directory holding the session directories.
+        """
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / Config.SESSION_INDEX_FILE
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._by_benchmark: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
+    def exists(self) -> bool:
+        """Whether the output directory has an index."""
+        return self.path.exists()
+
+    def append(self, session_name: str, manifest: Dict[str, Any]) -> None:
+        """Add a finished session to the index.
+
+        Args:
+            session_name: Session directory name.
+            manifest: Session manifest.
+        """
+        entry = {
+            "session": session_name,
+            "benchmark": manifest["benchmark"],
+            "timestamp": manifest["timestamp"],
+            "completed": manifest["completed"],
+            "tool_count": manifest["tool_count"],
+            "file_count": manifest["file_count"],
+            "total_size_mb": manifest["total_size_mb"],
+            "modified_time": manifest["modified_time"],
+        }
+        # one short write per line, so concurrent runs do not interleave entries
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._entries = self._by_benchmark = None
+
+    def backfill(self, exclude: Optional[str] = None) -> int:
+        """Index the sessions already in the output directory.
+
+        Run once when the index is created, so sessions from before the index
+        existed are still listed and skipped by batch runs.
+
+        Args:
+            exclude: Session directory name to leave out.
+
+        Returns:
+            Number of sessions indexed.
+        """
+        count = 0
+        for item in sorted(self.output_dir.iterdir()):
+            if not item.is_dir() or "_" not in item.name or item.name == exclude:
+                continue
+            try:
+                manifest = read_manifest(item) or scan_session(item)
+            except OSError as e:
+                logger.debug("Could not index %s: %s", item, e)
+                continue
+            self.append(item.name, manifest)
+            count += 1
+        logger.debug("Indexed %d existing sessions in %s", count, self.path)
+        return count
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Indexed sessions by directory name.
+
+        Returns:
+            Dictionary mapping session directory names to their index entry.
+        """
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, "r") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                            self._entries[entry["session"]] = entry
+                        except (ValueError, KeyError):
+                            logger.debug("Skipping malformed line in %s", self.path)
+            except OSError:
+                pass
+        return self._entries
+
+    def find_session(self, benchmark: str) -> Optional[Path]:
+        """Most recent finished session of a benchmark that still exists.
+
+        Args:
+            benchmark: Benchmark name as used in session directory names.
+
+        Returns:
+            Path of the session directory, or None if the benchmark has no
+            finished session.
+        """
+        if self._by_benchmark is None:
+            self._by_benchmark = {}
+            for entry in self.entries().values():
+                self._by_benchmark.setdefault(entry["benchmark"], []).append(entry)
+
+        candidates = sorted(
+            self._by_benchmark.get(benchmark, []),
+            key=lambda entry: entry["modified_time"],
+            reverse=True,
+        )
+        for entry in candidates:
+            session_dir = self.output_dir / entry["session"]
+            if session_dir.is_dir():
+                return session_dir
+        return None
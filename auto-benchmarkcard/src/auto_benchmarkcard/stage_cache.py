@@ -0,0 +1,229 @@
+"""Content-addressed cache of workflow stage outputs.
+
+Every stage output is stored under a key derived from the stage name, the
+parts of the workflow state the stage reads, and the configuration the stage
+depends on. Re-running a benchmark whose inputs did not change loads the saved
+outputs instead of calling UnitXT, Hugging Face, docling or the LLM again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from auto_benchmarkcard.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Bump when a stage changes what it produces for the same inputs
+STAGE_CACHE_VERSION = 3
+
+# Workflow stages in execution order
+STAGES = [
+    "unitxt",
+    "extractor",
+    "hf",
+    "hf_extractor",
+    "docling",
+    "composer",
+    "risk",
+    "rag",
+    "factreasoner",
+]
+
+# State fields each stage reads. Every stage names its output files after the
+# query, so the query is part of every key and a cached entry never restores
+# another benchmark's files; work shared across benchmarks is reused through
+# the artifact cache instead.
+STAGE_INPUTS = {
+    "unitxt": ["query", "catalog_path"],
+    "extractor": ["query", "unitxt_json"],
+    "hf": ["query", "hf_repo"],
+    "hf_extractor": ["query", "hf_json", "extracted_ids"],
+    "docling": ["query", "extracted_ids"],
+    "composer": [
+        "query",
+        "catalog_path",
+        "unitxt_json",
+        "hf_json",
+        "extracted_ids",
+        "docling_output",
+    ],
+    "risk": ["query", "composed_card"],
+    "rag": ["query", "unitxt_json", "hf_json", "docling_output", "composed_card"],
+    "factreasoner": ["query", "rag_results", "risk_enhanced_card", "composed_card"],
+}
+
+# Output directories, relative to the session directory, each stage writes to
+STAGE_OUTPUT_DIRS = {
+    "unitxt": [os.path.join(Config.TOOL_OUTPUT_DIR, "unitxt")],
+    "extractor": [os.path.join(Config.TOOL_OUTPUT_DIR, "extractor")],
+    "hf": [os.path.join(Config.TOOL_OUTPUT_DIR, "hf")],
+    "hf_extractor": [os.path.join(Config.TOOL_OUTPUT_DIR, "extractor")],
+    "docling": [os.path.join(Config.TOOL_OUTPUT_DIR, "docling")],
+    "composer": [os.path.join(Config.TOOL_OUTPUT_DIR, "composer")],
+    "risk": [
+        os.path.join(Config.TOOL_OUTPUT_DIR, "risk_enhanced"),
+        os.path.join(Config.TOOL_OUTPUT_DIR, "ai_atlas_nexus"),
+    ],
+    "rag": [os.path.join(Config.TOOL_OUTPUT_DIR, "rag")],
+    "factreasoner": [
+        os.path.join(Config.TOOL_OUTPUT_DIR, "factreasoner"),
+        Config.BENCHMARK_CARD_DIR,
+    ],
+}
+
+
+def stage_config(stage: str) -> Dict[str, Any]:
+    """Configuration a stage's output depends on.
+
+    Args:
+        stage: Workflow stage name.
+
+    Returns:
+        Dictionary of the relevant configuration values.
+    """
+    config = {"version": STAGE_CACHE_VERSION}
+    if stage == "hf" and not Config.ARTIFACT_CACHE_OFFLINE:
+        # Hugging Face metadata is revalidated after ARTIFACT_CACHE_TTL, so the
+        # cached stage output expires with it instead of living forever
+        config["revalidation_window"] = int(time.time() // Config.ARTIFACT_CACHE_TTL)
+    if stage in ("composer", "risk", "rag", "factreasoner"):
+        config["model"] = Config.DEFAULT_MODEL
+        config["engine"] = Config.LLM_ENGINE_TYPE
+    if stage == "rag":
+        config.update(
+            embedding_model=Config.DEFAULT_EMBEDDING_MODEL,
+            llm_reranking=Config.ENABLE_LLM_RERANKING,
+            hybrid_search=Config.ENABLE_HYBRID_SEARCH,
+            query_expansion=Config.ENABLE_QUERY_EXPANSION,
+            parent_chunk_size=Config.PARENT_CHUNK_SIZE,
+            child_chunk_size=Config.CHILD_CHUNK_SIZE,
+            top_k=Config.DEFAULT_TOP_K,
+        )
+    if stage == "factreasoner":
+        config["threshold"] = Config.DEFAULT_FACTUALITY_THRESHOLD
+    return config
+
+
+class StageCache:
+    """Stage outputs keyed by (stage, inputs fingerprint, config version).
+
+    An entry holds the state update the stage returned and a copy of the files
+    it wrote to the session directory, so a cached run produces the same
+    session layout as a full run.
+
+    Attributes:
+        cache_dir: Directory holding the cache entries.
+        from_stage: First stage that is always re-run, or None to use every
+            cached stage.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, from_stage: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries, defaults to
+                Config.STAGE_CACHE_DIR.
+            from_stage: First stage that is always re-run. It and all later
+                stages ignore cached outputs but still refresh them.
+
+        Raises:
+            ValueError: If from_stage is not a workflow stage.
+        """
+        if from_stage is not None and from_stage not in STAGES:
+            raise ValueError(f"Unknown stage '{from_stage}', expected one of: {', '.join(STAGES)}")
+        self.cache_dir = cache_dir or Config.STAGE_CACHE_DIR
+        self.from_stage = from_stage
+
+    def make_key(self, stage: str, state: Dict[str, Any]) -> str:
+        """Cache key of a stage for the current state.
+
+        Args:
+            stage: Workflow stage name.
+            state: Current workflow state.
+
+        Returns:
+            Hex digest identifying the stage output.
+        """
+        inputs = {field: state.get(field) for field in STAGE_INPUTS[stage]}
+        payload = json.dumps([stage, inputs, stage_config(stage)], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_forced(self, stage: str) -> bool:
+        """Whether a stage has to run even if its output is cached.
+
+        Args:
+            stage: Workflow stage name.
+
+        Returns:
+            True if the stage is at or after from_stage.
+        """
+        if self.from_stage is None:
+            return False
+        return STAGES.index(stage) >= STAGES.index(self.from_stage)
+
+    def _entry_dir(self, stage: str, key: str) -> str:
+        return os.path.join(self.cache_dir, stage, key)
+
+    def load(self, stage: str, key: str, session_dir: str) -> Optional[Dict[str, Any]]:
+        """Load a cached stage output and restore its files into the session.
+
+        Args:
+            stage: Workflow stage name.
+            key: Cache key from make_key.
+            session_dir: Session directory to restore the stage's files into.
+
+        Returns:
+            The cached state update, or None if the stage is not cached.
+        """
+        entry_dir = self._entry_dir(stage, key)
+        try:
+            with open(os.path.join(entry_dir, "output.json"), "r") as f:
+                update = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        files_dir = os.path.join(entry_dir, "files")
+        if os.path.isdir(files_dir):
+            shutil.copytree(files_dir, session_dir, dirs_exist_ok=True)
+        return update
+
+    def save(self, stage: str, key: str, update: Dict[str, Any], session_dir: str) -> None:
+        """Store a stage output together with the files it wrote.
+
+        The entry is written to a temporary directory and moved into place, so
+        an interrupted run never leaves a partial entry behind.
+
+        Args:
+            stage: Workflow stage name.
+            key: Cache key from make_key.
+            update: State update the stage returned.
+            session_dir: Session directory the stage wrote its files to.
+        """
+        stage_dir = os.path.join(self.cache_dir, stage)
+        os.makedirs(stage_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=stage_dir, prefix=".tmp-")
+        try:
+            with open(os.path.join(tmp_dir, "output.json"), "w") as f:
+                json.dump(update, f, default=str)
+            for relative_dir in STAGE_OUTPUT_DIRS[stage]:
+                source_dir = os.path.join(session_dir, relative_dir)
+                if os.path.isdir(source_dir):
+                    shutil.copytree(
+                        source_dir,
+                        os.path.join(tmp_dir, "files", relative_dir),
+                        dirs_exist_ok=True,
+                    )
+
+            entry_dir = self._entry_dir(stage, key)
+            if os.path.isdir(entry_dir):
+                shutil.rmtree(entry_dir)
+            os.replace(tmp_dir, entry_dir)
+        except OSError as e:
+            logger.warning("Could not cache %s output: %s", stage, e)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
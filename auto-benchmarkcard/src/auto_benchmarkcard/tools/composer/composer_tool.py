@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -30,7 +31,7 @@ from langchain_core.documents import Document
 from pydantic import BaseModel, Field
 
 # use the shared llm instance
-from auto_benchmarkcard.config import LLM, Config
+from auto_benchmarkcard.config import Config, get_llm_handler
 
 logger = logging.getLogger(__name__)
 
@@ -259,243 +260,278 @@ def extract_provenance(section_data: Dict[str, Any]) -> tuple[Dict[str, Any], Di
     return clean_data, provenance
 
 
-@tool("compose_benchmark_card")
-def compose_benchmark_card(
+# define the sections to generate
+SECTIONS = [
+    ("benchmark_details", BenchmarkDetails),
+    ("purpose_and_intended_users", PurposeAndIntendedUsers),
+    ("data", DataInfo),
+    ("methodology", Methodology),
+    ("ethical_and_legal_considerations", EthicalAndLegalConsiderations),
+]
+
+# Section-specific query templates for retrieval
+SECTION_QUERIES = {
+    "benchmark_details": "benchmark name overview domains languages similar benchmarks resources",
+    "data": "dataset size format annotation data collection data statistics",
+    "methodology": "evaluation methods metrics calculation baseline results performance",
+    "purpose_and_intended_users": "goal purpose motivation audience tasks limitations",
+    "ethical_and_legal_considerations": "ethics privacy licensing consent compliance regulations",
+}
+
+# Define few-shot examples for each section
+# NOTE: Placeholders like [BENCHMARK_1] are used to prevent the LLM from copying example values
+SECTION_EXAMPLES = {
+    "benchmark_details": {
+        "good_example": {
+            "name": "[BENCHMARK_NAME] - use actual name from sources",
+            "overview": "A comprehensive description extracted from the paper abstract or introduction, explaining what the benchmark evaluates and its key characteristics.",
+            "data_type": "text",
+            "domains": [
+                "[DOMAIN_1] - extract from paper",
+                "[DOMAIN_2] - extract from paper",
+            ],
+            "languages": ["[LANGUAGE] - extract from sources"],
+            "similar_benchmarks": ["[BENCHMARK_1] - ONLY if explicitly mentioned in paper", "[BENCHMARK_2] - otherwise use 'Not specified'"],
+            "resources": [
+                "[URL_1] - use actual URLs from sources",
+                "[URL_2] - use actual URLs from sources",
+            ],
+        },
+        "bad_example": {
+            "name": "prompt_leakage.glue",
+            "overview": "natural language understanding",
+            "data_type": "text",
+            "domains": ["NLP"],
+            "languages": ["en"],
+            "similar_benchmarks": ["D1", "D2"],
+            "resources": ["paper", "dataset"],
+        },
+    },
+    "purpose_and_intended_users": {
+        "good_example": {
+            "goal": "Extract the stated purpose/goal from the paper's introduction or abstract. Describe what the benchmark aims to evaluate or achieve.",
+            "audience": [
+                "[AUDIENCE_1] - extract from paper if mentioned",
+                "[AUDIENCE_2] - otherwise use generic ML/NLP audience",
+            ],
+            "tasks": [
+                "[TASK_1] - list actual tasks from sources",
+                "[TASK_2] - list actual tasks from sources",
+            ],
+            "limitations": "Extract limitations explicitly stated in the paper. If none stated, write 'Not specified'",
+            "out_of_scope_uses": [
+                "[USE_1] - extract from paper if mentioned",
+                "Otherwise write 'Not specified'",
+            ],
+        }
+    },
+    "data": {
+        "good_example": {
+            "source": "Describe data sources as stated in the paper or HuggingFace metadata",
+            "size": "[NUMBER] examples - USE EXACT COUNT FROM SOURCES (e.g., '1.24 GB' from HuggingFace, or 'Not specified' if not found)",
+            "format": "[FORMAT] - extract from HuggingFace (e.g., 'parquet') or paper, otherwise 'Not specified'",
+            "annotation": "Describe annotation process from paper. If not described, write 'Not specified'",
+        },
+        "bad_example": {
+            "source": "various sources",
+            "size": "large dataset",
+            "format": "text",
+            "annotation": "manual annotation",
+        },
+    },
+    "methodology": {
+        "good_example": {
+            "methods": [
+                "[METHOD_1] - extract evaluation methods from paper",
+                "[METHOD_2] - extract evaluation methods from paper",
+            ],
+            "metrics": [
+                "[METRIC_1] - list metrics explicitly mentioned in sources",
+                "[METRIC_2] - list metrics explicitly mentioned in sources",
+            ],
+            "calculation": "Describe how metrics are calculated IF explicitly stated in paper. Otherwise write 'Not specified'",
+            "interpretation": "Describe score interpretation IF stated in paper. Write 'Not specified' if human baseline not mentioned.",
+            "baseline_results": "[MODEL] achieves [SCORE]% - ONLY include if EXACT numbers appear in paper. Otherwise write 'Not specified'",
+            "validation": "Describe validation approach from paper. If not described, write 'Not specified'",
+        }
+    },
+}
+
+MAX_RETRIES = 3
+
+
+def format_metadata(
     unitxt_metadata: Dict[str, Any],
-    hf_metadata: Optional[Dict[str, Any]] = None,
-    extracted_ids: Optional[Dict[str, Any]] = None,
-    docling_output: Optional[Dict[str, Any]] = None,
-    query: str = "",
-) -> Dict[str, Any]:
-    """Compose a benchmark card from all the metadata we collected.
+    hf_metadata: Optional[Dict[str, Any]],
+    extracted_ids: Optional[Dict[str, Any]],
+) -> Dict[str, str]:
+    """Format the structured metadata sources for the section prompts.
+
+    The sources are the same for every section and retry, so they are serialized once.
 
     Args:
         unitxt_metadata: Metadata from UnitXT catalog.
         hf_metadata: Optional metadata from HuggingFace.
         extracted_ids: Optional extracted identifier information.
+
+    Returns:
+        Dictionary with the formatted hf_metadata, unitxt_metadata and extracted_ids.
+    """
+    hf_formatted = "Not available"
+    if hf_metadata:
+        if isinstance(hf_metadata, dict):
+            # Extract most relevant parts from HF metadata
+            hf_parts = []
+            if "card_data" in hf_metadata and hf_metadata["card_data"]:
+                hf_parts.append(f"Card Data:\n{json.dumps(hf_metadata['card_data'], indent=2)}")
+            if "dataset_info" in hf_metadata and hf_metadata["dataset_info"]:
+                hf_parts.append(f"Dataset Info:\n{json.dumps(hf_metadata['dataset_info'], indent=2)}")
+            if hf_parts:
+                hf_formatted = "\n\n".join(hf_parts)
+            else:
+                hf_formatted = json.dumps(hf_metadata, indent=2)
+        else:
+            hf_formatted = str(hf_metadata)
+
+    return {
+        "hf_metadata": hf_formatted,
+        "unitxt_metadata": json.dumps(unitxt_metadata, indent=2) if unitxt_metadata else "Not available",
+        "extracted_ids": json.dumps(extracted_ids, indent=2) if extracted_ids else "Not available",
+    }
+
+
+def build_paper_retriever(docling_output: Optional[Dict[str, Any]]):
+    """Index the paper for RAG-lite (index once, retrieve per section).
+
+    Args:
         docling_output: Optional extracted paper content.
-        query: Original query string for context.
 
     Returns:
-        Dictionary containing composed benchmark card and composition metadata.
+        Retriever over the paper chunks, or None if there is no paper or indexing failed.
     """
+    if not (docling_output and docling_output.get("success")):
+        return None
+    try:
+        paper_text = docling_output.get("filtered_text", "")
+        if not paper_text:
+            return None
+        logger.debug("Initializing paper retriever for RAG-lite")
+        # Initialize embeddings based on config
+        if Config.DEFAULT_EMBEDDING_MODEL == "bge-large":
+            embeddings = HuggingFaceEmbeddings(
+                model_name="BAAI/bge-large-en-v1.5",
+                model_kwargs={"device": "cpu"},
+                encode_kwargs={"normalize_embeddings": True},
+            )
+        elif Config.DEFAULT_EMBEDDING_MODEL == "e5-large":
+            embeddings = HuggingFaceEmbeddings(
+                model_name="intfloat/e5-large-v2",
+                model_kwargs={"device": "cpu"},
+                encode_kwargs={"normalize_embeddings": True},
+            )
+        else:  # minilm fallback
+            embeddings = HuggingFaceEmbeddings(
+                model_name="sentence-transformers/all-MiniLM-L6-v2"
+            )
+
+        # Chunk paper for retrieval (smaller chunks for better precision)
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=1000,
+            chunk_overlap=200,
+            separators=["\n\n", "\n", ". ", " "]
+        )
+        chunks = splitter.split_text(paper_text)
+
+        # Create documents
+        documents = [
+            Document(page_content=chunk, metadata={"chunk_idx": i})
+            for i, chunk in enumerate(chunks)
+        ]
+
+        # Create vectorstore and retriever
+        paper_vectorstore = Chroma.from_documents(documents, embeddings)
+        logger.debug(f"Paper indexed: {len(chunks)} chunks ready for retrieval")
+        return paper_vectorstore.as_retriever(search_kwargs={"k": 3})
+    except Exception as e:
+        logger.warning(f"Failed to initialize paper retriever: {e}")
+        return None
 
-    logger.debug(f"Composing benchmark card for: {query}")
 
-    # Log available data sources
-    data_sources = []
-    if unitxt_metadata:
-        data_sources.append("UnitXT")
-    if hf_metadata:
-        data_sources.append("HuggingFace")
-    if extracted_ids:
-        data_sources.append("Extracted IDs")
-    if docling_output and docling_output.get("success"):
-        data_sources.append("Academic Paper")
+def retrieve_paper_content(
+    section_name: str, paper_retriever, docling_output: Optional[Dict[str, Any]]
+) -> str:
+    """Retrieve the paper chunks relevant to a section using RAG-lite.
 
-    logger.debug(f"Available data sources: {', '.join(data_sources)}")
+    Args:
+        section_name: Name of the card section.
+        paper_retriever: Retriever from build_paper_retriever, or None.
+        docling_output: Optional extracted paper content, used as fallback.
 
-    # Initialize paper retriever for RAG-lite (index once, retrieve per section)
-    paper_retriever = None
-    if docling_output and docling_output.get("success"):
+    Returns:
+        Paper content for the section prompt.
+    """
+    paper_content = "Not available"
+    if paper_retriever:
         try:
-            paper_text = docling_output.get("filtered_text", "")
-            if paper_text:
-                logger.debug("Initializing paper retriever for RAG-lite")
-                # Initialize embeddings based on config
-                if Config.DEFAULT_EMBEDDING_MODEL == "bge-large":
-                    embeddings = HuggingFaceEmbeddings(
-                        model_name="BAAI/bge-large-en-v1.5",
-                        model_kwargs={"device": "cpu"},
-                        encode_kwargs={"normalize_embeddings": True},
-                    )
-                elif Config.DEFAULT_EMBEDDING_MODEL == "e5-large":
-                    embeddings = HuggingFaceEmbeddings(
-                        model_name="intfloat/e5-large-v2",
-                        model_kwargs={"device": "cpu"},
-                        encode_kwargs={"normalize_embeddings": True},
-                    )
-                else:  # minilm fallback
-                    embeddings = HuggingFaceEmbeddings(
-                        model_name="sentence-transformers/all-MiniLM-L6-v2"
-                    )
-
-                # Chunk paper for retrieval (smaller chunks for better precision)
-                splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=1000,
-                    chunk_overlap=200,
-                    separators=["\n\n", "\n", ". ", " "]
-                )
-                chunks = splitter.split_text(paper_text)
-
-                # Create documents
-                documents = [
-                    Document(page_content=chunk, metadata={"chunk_idx": i})
-                    for i, chunk in enumerate(chunks)
-                ]
-
-                # Create vectorstore and retriever
-                paper_vectorstore = Chroma.from_documents(documents, embeddings)
-                paper_retriever = paper_vectorstore.as_retriever(search_kwargs={"k": 3})
-                logger.debug(f"Paper indexed: {len(chunks)} chunks ready for retrieval")
+            section_query = SECTION_QUERIES.get(section_name, section_name.replace("_", " "))
+            relevant_chunks = paper_retriever.get_relevant_documents(section_query)
+
+            if relevant_chunks:
+                formatted_chunks = []
+                for i, chunk in enumerate(relevant_chunks, 1):
+                    formatted_chunks.append(f"[Relevant Paper Section {i}]\n{chunk.page_content}")
+                paper_content = "\n\n".join(formatted_chunks)
+                logger.debug(f"Retrieved {len(relevant_chunks)} paper chunks for {section_name}")
+            else:
+                logger.debug(f"No relevant chunks found for {section_name}, using fallback")
+                # Fallback: use first 2000 chars if retrieval fails
+                if docling_output and docling_output.get("filtered_text"):
+                    paper_content = docling_output.get("filtered_text", "")[:2000]
         except Exception as e:
-            logger.warning(f"Failed to initialize paper retriever: {e}")
-            paper_retriever = None
-
-    # define the sections to generate
-    sections = [
-        ("benchmark_details", BenchmarkDetails),
-        ("purpose_and_intended_users", PurposeAndIntendedUsers),
-        ("data", DataInfo),
-        ("methodology", Methodology),
-        ("ethical_and_legal_considerations", EthicalAndLegalConsiderations),
-    ]
-
-    # Section-specific query templates for retrieval
-    section_queries = {
-        "benchmark_details": "benchmark name overview domains languages similar benchmarks resources",
-        "data": "dataset size format annotation data collection data statistics",
-        "methodology": "evaluation methods metrics calculation baseline results performance",
-        "purpose_and_intended_users": "goal purpose motivation audience tasks limitations",
-        "ethical_and_legal_considerations": "ethics privacy licensing consent compliance regulations",
-    }
+            logger.warning(f"Paper retrieval failed for {section_name}: {e}")
+            # Fallback: use first 2000 chars
+            if docling_output and docling_output.get("filtered_text"):
+                paper_content = docling_output.get("filtered_text", "")[:2000]
+    elif docling_output and docling_output.get("success"):
+        # No retriever available, use first 2000 chars as fallback
+        paper_content = docling_output.get("filtered_text", "Not available")[:2000]
+    return paper_content
 
-    generated_sections = {}
-    all_provenance = {}  # Track provenance for all sections
 
-    for section_name, section_class in sections:
-        logger.debug("Generating %s", section_name.replace("_", " ").title())
-
-        # Retrieve relevant paper chunks for this section using RAG-lite
-        paper_content = "Not available"
-        if paper_retriever:
-            try:
-                query = section_queries.get(section_name, section_name.replace("_", " "))
-                relevant_chunks = paper_retriever.get_relevant_documents(query)
-
-                if relevant_chunks:
-                    formatted_chunks = []
-                    for i, chunk in enumerate(relevant_chunks, 1):
-                        formatted_chunks.append(f"[Relevant Paper Section {i}]\n{chunk.page_content}")
-                    paper_content = "\n\n".join(formatted_chunks)
-                    logger.debug(f"Retrieved {len(relevant_chunks)} paper chunks for {section_name}")
-                else:
-                    logger.debug(f"No relevant chunks found for {section_name}, using fallback")
-                    # Fallback: use first 2000 chars if retrieval fails
-                    if docling_output and docling_output.get("filtered_text"):
-                        paper_content = docling_output.get("filtered_text", "")[:2000]
-            except Exception as e:
-                logger.warning(f"Paper retrieval failed for {section_name}: {e}")
-                # Fallback: use first 2000 chars
-                if docling_output and docling_output.get("filtered_text"):
-                    paper_content = docling_output.get("filtered_text", "")[:2000]
-        elif docling_output and docling_output.get("success"):
-            # No retriever available, use first 2000 chars as fallback
-            paper_content = docling_output.get("filtered_text", "Not available")[:2000]
-
-        # Define few-shot examples for each section
-        # NOTE: Placeholders like [BENCHMARK_1] are used to prevent the LLM from copying example values
-        few_shot_examples = {
-            "benchmark_details": {
-                "good_example": {
-                    "name": "[BENCHMARK_NAME] - use actual name from sources",
-                    "overview": "A comprehensive description extracted from the paper abstract or introduction, explaining what the benchmark evaluates and its key characteristics.",
-                    "data_type": "text",
-                    "domains": [
-                        "[DOMAIN_1] - extract from paper",
-                        "[DOMAIN_2] - extract from paper",
-                    ],
-                    "languages": ["[LANGUAGE] - extract from sources"],
-                    "similar_benchmarks": ["[BENCHMARK_1] - ONLY if explicitly mentioned in paper", "[BENCHMARK_2] - otherwise use 'Not specified'"],
-                    "resources": [
-                        "[URL_1] - use actual URLs from sources",
-                        "[URL_2] - use actual URLs from sources",
-                    ],
-                },
-                "bad_example": {
-                    "name": "prompt_leakage.glue",
-                    "overview": "natural language understanding",
-                    "data_type": "text",
-                    "domains": ["NLP"],
-                    "languages": ["en"],
-                    "similar_benchmarks": ["D1", "D2"],
-                    "resources": ["paper", "dataset"],
-                },
-            },
-            "purpose_and_intended_users": {
-                "good_example": {
-                    "goal": "Extract the stated purpose/goal from the paper's introduction or abstract. Describe what the benchmark aims to evaluate or achieve.",
-                    "audience": [
-                        "[AUDIENCE_1] - extract from paper if mentioned",
-                        "[AUDIENCE_2] - otherwise use generic ML/NLP audience",
-                    ],
-                    "tasks": [
-                        "[TASK_1] - list actual tasks from sources",
-                        "[TASK_2] - list actual tasks from sources",
-                    ],
-                    "limitations": "Extract limitations explicitly stated in the paper. If none stated, write 'Not specified'",
-                    "out_of_scope_uses": [
-                        "[USE_1] - extract from paper if mentioned",
-                        "Otherwise write 'Not specified'",
-                    ],
-                }
-            },
-            "data": {
-                "good_example": {
-                    "source": "Describe data sources as stated in the paper or HuggingFace metadata",
-                    "size": "[NUMBER] examples - USE EXACT COUNT FROM SOURCES (e.g., '1.24 GB' from HuggingFace, or 'Not specified' if not found)",
-                    "format": "[FORMAT] - extract from HuggingFace (e.g., 'parquet') or paper, otherwise 'Not specified'",
-                    "annotation": "Describe annotation process from paper. If not described, write 'Not specified'",
-                },
-                "bad_example": {
-                    "source": "various sources",
-                    "size": "large dataset",
-                    "format": "text",
-                    "annotation": "manual annotation",
-                },
-            },
-            "methodology": {
-                "good_example": {
-                    "methods": [
-                        "[METHOD_1] - extract evaluation methods from paper",
-                        "[METHOD_2] - extract evaluation methods from paper",
-                    ],
-                    "metrics": [
-                        "[METRIC_1] - list metrics explicitly mentioned in sources",
-                        "[METRIC_2] - list metrics explicitly mentioned in sources",
-                    ],
-                    "calculation": "Describe how metrics are calculated IF explicitly stated in paper. Otherwise write 'Not specified'",
-                    "interpretation": "Describe score interpretation IF stated in paper. Write 'Not specified' if human baseline not mentioned.",
-                    "baseline_results": "[MODEL] achieves [SCORE]% - ONLY include if EXACT numbers appear in paper. Otherwise write 'Not specified'",
-                    "validation": "Describe validation approach from paper. If not described, write 'Not specified'",
-                }
-            },
-        }
+def build_section_prompt(section_name: str, section_class: type) -> ChatPromptTemplate:
+    """Build the section-specific prompt with its few-shot examples.
+
+    Args:
+        section_name: Name of the card section.
+        section_class: Pydantic model of the section.
 
-        section_example = few_shot_examples.get(section_name, {})
-        example_text = ""
-        if section_example:
-            if "good_example" in section_example:
-                good_json = (
-                    json.dumps(section_example["good_example"], indent=2)
-                    .replace("{", "{{")
-                    .replace("}", "}}")
-                )
-                example_text += f"\n\nGOOD EXAMPLE:\n{good_json}"
-            if "bad_example" in section_example:
-                bad_json = (
-                    json.dumps(section_example["bad_example"], indent=2)
-                    .replace("{", "{{")
-                    .replace("}", "}}")
-                )
-                example_text += f"\n\nBAD EXAMPLE (avoid this):\n{bad_json}"
-
-        # set up section-specific prompt with enhanced instructions and priority order
-        section_prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    f"""You are an AI evaluation researcher. Generate a {section_class.__name__} object for the '{section_name}' section.
+    Returns:
+        Prompt template taking query, paper_content and the formatted metadata.
+    """
+    section_example = SECTION_EXAMPLES.get(section_name, {})
+    example_text = ""
+    if section_example:
+        if "good_example" in section_example:
+            good_json = (
+                json.dumps(section_example["good_example"], indent=2)
+                .replace("{", "{{")
+                .replace("}", "}}")
+            )
+            example_text += f"\n\nGOOD EXAMPLE:\n{good_json}"
+        if "bad_example" in section_example:
+            bad_json = (
+                json.dumps(section_example["bad_example"], indent=2)
+                .replace("{", "{{")
+                .replace("}", "}}")
+            )
+            example_text += f"\n\nBAD EXAMPLE (avoid this):\n{bad_json}"
+
+    # set up section-specific prompt with enhanced instructions and priority order
+    return ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                f"""You are an AI evaluation researcher. Generate a {section_class.__name__} object for the '{section_name}' section.
 
 CRITICAL RULES:
 1. Use ONLY information from the provided metadata sources
@@ -544,10 +580,10 @@ Example: If you set size to "1.24 GB" from HuggingFace, include:
 - Omit fields set to "Not specified" from provenance
 
 {example_text}""",
-                ),
-                (
-                    "user",
-                    f"""Query: {{query}}
+            ),
+            (
+                "user",
+                f"""Query: {{query}}
 
 METADATA SOURCES (in priority order):
 1. PAPER CONTENT (highest priority - use this first):
@@ -569,81 +605,131 @@ INSTRUCTIONS:
 - If a field cannot be found in ANY source, use "Not specified"
 
 Generate {section_name} section using ONLY the metadata above.""",
-                ),
-            ]
-        )
+            ),
+        ]
+    )
+
+
+def generate_section(
+    section_name: str, section_class: type, prompt_inputs: Dict[str, str]
+) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """Generate one card section with a structured LLM call, retrying on failure.
+
+    Args:
+        section_name: Name of the card section.
+        section_class: Pydantic model of the section.
+        prompt_inputs: Query, paper content and formatted metadata for the prompt.
+
+    Returns:
+        Tuple of (section data without provenance, provenance data).
+
+    Raises:
+        Exception: The last error if all attempts failed.
+    """
+    logger.debug("Generating %s", section_name.replace("_", " ").title())
+
+    # configure for structured output and create the chain
+    structured_llm = get_llm_handler().with_structured_output(section_class)
+    chain = build_section_prompt(section_name, section_class) | structured_llm
+
+    # Retry logic for robust generation
+    for attempt in range(MAX_RETRIES):
+        try:
+            section_result = chain.invoke(prompt_inputs)
+
+            # Extract provenance from section data
+            clean_section, section_provenance = extract_provenance(section_result.model_dump())
+
+            logger.debug("%s completed", section_name.replace("_", " ").title())
+            logger.debug("Preview: %s", str(clean_section)[:100] + "...")
+            return clean_section, section_provenance
+
+        except Exception as e:
+            attempt_msg = f"(attempt {attempt + 1}/{MAX_RETRIES})"
+            if attempt < MAX_RETRIES - 1:
+                logger.warning("Failed to generate %s %s: %s", section_name, attempt_msg, e)
+                logger.debug("Retrying %s", section_name)
+                continue
+            logger.error(
+                "Failed to generate %s after %d attempts: %s",
+                section_name,
+                MAX_RETRIES,
+                e,
+            )
+            raise
+
+
+@tool("compose_benchmark_card")
+def compose_benchmark_card(
+    unitxt_metadata: Dict[str, Any],
+    hf_metadata: Optional[Dict[str, Any]] = None,
+    extracted_ids: Optional[Dict[str, Any]] = None,
+    docling_output: Optional[Dict[str, Any]] = None,
+    query: str = "",
+) -> Dict[str, Any]:
+    """Compose a benchmark card from all the metadata we collected.
+
+    Args:
+        unitxt_metadata: Metadata from UnitXT catalog.
+        hf_metadata: Optional metadata from HuggingFace.
+        extracted_ids: Optional extracted identifier information.
+        docling_output: Optional extracted paper content.
+        query: Original query string for context.
+
+    Returns:
+        Dictionary containing composed benchmark card and composition metadata.
+    """
+
+    logger.debug(f"Composing benchmark card for: {query}")
 
-        # configure for structured output
-        llm_with_structure = LLM.with_structured_output(section_class)
-
-        # create and run the chain
-        chain = section_prompt | llm_with_structure
-
-        # Retry logic for robust generation
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Format metadata for prompt (JSON for structured sources)
-                hf_formatted = "Not available"
-                if hf_metadata:
-                    if isinstance(hf_metadata, dict):
-                        # Extract most relevant parts from HF metadata
-                        hf_parts = []
-                        if "card_data" in hf_metadata and hf_metadata["card_data"]:
-                            hf_parts.append(f"Card Data:\n{json.dumps(hf_metadata['card_data'], indent=2)}")
-                        if "dataset_info" in hf_metadata and hf_metadata["dataset_info"]:
-                            hf_parts.append(f"Dataset Info:\n{json.dumps(hf_metadata['dataset_info'], indent=2)}")
-                        if hf_parts:
-                            hf_formatted = "\n\n".join(hf_parts)
-                        else:
-                            hf_formatted = json.dumps(hf_metadata, indent=2)
-                    else:
-                        hf_formatted = str(hf_metadata)
-
-                unitxt_formatted = json.dumps(unitxt_metadata, indent=2) if unitxt_metadata else "Not available"
-                extracted_formatted = json.dumps(extracted_ids, indent=2) if extracted_ids else "Not available"
-
-                section_result = chain.invoke(
-                    {
-                        "query": query,
-                        "paper_content": paper_content,
-                        "hf_metadata": hf_formatted,
-                        "unitxt_metadata": unitxt_formatted,
-                        "extracted_ids": extracted_formatted,
-                    }
-                )
-
-                # Extract provenance from section data
-                section_dict = section_result.model_dump()
-                clean_section, section_provenance = extract_provenance(section_dict)
-                generated_sections[section_name] = clean_section
-                if section_provenance:
-                    all_provenance[section_name] = section_provenance
-
-                logger.debug("%s completed", section_name.replace("_", " ").title())
-                logger.debug("Preview: %s", str(clean_section)[:100] + "...")
-                break  # Success, exit retry loop
-
-            except Exception as e:
-                attempt_msg = f"(attempt {attempt + 1}/{max_retries})"
-                if attempt < max_retries - 1:
-                    logger.warning("Failed to generate %s %s: %s", section_name, attempt_msg, e)
-                    logger.debug("Retrying %s", section_name)
-                    continue
-                else:
-                    logger.error(
-                        "Failed to compose %s section after %d attempts: %s",
-                        section_name,
-                        max_retries,
-                        e,
-                    )
-                    logger.error(
-                        "Failed to generate %s after %d attempts: %s",
-                        section_name,
-                        max_retries,
-                        e,
-                    )
-                    raise
+    # Log available data sources
+    data_sources = []
+    if unitxt_metadata:
+        data_sources.append("UnitXT")
+    if hf_metadata:
+        data_sources.append("HuggingFace")
+    if extracted_ids:
+        data_sources.append("Extracted IDs")
+    if docling_output and docling_output.get("success"):
+        data_sources.append("Academic Paper")
+
+    logger.debug(f"Available data sources: {', '.join(data_sources)}")
+
+    paper_retriever = build_paper_retriever(docling_output)
+
+    # metadata is formatted once and paper chunks retrieved up front, the LLM calls run in parallel
+    metadata_inputs = format_metadata(unitxt_metadata, hf_metadata, extracted_ids)
+    section_inputs = {
+        section_name: {
+            "query": query,
+            "paper_content": retrieve_paper_content(section_name, paper_retriever, docling_output),
+            **metadata_inputs,
+        }
+        for section_name, _ in SECTIONS
+    }
+
+    generated_sections = {}
+    all_provenance = {}  # Track provenance for all sections
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(Config.COMPOSER_MAX_WORKERS, len(SECTIONS))),
+        thread_name_prefix="composer",
+    )
+    try:
+        futures = {
+            section_name: executor.submit(
+                generate_section, section_name, section_class, section_inputs[section_name]
+            )
+            for section_name, section_class in SECTIONS
+        }
+        for section_name, future in futures.items():
+            clean_section, section_provenance = future.result()
+            generated_sections[section_name] = clean_section
+            if section_provenance:
+                all_provenance[section_name] = section_provenance
+    finally:
+        # a failed section fails the card, so sections not yet started are dropped
+        executor.shutdown(wait=True, cancel_futures=True)
 
     # combine all sections into final benchmark card
     logger.debug("Combining all sections into final benchmark card")
@@ -689,6 +775,6 @@ Generate {section_name} section using ONLY the metadata above.""",
             "query": query,
             "composition_timestamp": datetime.now().isoformat(),
             "generation_method": "chunked_sections",
-            "model_used": LLM.model_name,
+            "model_used": get_llm_handler().model_name,
         },
     }
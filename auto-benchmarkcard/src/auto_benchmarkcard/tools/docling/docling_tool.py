@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import warnings
 from typing import Any, Dict
 from urllib.parse import urlparse
@@ -25,8 +26,15 @@ from docling.document_converter import DocumentConverter
 from langchain.tools import tool
 from pydantic import BaseModel, Field
 
+from auto_benchmarkcard.artifact_cache import get_artifact_cache
+
 logger = logging.getLogger(__name__)
 
+# Bump when the cached docling conversion changes for the same document
+DOCLING_CACHE_VERSION = 1
+
+_converter_lock = threading.Lock()
+
 
 class DoclingResult(BaseModel):
     """Result from docling paper extraction.
@@ -83,6 +91,73 @@ def _filter_literature_section(text: str) -> str:
     return filtered_text
 
 
+def get_converter() -> DocumentConverter:
+    """Get or create the shared docling converter (lazy initialization).
+
+    Creating a converter loads its layout and OCR models, so one instance is
+    reused for every paper.
+
+    Returns:
+        DocumentConverter: Converter with default options.
+    """
+    if not hasattr(get_converter, "_instance"):
+        get_converter._instance = DocumentConverter()
+    return get_converter._instance
+
+
+def _convert_paper(paper_url: str) -> Dict[str, Any]:
+    """Convert a paper to markdown, reusing cached downloads and conversions.
+
+    The raw document is cached by URL and the conversion by URL plus document
+    content hash, so an unchanged paper is converted only once.
+
+    Args:
+        paper_url: URL of the paper document.
+
+    Returns:
+        Dictionary with the markdown 'text', document 'title' and 'num_pages'.
+    """
+    cache = get_artifact_cache()
+    document_path, sha256 = cache.fetch_url(paper_url)
+
+    cache_key = f"{DOCLING_CACHE_VERSION}:{paper_url}#{sha256}"
+    cached = cache.get("docling", cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached docling conversion of {paper_url}")
+        return cached
+
+    # docling converters are not safe to share between threads
+    with _converter_lock:
+        result = get_converter().convert(document_path)
+
+    # Extract text content
+    text_content = result.document.export_to_markdown()
+
+    # Extract title from document content (look for ## heading)
+    title = "Unknown"
+    if text_content:
+        lines = text_content.strip().split("\n")
+        for line in lines:
+            line = line.strip()
+            if line.startswith("## "):
+                title = line[3:].strip()
+                break
+
+    # Try to get title from document object as fallback
+    if title == "Unknown":
+        title = getattr(result.document, "title", "Unknown")
+
+    return cache.put(
+        "docling",
+        cache_key,
+        {
+            "text": text_content,
+            "title": title,
+            "num_pages": (len(result.document.pages) if hasattr(result.document, "pages") else 0),
+        },
+    )
+
+
 @tool("extract_paper_with_docling")
 def extract_paper_with_docling(paper_url: str) -> Dict[str, Any]:
     """Extract paper content using docling from a given URL.
@@ -115,33 +190,14 @@ def extract_paper_with_docling(paper_url: str) -> Dict[str, Any]:
 
         logger.debug(f"Extracting paper from URL: {paper_url}")
 
-        # Create document converter with default options
-        converter = DocumentConverter()
-
-        # Convert the document
-        result = converter.convert(paper_url)
-
-        # Extract text content
-        text_content = result.document.export_to_markdown()
-
-        # Extract title from document content (look for ## heading)
-        title = "Unknown"
-        if text_content:
-            lines = text_content.strip().split("\n")
-            for line in lines:
-                line = line.strip()
-                if line.startswith("## "):
-                    title = line[3:].strip()
-                    break
-
-        # Try to get title from document object as fallback
-        if title == "Unknown":
-            title = getattr(result.document, "title", "Unknown")
+        # Download and convert the document, or load them from the artifact cache
+        conversion = _convert_paper(paper_url)
+        text_content = conversion["text"]
 
         # Get document metadata
         metadata = {
-            "title": title,
-            "num_pages": (len(result.document.pages) if hasattr(result.document, "pages") else 0),
+            "title": conversion["title"],
+            "num_pages": conversion["num_pages"],
             "source_url": paper_url,
             "extraction_method": "docling",
         }
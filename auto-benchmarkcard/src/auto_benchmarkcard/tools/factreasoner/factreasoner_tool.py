@@ -3,12 +3,10 @@ import json
 import logging
 import math
 import os
-from typing import Any, Dict, List, Optional
-
-import matplotlib
-
-matplotlib.use("Agg")  # Use non-interactive backend
-import os
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 
 # Suppress noisy logging from external libraries
 logging.getLogger("httpx").setLevel(logging.ERROR)
@@ -27,28 +25,79 @@ logging.getLogger("AtomReviser").setLevel(logging.WARNING)
 logging.getLogger("NLIExtractor").setLevel(logging.WARNING)
 logging.getLogger("FactReasoner").setLevel(logging.WARNING)
 
-import matplotlib.pyplot as plt
+import numpy as np
 
-import fact_reasoner.fact_utils as fact_utils
-from fact_reasoner.atom_extractor import AtomExtractor
-from fact_reasoner.atom_reviser import AtomReviser
-from fact_reasoner.context_retriever import ContextRetriever
-from fact_reasoner.fact_graph import FactGraph
-from fact_reasoner.fact_utils import Relation
-from fact_reasoner.factreasoner import FactReasoner
-from fact_reasoner.nli_extractor import NLIExtractor
+from auto_benchmarkcard.tools.factreasoner.nli_cache import NLICache
 
 logger = logging.getLogger(__name__)
 
 
+class BatchedNLIScorer:
+    """Runs NLI over (premise, hypothesis) pairs in fixed-size batches backed by an NLICache.
+
+    Attributes:
+        nli_extractor: NLIExtractor making the predictions.
+        cache: Persistent cache of NLI predictions.
+        model_key: Model and prompt version the predictions are cached under.
+        batch_size: Number of pairs sent to the NLI model at once.
+        pipeline: FactReasoner pipeline being built, used to resolve context and atom IDs.
+        pairs_scored: Pairs scored since the last reset_stats().
+        nli_calls: Pairs sent to the NLI model since the last reset_stats().
+    """
+
+    def __init__(self, nli_extractor, cache: NLICache, model_key: str, batch_size: int):
+        self.nli_extractor = nli_extractor
+        self.cache = cache
+        self.model_key = model_key
+        self.batch_size = batch_size
+        self.pipeline = None
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.pairs_scored = 0
+        self.nli_calls = 0
+
+    def score(self, premises: List[str], hypotheses: List[str]) -> List[Dict[str, Any]]:
+        """Predict the NLI relation of every (premise, hypothesis) pair.
+
+        Args:
+            premises: Context texts.
+            hypotheses: Atom texts.
+
+        Returns:
+            NLI prediction for every pair, in order.
+        """
+        pairs = list(zip(premises, hypotheses))
+        unique_pairs = list(dict.fromkeys(pairs))
+        results = dict(zip(unique_pairs, self.cache.get_many(self.model_key, unique_pairs)))
+
+        missing = [pair for pair, result in results.items() if result is None]
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            batch_results = self.nli_extractor.runall(
+                [premise for premise, _ in batch], [hypothesis for _, hypothesis in batch]
+            )
+            self.cache.put_many(self.model_key, batch, batch_results)
+            results.update(zip(batch, batch_results))
+
+        self.pairs_scored += len(pairs)
+        self.nli_calls += len(missing)
+        return [results[pair] for pair in pairs]
+
+
+# Batched scorers of the factuality services, by id of their NLIExtractor
+_NLI_SCORERS: Dict[int, BatchedNLIScorer] = {}
+
+
 def fixed_predict_nli_relationships(
     object_pairs, nli_extractor, links_type="context_atom", text_only=True
 ):
     """Fix for the original predict_nli_relationships function.
 
-    The original FactReasoner function was passing context IDs (like "c_a0_0")
+    The original FactReasoner function was passing context IDs (like "c_3f2a9b1c0d4e5f60")
     instead of actual text to the NLI model, causing comparison failures. This
-    fix resolves IDs to actual objects and extracts their text content.
+    fix resolves IDs to actual objects through the pipeline of the factuality service
+    owning the NLI extractor, and scores the texts with its batched, cached scorer.
 
     Args:
         object_pairs: List of (context, atom) tuples for NLI comparison
@@ -64,44 +113,34 @@ def fixed_predict_nli_relationships(
     """
     assert nli_extractor is not None, "NLI extractor cannot be None."
 
-    # Find the FactReasoner instance that has our contexts and atoms
-    import inspect
-
-    pipeline = None
-    frame = inspect.currentframe()
+    scorer = _NLI_SCORERS.get(id(nli_extractor))
+    pipeline = scorer.pipeline if scorer else None
 
-    while frame:
-        if "self" in frame.f_locals and hasattr(frame.f_locals["self"], "contexts"):
-            pipeline = frame.f_locals["self"]
-            break
-        frame = frame.f_back
+    # Get text from the contexts (premises) and the atoms (hypotheses)
+    premises = [_get_text_from_object(context, pipeline, "contexts") for context, _ in object_pairs]
+    hypotheses = [_get_text_from_object(atom, pipeline, "atoms") for _, atom in object_pairs]
 
-    premises = []
-    hypotheses = []
-
-    # Process each context-atom pair
-    for pair in object_pairs:
-        # Get text from the context (premise)
-        premise = _get_text_from_object(pair[0], pipeline, "contexts")
-        # Get text from the atom (hypothesis)
-        hypothesis = _get_text_from_object(pair[1], pipeline, "atoms")
-
-        premises.append(premise)
-        hypotheses.append(hypothesis)
-
-    # Run the NLI model with actual text content
-    results = nli_extractor.runall(premises, hypotheses)
+    # Run the NLI model with actual text content, once per distinct (premise, hypothesis) pair
+    if scorer:
+        results = scorer.score(premises, hypotheses)
+    else:
+        unique_pairs = list(dict.fromkeys(zip(premises, hypotheses)))
+        unique_results = nli_extractor.runall(
+            [premise for premise, _ in unique_pairs],
+            [hypothesis for _, hypothesis in unique_pairs],
+        )
+        results_by_pair = dict(zip(unique_pairs, unique_results))
+        results = [results_by_pair[pair] for pair in zip(premises, hypotheses)]
 
     # Create relation objects with proper references
+    from fact_reasoner.fact_utils import Relation
+
     relations = []
-    for i, result in enumerate(results):
+    for (context, atom), result in zip(object_pairs, results):
         # Make sure we pass actual objects (not IDs) to the Relation constructor
-        source_obj = _get_actual_object(object_pairs[i][0], pipeline, "contexts")
-        target_obj = _get_actual_object(object_pairs[i][1], pipeline, "atoms")
-
         relation = Relation(
-            source=source_obj,
-            target=target_obj,
+            source=_get_actual_object(context, pipeline, "contexts"),
+            target=_get_actual_object(atom, pipeline, "atoms"),
             type=result["label"],
             probability=result["probability"],
             link=links_type or "unknown",
@@ -123,7 +162,7 @@ def _get_text_from_object(obj, pipeline, collection_name):
         Text content as string
     """
     if isinstance(obj, str) and pipeline:
-        # It's an ID like "c_a0_0" - look up the actual object
+        # It's an ID like "c_3f2a9b1c0d4e5f60" - look up the actual object
         collection = getattr(pipeline, collection_name, {})
         if obj in collection:
             real_obj = collection[obj]
@@ -156,56 +195,90 @@ def _get_actual_object(obj, pipeline, collection_name):
     return obj
 
 
-# Apply the fix by replacing the original function
-fact_utils.predict_nli_relationships = fixed_predict_nli_relationships
+@lru_cache(maxsize=None)
+def _load_fact_reasoner():
+    """Import the FactReasoner stack on first use.
 
+    FactReasoner pulls in matplotlib, LangChain and the NLI models, so it is
+    only imported when a factuality service is built, not when this module is.
+    The fixed NLI prediction is installed at the same time.
 
-def _create_atom_marginal_mappings(
-    formatted_rag_results: Dict[str, Any], marginals: List[Dict[str, Any]]
+    Returns:
+        The fact_reasoner.fact_utils module.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")  # Use non-interactive backend
+
+    import fact_reasoner.fact_utils as fact_utils
+
+    # Apply the fix by replacing the original function
+    fact_utils.predict_nli_relationships = fixed_predict_nli_relationships
+    return fact_utils
+
+
+def build_variable_atom_map(atom_ids: Iterable[str], variables: Iterable[str]) -> Dict[str, str]:
+    """Map FactReasoner variable names to atom IDs.
+
+    FactReasoner names atom variables after the atom IDs. A variable whose name wraps
+    the ID (e.g. "atom_a3") is matched on the ID as a whole token, never as a substring,
+    so "a1" does not match "a10".
+
+    Args:
+        atom_ids: IDs of the atoms in the fact graph
+        variables: Variable names of the marginals
+
+    Returns:
+        Dictionary mapping variable name to atom ID, for the variables of atoms
+    """
+    atom_ids = set(atom_ids)
+    variable_atom_map = {}
+    for variable in variables:
+        if variable in atom_ids:
+            variable_atom_map[variable] = variable
+            continue
+        matches = {token for token in re.split(r"[^A-Za-z0-9]+", variable) if token in atom_ids}
+        if len(matches) == 1:
+            variable_atom_map[variable] = matches.pop()
+    return variable_atom_map
+
+
+def _map_marginals_to_atoms(
+    formatted_rag_results: Dict[str, Any],
+    marginals: List[Dict[str, Any]],
+    variable_atom_map: Optional[Dict[str, str]] = None,
 ) -> tuple[Dict[str, Any], Dict[str, Any]]:
-    """Create mappings from atom ID to atom data and variable name to marginal data.
+    """Create mappings from atom ID to atom data and atom ID to marginal data.
 
     Args:
         formatted_rag_results: RAG output containing atoms list
         marginals: List of marginal probability dictionaries from FactReasoner
+        variable_atom_map: Variable name to atom ID mapping from build_variable_atom_map,
+            built from the atoms and marginals if not given
 
     Returns:
-        Tuple of (atoms_by_id dict, marginals_by_var dict)
+        Tuple of (atoms_by_id dict, marginals_by_atom dict)
     """
     # Create mapping from atom ID to atom data
-    atoms_by_id = {}
-    for atom in formatted_rag_results.get("atoms", []):
-        atoms_by_id[atom["id"]] = atom
-
-    # Create mapping from variable name to marginal data
-    marginals_by_var = {}
-    for marginal in marginals:
-        var_name = marginal.get("variable", "")
-        marginals_by_var[var_name] = marginal
-
-    return atoms_by_id, marginals_by_var
+    atoms_by_id = {atom["id"]: atom for atom in formatted_rag_results.get("atoms", [])}
 
+    if variable_atom_map is None:
+        variable_atom_map = build_variable_atom_map(
+            atoms_by_id, (marginal.get("variable", "") for marginal in marginals)
+        )
 
-def _find_marginal_for_atom(
-    atom_id: str, atom_text: str, marginals_by_var: Dict[str, Any]
-) -> Dict[str, Any] | None:
-    """Find the corresponding marginal data for an atom.
+    # Create mapping from atom ID to marginal data, the first marginal of an atom wins
+    marginals_by_atom = {}
+    for marginal in marginals:
+        atom_id = variable_atom_map.get(marginal.get("variable", ""))
+        if atom_id is not None and atom_id not in marginals_by_atom:
+            marginals_by_atom[atom_id] = marginal
 
-    Args:
-        atom_id: Unique atom identifier
-        atom_text: Text content of the atom
-        marginals_by_var: Dictionary mapping variable names to marginal data
+    return atoms_by_id, marginals_by_atom
 
-    Returns:
-        Marginal dictionary if found, None otherwise
-    """
-    # Try to match by atom ID or text similarity
-    for var_name, marginal in marginals_by_var.items():
-        if atom_id in var_name or atom_text[:50] in var_name:
-            return marginal
 
-    # Try exact atom ID match
-    return marginals_by_var.get(atom_id)
+def _p_true(marginal_data: Dict[str, Any]) -> float:
+    return marginal_data.get("p_true", marginal_data.get("probabilities", [0, 0])[1])
 
 
 def _determine_flag_reason(field_stats: Dict[str, Any], threshold: float) -> tuple[bool, str, str]:
@@ -241,73 +314,85 @@ def _determine_flag_reason(field_stats: Dict[str, Any], threshold: float) -> tup
 
 
 def analyze_factuality_by_field(
-    formatted_rag_results: Dict[str, Any], marginals: List[Dict[str, Any]]
+    formatted_rag_results: Dict[str, Any],
+    marginals: List[Dict[str, Any]],
+    variable_atom_map: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """Analyze factuality scores by benchmark card field.
 
     Args:
         formatted_rag_results: RAG results containing atoms with field information.
         marginals: Marginal probabilities for each atom from FactReasoner.
+        variable_atom_map: Optional variable name to atom ID mapping from build_variable_atom_map.
 
     Returns:
         Field-level analysis including error counts and accuracy metrics.
     """
 
-    atoms_by_id, marginals_by_var = _create_atom_marginal_mappings(formatted_rag_results, marginals)
+    atoms_by_id, marginals_by_atom = _map_marginals_to_atoms(
+        formatted_rag_results, marginals, variable_atom_map
+    )
 
-    # Aggregate results by field
+    # Collect the scored atoms per field, in order of first appearance
     field_stats = {}
+    field_positions = {}
+    atom_fields = []
+    probabilities = []
     for atom_id, atom in atoms_by_id.items():
-        field = atom.get("field", "unknown")
-        atom_text = atom.get("text", "")
-
-        # Find corresponding marginal (FactReasoner may use different variable naming)
-        marginal_data = _find_marginal_for_atom(atom_id, atom_text, marginals_by_var)
+        marginal_data = marginals_by_atom.get(atom_id)
+        if not marginal_data:
+            continue
 
-        if marginal_data:
-            p_true = marginal_data.get("p_true", marginal_data.get("probabilities", [0, 0])[1])
-
-            # Initialize field stats if not exists
-            if field not in field_stats:
-                field_stats[field] = {
-                    "total_atoms": 0,
-                    "high_confidence_correct": 0,  # p_true > 0.8
-                    "likely_correct": 0,  # p_true > 0.6
-                    "uncertain": 0,  # 0.4 <= p_true <= 0.6
-                    "likely_incorrect": 0,  # p_true < 0.4
-                    "high_confidence_incorrect": 0,  # p_true < 0.2
-                    "avg_probability": 0,
-                    "probabilities": [],
-                    "atoms": [],
-                }
+        field = atom.get("field", "unknown")
+        p_true = _p_true(marginal_data)
+        if field not in field_stats:
+            field_positions[field] = len(field_positions)
+            field_stats[field] = {
+                "total_atoms": 0,
+                "high_confidence_correct": 0,  # p_true > 0.8
+                "likely_correct": 0,  # p_true > 0.6
+                "uncertain": 0,  # 0.4 <= p_true <= 0.6
+                "likely_incorrect": 0,  # p_true < 0.4
+                "high_confidence_incorrect": 0,  # p_true < 0.2
+                "avg_probability": 0,
+                "probabilities": [],
+                "atoms": [],
+            }
+        atom_fields.append(field_positions[field])
+        probabilities.append(p_true)
+        field_stats[field]["probabilities"].append(p_true)
+        field_stats[field]["atoms"].append(
+            {
+                "id": atom_id,
+                "text": atom.get("text", ""),
+                "p_true": p_true,
+                "variable": marginal_data.get("variable", ""),
+            }
+        )
 
-            # Update field statistics
-            field_stats[field]["total_atoms"] += 1
-            field_stats[field]["probabilities"].append(p_true)
-            field_stats[field]["atoms"].append(
-                {
-                    "id": atom_id,
-                    "text": atom_text,
-                    "p_true": p_true,
-                    "variable": marginal_data.get("variable", ""),
-                }
-            )
+    # Calculate the field statistics in one pass over all scored atoms
+    n_fields = len(field_stats)
+    atom_fields = np.asarray(atom_fields, dtype=np.intp)
+    probabilities = np.asarray(probabilities, dtype=float)
 
-            # Categorize by confidence level
-            if p_true > 0.8:
-                field_stats[field]["high_confidence_correct"] += 1
-            elif p_true > 0.6:
-                field_stats[field]["likely_correct"] += 1
-            elif p_true >= 0.4:
-                field_stats[field]["uncertain"] += 1
-            elif p_true >= 0.2:
-                field_stats[field]["likely_incorrect"] += 1
-            else:
-                field_stats[field]["high_confidence_incorrect"] += 1
+    # confidence level per atom: 0 high confidence correct ... 4 high confidence incorrect
+    levels = np.select(
+        [probabilities > 0.8, probabilities > 0.6, probabilities >= 0.4, probabilities >= 0.2],
+        [0, 1, 2, 3],
+        default=4,
+    )
+    level_counts = np.bincount(atom_fields * 5 + levels, minlength=n_fields * 5).reshape(n_fields, 5)
+    total_atoms = np.bincount(atom_fields, minlength=n_fields)
+
+    # Average probability excluding neutral scores (exactly 0.5)
+    non_neutral = probabilities != 0.5
+    non_neutral_counts = np.bincount(atom_fields[non_neutral], minlength=n_fields)
+    non_neutral_sums = np.bincount(
+        atom_fields[non_neutral], weights=probabilities[non_neutral], minlength=n_fields
+    )
 
-    # Calculate averages and summary statistics
     summary = {
-        "total_fields": len(field_stats),
+        "total_fields": n_fields,
         "fields_with_errors": 0,
         "most_problematic_field": None,
         "most_accurate_field": None,
@@ -315,38 +400,43 @@ def analyze_factuality_by_field(
     }
 
     for field, stats in field_stats.items():
-        if stats["total_atoms"] > 0:
-            # Calculate average probability excluding neutral scores (exactly 0.5)
-            non_neutral_probabilities = [p for p in stats["probabilities"] if p != 0.5]
-
-            if len(non_neutral_probabilities) == 0:
-                # All atoms are neutral (no evidence) - flag for review
-                stats["avg_probability"] = 0.5
-                stats["all_neutral"] = True
-            else:
-                # Average only non-neutral scores (both high support and contradictions)
-                stats["avg_probability"] = sum(non_neutral_probabilities) / len(
-                    non_neutral_probabilities
-                )
-                stats["all_neutral"] = False
+        position = field_positions[field]
+        (
+            stats["high_confidence_correct"],
+            stats["likely_correct"],
+            stats["uncertain"],
+            stats["likely_incorrect"],
+            stats["high_confidence_incorrect"],
+        ) = (int(count) for count in level_counts[position])
+        stats["total_atoms"] = int(total_atoms[position])
+
+        non_neutral_count = int(non_neutral_counts[position])
+        if non_neutral_count == 0:
+            # All atoms are neutral (no evidence) - flag for review
+            stats["avg_probability"] = 0.5
+            stats["all_neutral"] = True
+        else:
+            # Average only non-neutral scores (both high support and contradictions)
+            stats["avg_probability"] = float(non_neutral_sums[position]) / non_neutral_count
+            stats["all_neutral"] = False
 
-            # Store counts for analysis
-            stats["non_neutral_count"] = len(non_neutral_probabilities)
-            stats["neutral_count"] = len(stats["probabilities"]) - len(non_neutral_probabilities)
+        # Store counts for analysis
+        stats["non_neutral_count"] = non_neutral_count
+        stats["neutral_count"] = stats["total_atoms"] - non_neutral_count
 
-            # Calculate accuracy percentage (atoms with p_true > 0.5)
-            accurate_atoms = stats["high_confidence_correct"] + stats["likely_correct"]
-            stats["accuracy_percentage"] = (accurate_atoms / stats["total_atoms"]) * 100
+        # Calculate accuracy percentage (atoms with p_true > 0.5)
+        accurate_atoms = stats["high_confidence_correct"] + stats["likely_correct"]
+        stats["accuracy_percentage"] = (accurate_atoms / stats["total_atoms"]) * 100
 
-            # Calculate error percentage
-            error_atoms = stats["likely_incorrect"] + stats["high_confidence_incorrect"]
-            stats["error_percentage"] = (error_atoms / stats["total_atoms"]) * 100
+        # Calculate error percentage
+        error_atoms = stats["likely_incorrect"] + stats["high_confidence_incorrect"]
+        stats["error_percentage"] = (error_atoms / stats["total_atoms"]) * 100
 
-            # Update summary
-            if error_atoms > 0:
-                summary["fields_with_errors"] += 1
+        # Update summary
+        if error_atoms > 0:
+            summary["fields_with_errors"] += 1
 
-            summary["overall_field_accuracy"][field] = stats["accuracy_percentage"]
+        summary["overall_field_accuracy"][field] = stats["accuracy_percentage"]
 
     # Find most/least accurate fields
     if summary["overall_field_accuracy"]:
@@ -374,15 +464,15 @@ def print_clean_atom_summary(
         formatted_rag_results: RAG results containing atoms.
         marginals: Marginal probabilities for each atom.
     """
-    atoms_by_id, marginals_by_var = _create_atom_marginal_mappings(formatted_rag_results, marginals)
+    atoms_by_id, marginals_by_atom = _map_marginals_to_atoms(formatted_rag_results, marginals)
 
     atom_counter = 1
     for atom_id, atom in atoms_by_id.items():
         atom_text = atom.get("text", "")
-        marginal_data = _find_marginal_for_atom(atom_id, atom_text, marginals_by_var)
+        marginal_data = marginals_by_atom.get(atom_id)
 
         if marginal_data:
-            p_true = marginal_data.get("p_true", marginal_data.get("probabilities", [0, 0])[1])
+            p_true = _p_true(marginal_data)
             print(f"Atom {atom_counter}: {atom_text}, Probability={p_true:.3f}")
         else:
             print(f"Atom {atom_counter}: {atom_text}, Probability=N/A")
@@ -390,19 +480,24 @@ def print_clean_atom_summary(
 
 
 def create_atom_summary(
-    formatted_rag_results: Dict[str, Any], marginals: List[Dict[str, Any]]
+    formatted_rag_results: Dict[str, Any],
+    marginals: List[Dict[str, Any]],
+    variable_atom_map: Optional[Dict[str, str]] = None,
 ) -> List[Dict[str, Any]]:
     """Create a clean summary showing each atom with its field and factuality score.
 
     Args:
         formatted_rag_results: RAG results containing atoms with field information.
         marginals: Marginal probabilities for each atom from FactReasoner.
+        variable_atom_map: Optional variable name to atom ID mapping from build_variable_atom_map.
 
     Returns:
         List of atoms with field labels and scores, sorted by score (lowest first).
     """
 
-    atoms_by_id, marginals_by_var = _create_atom_marginal_mappings(formatted_rag_results, marginals)
+    atoms_by_id, marginals_by_atom = _map_marginals_to_atoms(
+        formatted_rag_results, marginals, variable_atom_map
+    )
 
     atom_summary = []
 
@@ -410,11 +505,11 @@ def create_atom_summary(
         field = atom.get("field", "unknown")
         atom_text = atom.get("text", "")
 
-        # Find corresponding marginal (same logic as analyze_factuality_by_field)
-        marginal_data = _find_marginal_for_atom(atom_id, atom_text, marginals_by_var)
+        # Find corresponding marginal (same mapping as analyze_factuality_by_field)
+        marginal_data = marginals_by_atom.get(atom_id)
 
         if marginal_data:
-            p_true = marginal_data.get("p_true", marginal_data.get("probabilities", [0, 0])[1])
+            p_true = _p_true(marginal_data)
 
             # Determine confidence level
             if p_true > 0.8:
@@ -459,6 +554,216 @@ def create_atom_summary(
     return atom_summary
 
 
+class FactualityService:
+    """Reusable FactReasoner evaluation with components built once per process.
+
+    The context retriever, atom extractor, atom reviser and NLI extractor are shared by
+    all evaluations. Atom-context pairs go to the NLI model in fixed-size batches backed
+    by a persistent NLI cache in cache_dir, so re-evaluating an edited card only runs NLI
+    for the changed atoms and contexts.
+    """
+
+    def __init__(
+        self,
+        model: str = "llama-3.3-70b-instruct",
+        nli_prompt_version: str = "v1",
+        cache_dir: str = "factreasoner_cache",
+        merlin_path: str = "merlin/bin/merlin",
+        use_priors: bool = False,
+        batch_size: Optional[int] = None,
+    ):
+        """Build the FactReasoner components.
+
+        Args:
+            model: Which LLM to use for NLI analysis
+            nli_prompt_version: Which prompt template to use for NLI
+            cache_dir: Where to store temporary files and the NLI cache
+            merlin_path: Path to the Merlin reasoning engine
+            use_priors: Whether to use prior probabilities for atoms/contexts
+            batch_size: Pairs per NLI batch (default Config.NLI_BATCH_SIZE)
+        """
+        # Make sure we have a place to store temp files
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Set up all the components we need
+        _load_fact_reasoner()
+        from fact_reasoner.atom_extractor import AtomExtractor
+        from fact_reasoner.atom_reviser import AtomReviser
+        from fact_reasoner.context_retriever import ContextRetriever
+        from fact_reasoner.nli_extractor import NLIExtractor
+
+        from auto_benchmarkcard.config import Config
+        self.merlin_path = merlin_path
+        self.use_priors = use_priors
+        self.context_retriever = ContextRetriever(service_type="langchain", top_k=Config.DEFAULT_TOP_K, cache_dir=cache_dir)
+        self.atom_extractor = AtomExtractor(model)
+        self.atom_reviser = AtomReviser(model)
+        self.nli_extractor = NLIExtractor(model, prompt_version=nli_prompt_version)
+
+        self.nli_scorer = BatchedNLIScorer(
+            self.nli_extractor,
+            NLICache(os.path.join(cache_dir, "nli_cache.jsonl")),
+            model_key=f"{model}:{nli_prompt_version}",
+            batch_size=batch_size or Config.NLI_BATCH_SIZE,
+        )
+        _NLI_SCORERS[id(self.nli_extractor)] = self.nli_scorer
+
+        # the NLI scorer refers to one pipeline at a time
+        self._lock = threading.Lock()
+
+    def evaluate(self, formatted_rag_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Check how factual the benchmark card claims are, see evaluate_factuality.
+
+        Args:
+            formatted_rag_results: Contains atoms and contexts from RAG processing
+
+        Returns:
+            Dictionary with factuality scores and analysis results
+        """
+        from fact_reasoner.factreasoner import FactReasoner
+
+        with self._lock:
+            # Create the main FactReasoner pipeline (force debug_mode=False for clean output)
+            pipeline = FactReasoner(
+                context_retriever=self.context_retriever,
+                atom_extractor=self.atom_extractor,
+                atom_reviser=self.atom_reviser,
+                nli_extractor=self.nli_extractor,
+                merlin_path=self.merlin_path,
+                debug_mode=False,  # Always disable for clean CLI output
+                use_priors=self.use_priors,
+            )
+
+            # Load our atoms and contexts (already prepared by the RAG tool)
+            pipeline.from_dict_with_contexts(data=formatted_rag_results)
+
+            self.nli_scorer.pipeline = pipeline
+            self.nli_scorer.reset_stats()
+            try:
+                # Suppress all verbose output during processing
+                from contextlib import redirect_stderr, redirect_stdout
+
+                with open(os.devnull, "w") as devnull:
+                    with redirect_stdout(devnull), redirect_stderr(devnull):
+                        # Build relationships between atoms and contexts
+                        pipeline.build(
+                            has_atoms=True,  # atoms already created by RAG tool
+                            has_contexts=True,  # contexts already retrieved by RAG tool
+                            revise_atoms=False,  # atoms are already good, don't change them
+                            rel_atom_context=True,  # this is what we want - does evidence support claims?
+                            rel_context_context=False,  # skip this for speed
+                            contexts_per_atom_only=True,
+                            remove_duplicates=False,
+                        )
+
+                        # Get the final factuality scores using probabilistic reasoning
+                        results, marginals = pipeline.score()
+            finally:
+                self.nli_scorer.pipeline = None
+
+            # Map the variables of the graph to atom IDs once, for all analyses
+            variable_atom_map = build_variable_atom_map(
+                pipeline.atoms, (info.get("variable", "") for info in marginals)
+            )
+
+            logger.debug(
+                "NLI: %d atom-context pairs, %d sent to the model",
+                self.nli_scorer.pairs_scored,
+                self.nli_scorer.nli_calls,
+            )
+
+        # Calculate how uncertain we are about our results (entropy)
+        entropy = 0.0
+        valid_marginals = []
+
+        for info in marginals:
+            var = info.get("variable")
+            probs = info.get("probabilities")
+            if probs and len(probs) > 1:
+                # Get probability that the claim is true
+                p_true = probs[1] if probs[1] > 0.0 else 0.0000001
+                entropy += -p_true * math.log10(p_true)
+                valid_marginals.append({"variable": var, "probabilities": probs, "p_true": p_true})
+
+        # Normalize entropy values
+        n = len(valid_marginals)
+        normalized_entropy = entropy / n if n > 0 else 0.0
+        scaled_entropy = entropy / math.log10(n) if n > 0 else 0.0
+
+        # Group results by which field of the benchmark card they came from
+        field_analysis = analyze_factuality_by_field(
+            formatted_rag_results, valid_marginals, variable_atom_map
+        )
+
+        # Create a simple list of all atoms with their scores
+        atom_summary = create_atom_summary(formatted_rag_results, valid_marginals, variable_atom_map)
+
+        # Calculate flagged fields
+        flagged_count = len([m for m in valid_marginals if m.get("p_true", 1) < 0.3])
+
+        logger.debug(f"✅ FactReasoner evaluation complete")
+        logger.debug(
+            f"   Factuality: {len(valid_marginals)} claims evaluated, {flagged_count}/{len(valid_marginals)} fields flagged"
+        )
+
+        return {
+            "results": results,
+            "marginals": valid_marginals,
+            "entropy_metrics": {
+                "total_entropy": entropy,
+                "normalized_entropy": normalized_entropy,
+                "scaled_entropy": scaled_entropy,
+                "num_variables": n,
+            },
+            "fact_graph_info": {
+                "num_atoms": (
+                    len(pipeline.fact_graph.atoms) if hasattr(pipeline.fact_graph, "atoms") else 0
+                ),
+                "num_contexts": (
+                    len(pipeline.fact_graph.contexts) if hasattr(pipeline.fact_graph, "contexts") else 0
+                ),
+            },
+            "field_analysis": field_analysis,
+            "atom_summary": atom_summary,
+        }
+
+
+_SERVICES: Dict[tuple, FactualityService] = {}
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_factuality_service(
+    model: str = "llama-3.3-70b-instruct",
+    nli_prompt_version: str = "v1",
+    cache_dir: str = "factreasoner_cache",
+    merlin_path: str = "merlin/bin/merlin",
+    use_priors: bool = False,
+) -> FactualityService:
+    """Get the factuality service for a configuration, building it on first use.
+
+    Args:
+        model: Which LLM to use for NLI analysis
+        nli_prompt_version: Which prompt template to use for NLI
+        cache_dir: Where to store temporary files and the NLI cache
+        merlin_path: Path to the Merlin reasoning engine
+        use_priors: Whether to use prior probabilities for atoms/contexts
+
+    Returns:
+        FactualityService shared by all callers with the same configuration
+    """
+    key = (model, nli_prompt_version, os.path.abspath(cache_dir), merlin_path, use_priors)
+    with _SERVICES_LOCK:
+        if key not in _SERVICES:
+            _SERVICES[key] = FactualityService(
+                model=model,
+                nli_prompt_version=nli_prompt_version,
+                cache_dir=cache_dir,
+                merlin_path=merlin_path,
+                use_priors=use_priors,
+            )
+        return _SERVICES[key]
+
+
 def evaluate_factuality(
     formatted_rag_results: Dict[str, Any],
     model: str = "llama-3.3-70b-instruct",
@@ -488,102 +793,13 @@ def evaluate_factuality(
         Dictionary with factuality scores and analysis results
     """
 
-    # Make sure we have a place to store temp files
-    os.makedirs(cache_dir, exist_ok=True)
-
-    # Set up all the components we need
-    from auto_benchmarkcard.config import Config
-    context_retriever = ContextRetriever(service_type="langchain", top_k=Config.DEFAULT_TOP_K, cache_dir=cache_dir)
-    atom_extractor = AtomExtractor(model)
-    atom_reviser = AtomReviser(model)
-    nli_extractor = NLIExtractor(model, prompt_version=nli_prompt_version)
-
-    # Create the main FactReasoner pipeline (force debug_mode=False for clean output)
-    pipeline = FactReasoner(
-        context_retriever=context_retriever,
-        atom_extractor=atom_extractor,
-        atom_reviser=atom_reviser,
-        nli_extractor=nli_extractor,
+    return get_factuality_service(
+        model=model,
+        nli_prompt_version=nli_prompt_version,
+        cache_dir=cache_dir,
         merlin_path=merlin_path,
-        debug_mode=False,  # Always disable for clean CLI output
         use_priors=use_priors,
-    )
-
-    # Load our atoms and contexts (already prepared by the RAG tool)
-    # Evaluation message removed for cleaner output
-    pipeline.from_dict_with_contexts(data=formatted_rag_results)
-
-    # Suppress all verbose output during processing
-    from contextlib import redirect_stderr, redirect_stdout
-
-    with open(os.devnull, "w") as devnull:
-        with redirect_stdout(devnull), redirect_stderr(devnull):
-            # Build relationships between atoms and contexts
-            pipeline.build(
-                has_atoms=True,  # atoms already created by RAG tool
-                has_contexts=True,  # contexts already retrieved by RAG tool
-                revise_atoms=False,  # atoms are already good, don't change them
-                rel_atom_context=True,  # this is what we want - does evidence support claims?
-                rel_context_context=False,  # skip this for speed
-                contexts_per_atom_only=True,
-                remove_duplicates=False,
-            )
-
-            # Get the final factuality scores using probabilistic reasoning
-            results, marginals = pipeline.score()
-
-    # Calculate how uncertain we are about our results (entropy)
-    entropy = 0.0
-    valid_marginals = []
-
-    for info in marginals:
-        var = info.get("variable")
-        probs = info.get("probabilities")
-        if probs and len(probs) > 1:
-            # Get probability that the claim is true
-            p_true = probs[1] if probs[1] > 0.0 else 0.0000001
-            entropy += -p_true * math.log10(p_true)
-            valid_marginals.append({"variable": var, "probabilities": probs, "p_true": p_true})
-
-    # Normalize entropy values
-    n = len(valid_marginals)
-    normalized_entropy = entropy / n if n > 0 else 0.0
-    scaled_entropy = entropy / math.log10(n) if n > 0 else 0.0
-
-    # Group results by which field of the benchmark card they came from
-    field_analysis = analyze_factuality_by_field(formatted_rag_results, valid_marginals)
-
-    # Create a simple list of all atoms with their scores
-    atom_summary = create_atom_summary(formatted_rag_results, valid_marginals)
-
-    # Calculate flagged fields
-    flagged_count = len([m for m in valid_marginals if m.get("p_true", 1) < 0.3])
-
-    logger.debug(f"✅ FactReasoner evaluation complete")
-    logger.debug(
-        f"   Factuality: {len(valid_marginals)} claims evaluated, {flagged_count}/{len(valid_marginals)} fields flagged"
-    )
-
-    return {
-        "results": results,
-        "marginals": valid_marginals,
-        "entropy_metrics": {
-            "total_entropy": entropy,
-            "normalized_entropy": normalized_entropy,
-            "scaled_entropy": scaled_entropy,
-            "num_variables": n,
-        },
-        "fact_graph_info": {
-            "num_atoms": (
-                len(pipeline.fact_graph.atoms) if hasattr(pipeline.fact_graph, "atoms") else 0
-            ),
-            "num_contexts": (
-                len(pipeline.fact_graph.contexts) if hasattr(pipeline.fact_graph, "contexts") else 0
-            ),
-        },
-        "field_analysis": field_analysis,
-        "atom_summary": atom_summary,
-    }
+    ).evaluate(formatted_rag_results)
 
 
 def flag_benchmark_card_fields(
@@ -0,0 +1,105 @@
+"""Persistent cache of NLI predictions for factuality evaluation."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class NLICache:
+    """Append-only JSONL cache of (model, premise, hypothesis) -> NLI prediction.
+
+    Predictions are appended as soon as they are computed, so an interrupted
+    evaluation keeps everything predicted so far and re-evaluating an edited card
+    only runs NLI for pairs whose texts changed.
+
+    Attributes:
+        path: JSONL file backing the cache, or None for an in-memory cache.
+        hits: Number of predictions served from the cache.
+        misses: Number of predictions not in the cache.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Load the cache from disk if the file exists.
+
+        Args:
+            path: JSONL file backing the cache, or None for an in-memory cache.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self._entries[record["key"]] = record["result"]
+                    except (ValueError, KeyError, TypeError):
+                        # partially written last line of an interrupted run
+                        continue
+            logger.debug("Loaded %d cached NLI predictions from %s", len(self._entries), path)
+
+    @staticmethod
+    def make_key(model: str, premise: str, hypothesis: str) -> str:
+        """Cache key of an NLI prediction.
+
+        Args:
+            model: Model and prompt version the prediction was made with.
+            premise: Context text.
+            hypothesis: Atom text.
+
+        Returns:
+            Hex digest identifying the prediction.
+        """
+        return hashlib.sha256(
+            json.dumps([model, premise, hypothesis]).encode("utf-8")
+        ).hexdigest()
+
+    def get_many(
+        self, model: str, pairs: List[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Look up the predictions of (premise, hypothesis) pairs.
+
+        Args:
+            model: Model and prompt version of the predictions.
+            pairs: (premise, hypothesis) pairs.
+
+        Returns:
+            Cached prediction or None for every pair.
+        """
+        results = [self._entries.get(self.make_key(model, *pair)) for pair in pairs]
+        found = sum(result is not None for result in results)
+        self.hits += found
+        self.misses += len(results) - found
+        return results
+
+    def put_many(
+        self, model: str, pairs: List[Tuple[str, str]], results: List[Dict[str, Any]]
+    ) -> None:
+        """Store the predictions of (premise, hypothesis) pairs.
+
+        Args:
+            model: Model and prompt version of the predictions.
+            pairs: (premise, hypothesis) pairs.
+            results: NLI prediction for every pair.
+        """
+        with self._lock:
+            records = []
+            for pair, result in zip(pairs, results):
+                key = self.make_key(model, *pair)
+                self._entries[key] = result
+                records.append(json.dumps({"key": key, "result": result}, default=str))
+            if self.path and records:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(self.path, "a") as f:
+                    f.write("\n".join(records) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._entries)
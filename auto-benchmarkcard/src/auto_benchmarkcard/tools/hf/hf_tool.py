@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import date, datetime
 from functools import lru_cache
@@ -20,6 +21,9 @@ logging.getLogger("huggingface_hub").setLevel(logging.WARNING)
 from huggingface_hub import HfApi, hf_hub_download
 from langchain.tools import tool
 
+from auto_benchmarkcard.artifact_cache import get_artifact_cache
+from auto_benchmarkcard.config import Config
+
 # handle different versions of huggingface_hub
 try:
     from huggingface_hub import HfHubHTTPError
@@ -57,6 +61,12 @@ def _clean(obj: Any) -> Any:
 def _collect_hf_metadata(repo_id: str) -> Dict[str, Any]:
     """Get all metadata for a HuggingFace dataset.
 
+    Metadata is kept in the artifact cache. Within the cache TTL it is served
+    without network access; after that one dataset_info call revalidates it,
+    and the README, file list and configs are only fetched again when the
+    repo's commit changed. Cached metadata is served when the Hub is
+    unreachable.
+
     Args:
         repo_id: HuggingFace repository ID in format 'username/dataset-name'.
 
@@ -66,14 +76,45 @@ def _collect_hf_metadata(repo_id: str) -> Dict[str, Any]:
     Raises:
         ValueError: If dataset is not found on HuggingFace Hub.
     """
-    # Get basic info
-    try:
-        info = api.dataset_info(repo_id)
-    except HfHubHTTPError as exc:
-        raise ValueError(f"Dataset '{repo_id}' not found: {exc}") from exc
+    cache = get_artifact_cache()
+    with cache.lock("hf", repo_id):
+        record = cache.get("hf", repo_id)
+        if record is not None and cache.is_fresh(record):
+            logger.debug("Using cached HuggingFace metadata for %s", repo_id)
+            return record["metadata"]
+
+        # Get basic info
+        try:
+            info = api.dataset_info(repo_id)
+        except Exception as exc:
+            if record is not None:
+                logger.warning("Could not revalidate %s, using cached metadata: %s", repo_id, exc)
+                return record["metadata"]
+            if isinstance(exc, HfHubHTTPError):
+                raise ValueError(f"Dataset '{repo_id}' not found: {exc}") from exc
+            raise
+
+        info_meta: Dict[str, Any] = _clean(asdict(info))
+        if record is not None and record.get("sha") and record["sha"] == info.sha:
+            # repo unchanged, only refresh the info fields (downloads, likes, ...)
+            meta = {**record["metadata"], **info_meta}
+        else:
+            meta = _fetch_repo_metadata(repo_id, info_meta)
+
+        cache.put("hf", repo_id, {"sha": info.sha, "metadata": meta})
+        return meta
+
 
-    meta: Dict[str, Any] = _clean(asdict(info))
+def _fetch_repo_metadata(repo_id: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Add README, file list, builder metadata and configs of a dataset repo.
 
+    Args:
+        repo_id: HuggingFace repository ID in format 'username/dataset-name'.
+        meta: Cleaned dataset_info of the repo.
+
+    Returns:
+        The dataset metadata extended with the repo contents.
+    """
     # try to get readme
     try:
         readme_path = hf_hub_download(
@@ -130,7 +171,8 @@ def hf_dataset_metadata(repo_id: Union[str, List[str]]) -> Dict[str, Any]:
     Returns:
         Dictionary containing metadata for requested dataset(s). For single repo,
         returns metadata directly. For multiple repos, returns dict mapping repo ID
-        to metadata (or error message if fetch failed).
+        to metadata (or error message if fetch failed). Multiple repos are fetched
+        concurrently.
     """
     if isinstance(repo_id, str):
         logger.debug(f"Fetching HuggingFace metadata for dataset: {repo_id}")
@@ -142,13 +184,16 @@ def hf_dataset_metadata(repo_id: Union[str, List[str]]) -> Dict[str, Any]:
     # multiple repos
     logger.debug(f"Fetching HuggingFace metadata for {len(repo_id)} datasets")
     results: Dict[str, Any] = {}
-    for rid in repo_id:
-        try:
-            logger.debug(f"Processing dataset: {rid}")
-            results[rid] = _collect_hf_metadata(rid)
-        except Exception as exc:
-            logger.warning("Could not fetch %s: %s", rid, exc)
-            results[rid] = {"error": str(exc)}
+    max_workers = max(1, min(Config.HF_MAX_WORKERS, len(repo_id)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {rid: executor.submit(_collect_hf_metadata, rid) for rid in repo_id}
+        # collect in request order so the output does not depend on timing
+        for rid, future in futures.items():
+            try:
+                results[rid] = future.result()
+            except Exception as exc:
+                logger.warning("Could not fetch %s: %s", rid, exc)
+                results[rid] = {"error": str(exc)}
 
     logger.debug(f"Completed HuggingFace metadata retrieval for {len(repo_id)} datasets")
 
@@ -6,9 +6,11 @@ independually verified against source documents.
 
 import json
 import logging
-from typing import Any, Dict, List
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from tqdm import tqdm
+from auto_benchmarkcard.config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -18,60 +20,88 @@ except ImportError:
     logger.warning("LLM handler not available for atomization")
     LLMHandler = None
 
+# Valid field paths statements can be attributed to
+ATOMIZATION_FIELDS = [
+    "benchmark_details.name",
+    "benchmark_details.overview",
+    "benchmark_details.data_type",
+    "benchmark_details.domains",
+    "benchmark_details.languages",
+    "benchmark_details.similar_benchmarks",
+    "benchmark_details.resources",
+    "purpose_and_intended_users.goal",
+    "purpose_and_intended_users.audience",
+    "purpose_and_intended_users.tasks",
+    "purpose_and_intended_users.limitations",
+    "purpose_and_intended_users.out_of_scope_uses",
+    "data.source",
+    "data.size",
+    "data.format",
+    "data.annotation",
+    "methodology.methods",
+    "methodology.metrics",
+    "methodology.calculation",
+    "methodology.interpretation",
+    "methodology.baseline_results",
+    "methodology.validation",
+    "ethical_and_legal_considerations.privacy_and_anonymity",
+    "ethical_and_legal_considerations.data_licensing",
+    "ethical_and_legal_considerations.consent_procedures",
+    "ethical_and_legal_considerations.compliance_with_regulations",
+]
+
+# Structured output of an atomization request
+ATOMIZATION_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "statements": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "statement": {"type": "string"},
+                    "field": {"type": "string", "enum": ATOMIZATION_FIELDS},
+                },
+                "required": ["statement", "field"],
+            },
+        }
+    },
+    "required": ["statements"],
+}
+
 BENCHMARK_CARD_ATOMIZATION_PROMPT = """
 Extract verifiable facts from this benchmark card. Each statement must be independently verifiable.
 
 CRITICAL: Use the EXACT field path (dot notation) where the information appears in the JSON structure.
 
 Required Field Paths (use these EXACT paths):
-- benchmark_details.name
-- benchmark_details.overview
-- benchmark_details.data_type
-- benchmark_details.domains
-- benchmark_details.languages
-- benchmark_details.similar_benchmarks
-- benchmark_details.resources
-- purpose_and_intended_users.goal
-- purpose_and_intended_users.audience
-- purpose_and_intended_users.tasks
-- purpose_and_intended_users.limitations
-- purpose_and_intended_users.out_of_scope_uses
-- data.source
-- data.size
-- data.format
-- data.annotation
-- methodology.methods
-- methodology.metrics
-- methodology.calculation
-- methodology.interpretation
-- methodology.baseline_results
-- methodology.validation
-- ethical_and_legal_considerations.privacy_and_anonymity
-- ethical_and_legal_considerations.data_licensing
-- ethical_and_legal_considerations.consent_procedures
-- ethical_and_legal_considerations.compliance_with_regulations
+{field_paths}
 
 Rules:
 1. Extract specific, verifiable claims (numbers, names, dates, metrics)
 2. Each statement gets ONE field path showing exactly where the info appears
-3. Use format: "- Statement text [exact.field.path]"
+3. Answer with a JSON object: {{"statements": [{{"statement": "...", "field": "exact.field.path"}}]}}
 4. Focus on concrete facts, not general descriptions
 
 Examples:
 Input: {{"data": {{"size": "10,000 examples"}}, "methodology": {{"interpretation": "The best model achieved 85.2% accuracy"}}}}
 Output:
-- The dataset contains 10,000 examples [data.size]
-- The best model achieved 85.2% accuracy [methodology.interpretation]
+{{"statements": [
+  {{"statement": "The dataset contains 10,000 examples", "field": "data.size"}},
+  {{"statement": "The best model achieved 85.2% accuracy", "field": "methodology.interpretation"}}
+]}}
 
 Input: {{"benchmark_details": {{"name": "ETHOS"}}, "methodology": {{"calculation": "F1-score measures precision and recall"}}}}
 Output:
-- The benchmark name is ETHOS [benchmark_details.name]
-- F1-score measures precision and recall [methodology.calculation]
+{{"statements": [
+  {{"statement": "The benchmark name is ETHOS", "field": "benchmark_details.name"}},
+  {{"statement": "F1-score measures precision and recall", "field": "methodology.calculation"}}
+]}}
 
 Now extract facts from:
 {benchmark_card}
 
-Atomic Statements:
+JSON:
 """
 
 
@@ -96,35 +126,7 @@ def text_to_statements(text: str, separator: str = "- ") -> List[dict]:
         >>> text_to_statements(text)
         [{'text': 'ETHOS is a hate speech benchmark', 'field': 'benchmark_details.name'}]
     """
-    # Valid field paths for validation
-    valid_fields = {
-        "benchmark_details.name",
-        "benchmark_details.overview",
-        "benchmark_details.data_type",
-        "benchmark_details.domains",
-        "benchmark_details.languages",
-        "benchmark_details.similar_benchmarks",
-        "benchmark_details.resources",
-        "purpose_and_intended_users.goal",
-        "purpose_and_intended_users.audience",
-        "purpose_and_intended_users.tasks",
-        "purpose_and_intended_users.limitations",
-        "purpose_and_intended_users.out_of_scope_uses",
-        "data.source",
-        "data.size",
-        "data.format",
-        "data.annotation",
-        "methodology.methods",
-        "methodology.metrics",
-        "methodology.calculation",
-        "methodology.interpretation",
-        "methodology.baseline_results",
-        "methodology.validation",
-        "ethical_and_legal_considerations.privacy_and_anonymity",
-        "ethical_and_legal_considerations.data_licensing",
-        "ethical_and_legal_considerations.consent_procedures",
-        "ethical_and_legal_considerations.compliance_with_regulations",
-    }
+    valid_fields = set(ATOMIZATION_FIELDS)
 
     statements = []
     for line in text.strip().splitlines():
@@ -151,6 +153,48 @@ def text_to_statements(text: str, separator: str = "- ") -> List[dict]:
     return statements
 
 
+def parse_atomization_response(response: str) -> List[dict]:
+    """Parse a structured atomization response into atomic statements.
+
+    Field paths outside the schema are mapped with the same fallback as
+    text_to_statements. Responses that are not JSON, e.g. from engines that
+    ignore the response schema, are parsed as "- statement [field]" lines.
+
+    Args:
+        response: Raw LLM output, a JSON object with a 'statements' list.
+
+    Returns:
+        List of dictionaries with 'text' and 'field' keys.
+    """
+    try:
+        parsed = json.loads(response)
+    except (json.JSONDecodeError, TypeError):
+        # the object may be wrapped in text or a code fence
+        json_match = re.search(r"\{.*\}", response or "", re.DOTALL)
+        try:
+            parsed = json.loads(json_match.group()) if json_match else None
+        except json.JSONDecodeError:
+            parsed = None
+
+    if not isinstance(parsed, dict) or not isinstance(parsed.get("statements"), list):
+        return text_to_statements(response or "")
+
+    valid_fields = set(ATOMIZATION_FIELDS)
+    statements = []
+    for item in parsed["statements"]:
+        if not isinstance(item, dict):
+            continue
+        statement = str(item.get("statement", "")).strip()
+        if not statement:
+            continue
+        field = item.get("field")
+        if field and field not in valid_fields:
+            logger.warning(f"Invalid field path '{field}' - using fallback mapping")
+            field = _map_to_valid_field(field, statement)
+        statements.append({"text": statement, "field": field or None})
+    return statements
+
+
 def _map_to_valid_field(field: str, statement: str) -> str:
     """Map invalid field paths to valid ones based on content analysis.
 
@@ -232,25 +276,72 @@ def benchmark_card_to_text(benchmark_card: Dict[str, Any]) -> str:
     return json.dumps(benchmark_card, indent=2)
 
 
+def split_card_sections(benchmark_card: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Split a benchmark card into atomization units.
+
+    Cards whose JSON is longer than Config.ATOMIZER_SECTION_SPLIT_CHARS are
+    split into one unit per top-level section, so each prompt stays small and
+    the sections are atomized in parallel. Smaller cards are a single unit.
+
+    Args:
+        benchmark_card: Benchmark card dictionary.
+
+    Returns:
+        List of partial benchmark cards, in section order.
+    """
+    if len(benchmark_card) <= 1 or len(
+        benchmark_card_to_text(benchmark_card)
+    ) <= Config.ATOMIZER_SECTION_SPLIT_CHARS:
+        return [benchmark_card]
+    return [{section: content} for section, content in benchmark_card.items()]
+
+
+def section_fields(card_part: Dict[str, Any]) -> List[str]:
+    """Field paths statements about part of a card can be attributed to.
+
+    Args:
+        card_part: Benchmark card or one section of it.
+
+    Returns:
+        The field paths under the part's sections, or all field paths if none
+        of its sections is known.
+    """
+    fields = [
+        field for field in ATOMIZATION_FIELDS if field.split(".", 1)[0] in card_part
+    ]
+    return fields or ATOMIZATION_FIELDS
+
+
 class BenchmarkCardAtomizer:
     """Atomizes benchmark cards into verifiable facts.
 
+    All prompts of a batch, one per card or per card section, go to the engine
+    in a single request with a JSON response schema.
+
     Attributes:
         engine_type: Type of LLM engine to use.
         model_name: Name of the LLM model.
         llm_handler: LLM handler instance for generation.
     """
 
-    def __init__(self, engine_type: str = "rits", model_name: str = None, **kwargs):
-        if LLMHandler is None:
+    def __init__(
+        self,
+        engine_type: str = "rits",
+        model_name: str = None,
+        llm_handler: Optional["LLMHandler"] = None,
+        **kwargs,
+    ):
+        if llm_handler is None and LLMHandler is None:
             raise ImportError("LLM handler required for atomization")
 
         self.engine_type = engine_type
         self.model_name = model_name
-        # Set verbose=False by default unless overridden in kwargs
-        if 'verbose' not in kwargs:
-            kwargs['verbose'] = False
-        self.llm_handler = LLMHandler(engine_type=engine_type, model_name=model_name, **kwargs)
+        if llm_handler is None:
+            # Set verbose=False by default unless overridden in kwargs
+            if 'verbose' not in kwargs:
+                kwargs['verbose'] = False
+            llm_handler = LLMHandler(engine_type=engine_type, model_name=model_name, **kwargs)
+        self.llm_handler = llm_handler
 
         logger.debug(f"Atomizer ready: {self.llm_handler.engine_type}")
 
@@ -258,13 +349,16 @@ class BenchmarkCardAtomizer:
         """Create atomization prompt.
 
         Args:
-            benchmark_card: Benchmark card dictionary to atomize.
+            benchmark_card: Benchmark card dictionary, or part of it, to atomize.
 
         Returns:
             Formatted prompt string for LLM.
         """
         benchmark_text = benchmark_card_to_text(benchmark_card)
-        return BENCHMARK_CARD_ATOMIZATION_PROMPT.format(benchmark_card=benchmark_text)
+        field_paths = "\n".join(f"- {field}" for field in section_fields(benchmark_card))
+        return BENCHMARK_CARD_ATOMIZATION_PROMPT.format(
+            field_paths=field_paths, benchmark_card=benchmark_text
+        )
 
     def atomize_single(self, benchmark_card: Dict[str, Any]) -> List[dict]:
         """Extract atomic statements from benchmark card.
@@ -275,12 +369,10 @@ class BenchmarkCardAtomizer:
         Returns:
             List of atomic statement dictionaries with 'text' and 'field' keys.
         """
-        prompt = self.make_prompt(benchmark_card)
-        response = self.llm_handler.generate(prompt)
-        return text_to_statements(response)
+        return self.atomize_batch([benchmark_card])[0]
 
     def atomize_batch(self, benchmark_cards: List[Dict[str, Any]]) -> List[List[dict]]:
-        """Process multiple benchmark cards.
+        """Process multiple benchmark cards in one engine request.
 
         Args:
             benchmark_cards: List of benchmark card dictionaries.
@@ -288,12 +380,51 @@ class BenchmarkCardAtomizer:
         Returns:
             List of atomic statement lists, one per input card.
         """
-        results = []
-        for card in tqdm(benchmark_cards, desc="Atomizing cards"):
-            results.append(self.atomize_single(card))
+        units: List[Tuple[int, Dict[str, Any]]] = [
+            (card_index, card_part)
+            for card_index, card in enumerate(benchmark_cards)
+            for card_part in split_card_sections(card)
+        ]
+        logger.debug(f"Atomizing {len(benchmark_cards)} cards with {len(units)} prompts")
+
+        responses = self.llm_handler.generate_batch(
+            [self.make_prompt(card_part) for _, card_part in units],
+            response_format=ATOMIZATION_RESPONSE_SCHEMA,
+        )
+
+        results: List[List[dict]] = [[] for _ in benchmark_cards]
+        for (card_index, card_part), response in zip(units, responses):
+            statements = parse_atomization_response(response)
+            if not statements:
+                logger.warning(f"No statements extracted for sections {list(card_part)}")
+            results[card_index].extend(statements)
         return results
 
 
+_ATOMIZERS: Dict[tuple, BenchmarkCardAtomizer] = {}
+_ATOMIZERS_LOCK = threading.Lock()
+
+
+def get_atomizer(engine_type: str = "rits", model_name: str = None) -> BenchmarkCardAtomizer:
+    """Get the shared atomizer for an engine and model.
+
+    The atomizer, and the LLM handler it wraps, is created on first use and
+    reused for every later card.
+
+    Args:
+        engine_type: LLM engine type.
+        model_name: Specific model to use.
+
+    Returns:
+        BenchmarkCardAtomizer for the engine and model.
+    """
+    key = (engine_type, model_name)
+    with _ATOMIZERS_LOCK:
+        if key not in _ATOMIZERS:
+            _ATOMIZERS[key] = BenchmarkCardAtomizer(engine_type=engine_type, model_name=model_name)
+        return _ATOMIZERS[key]
+
+
 def exclude_risk_sections(benchmark_card: Dict[str, Any]) -> Dict[str, Any]:
     """Remove risk sections from benchmark card.
 
@@ -342,8 +473,7 @@ def atomize_benchmark_card(
     filtered_card = exclude_risk_sections(benchmark_card)
 
     try:
-        atomizer = BenchmarkCardAtomizer(engine_type=engine_type, model_name=model_name)
-        return atomizer.atomize_single(filtered_card)
+        return get_atomizer(engine_type, model_name).atomize_single(filtered_card)
     except Exception as e:
         logger.warning(f"Atomization failed: {e}")
         logger.debug("Using fallback extraction")
@@ -358,3 +488,28 @@ def atomize_benchmark_card(
                 }
             )
         return statements
+
+
+def atomize_benchmark_cards(
+    benchmark_cards: List[Dict[str, Any]],
+    engine_type: str = "rits",
+    model_name: str = None,
+) -> List[List[dict]]:
+    """Extract atomic statements from many benchmark cards at once.
+
+    Excludes risk sections as they're inferred rather than factual. All cards
+    are sent to the engine in a single batched request.
+
+    Args:
+        benchmark_cards: Benchmark card data.
+        engine_type: LLM engine type.
+        model_name: Specific model to use.
+
+    Returns:
+        List of atomic statement lists, one per input card.
+    """
+    if LLMHandler is None:
+        raise ImportError("LLM handler required for atomization")
+
+    filtered_cards = [exclude_risk_sections(card) for card in benchmark_cards]
+    return get_atomizer(engine_type, model_name).atomize_batch(filtered_cards)
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 from typing import Any, Dict, List
@@ -70,6 +71,18 @@ def generate_output_from_benchmark_card(benchmark_card: Dict[str, Any], field: s
     return " ".join(output_parts)
 
 
+def context_id_for_text(text: str) -> str:
+    """Content-addressed context ID, identical chunk texts share one ID.
+
+    Args:
+        text: The chunk text.
+
+    Returns:
+        Context ID derived from the text hash.
+    """
+    return "c_" + hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
 def convert_rag_to_required_format(
     rag_results: Dict[str, Any],
     benchmark_field: str = "description",
@@ -77,6 +90,9 @@ def convert_rag_to_required_format(
 ) -> Dict[str, Any]:
     """Convert RAG results to the required format with atomic statements and contexts.
 
+    Contexts are content-addressed: a chunk retrieved for several atoms is stored
+    once and the atoms reference its shared ID.
+
     Args:
         rag_results: The RAG results from the existing pipeline.
         benchmark_field: The field being queried (e.g., "description", "overview").
@@ -98,6 +114,8 @@ def convert_rag_to_required_format(
         "contexts": [],
     }
 
+    seen_contexts = set()
+
     # Process each statement and its retrieved chunks
     for atom_idx, result in enumerate(rag_results.get("results", [])):
         statement_data = result.get("statement", {})
@@ -117,18 +135,23 @@ def convert_rag_to_required_format(
 
         # Create context IDs for this atom
         context_ids = []
-        for chunk_idx, chunk in enumerate(retrieved_chunks):
-            context_id = f"c_{atom_id}_{chunk_idx}"
+        for chunk in retrieved_chunks:
+            chunk_text = chunk.get("content", "")
+            context_id = context_id_for_text(chunk_text)
+            if context_id in context_ids:
+                continue
             context_ids.append(context_id)
 
-            # Add to contexts array
-            output["contexts"].append(
-                {
-                    "id": context_id,
-                    "title": benchmark_name,
-                    "text": chunk.get("content", ""),
-                }
-            )
+            # Add to contexts array, once per unique chunk text
+            if context_id not in seen_contexts:
+                seen_contexts.add(context_id)
+                output["contexts"].append(
+                    {
+                        "id": context_id,
+                        "title": benchmark_name,
+                        "text": chunk_text,
+                    }
+                )
 
         # Add atom with field information
         atom = {
@@ -8,7 +8,6 @@ import json
 import logging
 from typing import Any, Dict, List
 
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
 logger = logging.getLogger(__name__)
@@ -28,6 +27,8 @@ class MetadataIndexer:
             chunk_size: Maximum size of text chunks.
             chunk_overlap: Overlap between consecutive chunks.
         """
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
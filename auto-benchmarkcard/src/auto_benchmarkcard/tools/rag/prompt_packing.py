@@ -0,0 +1,181 @@
+"""Token-budget-aware packing of list items into LLM prompts.
+
+Prompts that ask the LLM for one answer per item (query reformulation, chunk
+scoring) grow with the number and length of the items. The helpers here count
+tokens, pack items greedily into prompts that stay under a token budget, run
+the prompts as one concurrent batch and retry only the prompts whose answer
+could not be parsed.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from auto_benchmarkcard.config import Config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rough characters per token when no tokenizer is installed
+CHARS_PER_TOKEN = 4
+
+# Tokens added per item by numbering, labels and separators
+ITEM_OVERHEAD_TOKENS = 8
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding, or None if tiktoken is not installed."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(Config.PROMPT_TOKENIZER_ENCODING)
+    except Exception as e:
+        logger.debug(f"tiktoken unavailable, estimating tokens from characters: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count the tokens in a text.
+
+    Uses tiktoken when it is installed and estimates from the character count
+    otherwise. Either way the count is an approximation of the serving model's
+    tokenizer, which the budget leaves headroom for.
+
+    Args:
+        text: Text to count.
+
+    Returns:
+        Number of tokens.
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut a text down to at most max_tokens tokens.
+
+    Args:
+        text: Text to truncate.
+        max_tokens: Maximum number of tokens to keep.
+
+    Returns:
+        The text, truncated with a trailing "..." if it was too long.
+    """
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens]) + "..."
+    return text[: max_tokens * CHARS_PER_TOKEN] + "..."
+
+
+def pack_items(
+    item_tokens: Sequence[int],
+    budget: int,
+    overhead_tokens: int = 0,
+    max_items: Optional[int] = None,
+) -> List[List[int]]:
+    """Pack items greedily, in order, into batches that fit a token budget.
+
+    An item larger than the budget on its own gets a batch of its own.
+
+    Args:
+        item_tokens: Token count of each item.
+        budget: Maximum tokens per prompt.
+        overhead_tokens: Tokens of the prompt without any items.
+        max_items: Maximum items per batch, or None for no limit.
+
+    Returns:
+        Batches of item indices, covering every item once in order.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = overhead_tokens
+    for index, tokens in enumerate(item_tokens):
+        cost = tokens + ITEM_OVERHEAD_TOKENS
+        full = max_items is not None and len(current) >= max_items
+        if current and (used + cost > budget or full):
+            batches.append(current)
+            current, used = [], overhead_tokens
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def run_packed(
+    items: Sequence[str],
+    build_prompt: Callable[[List[str]], str],
+    parse_response: Callable[[str, int], Optional[List[T]]],
+    generate_batch: Callable[[List[str]], List[str]],
+    budget: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    max_items: Optional[int] = None,
+) -> List[Optional[T]]:
+    """Answer one question per item with as few, budget-sized prompts as possible.
+
+    Items are packed into prompts under the token budget and all prompts are
+    sent in one batch, which the engine runs concurrently. A prompt whose
+    response cannot be parsed, e.g. because the LLM returned a list of the
+    wrong length, is split in half and retried; the other prompts keep their
+    answers.
+
+    Args:
+        items: Items to answer for, rendered into prompts by build_prompt.
+        build_prompt: Builds the prompt for a batch of items.
+        parse_response: Parses a response into one answer per item, or returns
+            None if the response is unusable.
+        generate_batch: Generates responses for a list of prompts, in order.
+        budget: Maximum tokens per prompt, defaults to Config.PROMPT_TOKEN_BUDGET.
+        max_retries: Retry rounds for failed prompts, defaults to
+            Config.PROMPT_PACK_MAX_RETRIES.
+        max_items: Maximum items per prompt, or None for no limit.
+
+    Returns:
+        One answer per item, in item order, or None where every attempt failed.
+    """
+    budget = budget or Config.PROMPT_TOKEN_BUDGET
+    max_retries = Config.PROMPT_PACK_MAX_RETRIES if max_retries is None else max_retries
+    results: List[Optional[T]] = [None] * len(items)
+    if not items:
+        return results
+
+    overhead = count_tokens(build_prompt([]))
+    pending = pack_items([count_tokens(item) for item in items], budget, overhead, max_items)
+    logger.debug(f"Packed {len(items)} items into {len(pending)} prompts")
+
+    for attempt in range(max_retries + 1):
+        prompts = [build_prompt([items[i] for i in batch]) for batch in pending]
+        try:
+            responses = generate_batch(prompts)
+        except Exception as e:
+            logger.warning(f"Batch of {len(prompts)} prompts failed: {e}")
+            responses = [None] * len(prompts)
+
+        failed = []
+        for batch, response in zip(pending, responses):
+            answers = parse_response(response, len(batch)) if response is not None else None
+            if answers is None or len(answers) != len(batch):
+                failed.append(batch)
+                continue
+            for index, answer in zip(batch, answers):
+                results[index] = answer
+
+        if not failed:
+            break
+        if attempt < max_retries:
+            logger.debug(f"Retrying {len(failed)} of {len(pending)} prompts")
+        # smaller prompts are more likely to get an answer of the right length
+        pending = []
+        for batch in failed:
+            middle = len(batch) // 2
+            pending.extend([batch[:middle], batch[middle:]] if middle else [batch])
+
+    return results
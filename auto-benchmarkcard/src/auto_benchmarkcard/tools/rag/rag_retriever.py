@@ -13,7 +13,7 @@ import re
 # Suppress noisy logging from external libraries
 import warnings
 from collections import Counter, defaultdict
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict
 
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
@@ -27,12 +27,22 @@ warnings.filterwarnings("ignore", message=".*LangChainDeprecationWarning.*")
 warnings.filterwarnings("ignore", message=".*HuggingFaceEmbeddings.*deprecated.*")
 warnings.filterwarnings("ignore", message=".*manual persistence.*")
 
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
 from langgraph.graph import END, START, StateGraph
 
+from auto_benchmarkcard.config import Config
+from auto_benchmarkcard.tools.rag.prompt_packing import (
+    ITEM_OVERHEAD_TOKENS,
+    count_tokens,
+    run_packed,
+    truncate_to_tokens,
+)
+
+# The text splitter, embeddings and vector store load sentence-transformers and
+# chromadb, so they are imported when a retriever first needs them
+if TYPE_CHECKING:
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,7 +114,7 @@ class RAGRetriever:
 
         logger.debug("RAG retriever initialized")
 
-    def _initialize_embeddings(self, embedding_model: str) -> HuggingFaceEmbeddings:
+    def _initialize_embeddings(self, embedding_model: str) -> "HuggingFaceEmbeddings":
         """Initialize embedding model based on choice.
 
         Args:
@@ -113,6 +123,8 @@ class RAGRetriever:
         Returns:
             Configured HuggingFaceEmbeddings instance
         """
+        from langchain_community.embeddings import HuggingFaceEmbeddings
+
         if embedding_model == "bge-large":
             return HuggingFaceEmbeddings(
                 model_name="BAAI/bge-large-en-v1.5",
@@ -140,7 +152,8 @@ class RAGRetriever:
             List of chunked documents with parent-child relationships in metadata.
         """
         # Get chunk sizes from configuration
-        from auto_benchmarkcard.config import Config
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
         parent_size = Config.PARENT_CHUNK_SIZE
         child_size = Config.CHILD_CHUNK_SIZE
 
@@ -288,6 +301,8 @@ class RAGRetriever:
 
         try:
             if self.vectorstore is None:
+                from langchain_community.vectorstores import Chroma
+
                 self.vectorstore = Chroma.from_documents(
                     documents=documents,
                     embedding=self.embeddings,
@@ -303,7 +318,6 @@ class RAGRetriever:
         self._build_bm25_index(documents)
 
         # Configure retriever with MMR for diversity
-        from auto_benchmarkcard.config import Config
         # If LLM reranking enabled, fetch more candidates for the LLM to filter
         # Otherwise just fetch top-k directly
         k_value = Config.DEFAULT_TOP_K * 3 if self.enable_llm_reranking else Config.DEFAULT_TOP_K
@@ -395,66 +409,86 @@ class RAGRetriever:
             return {"documents": documents}
 
         try:
-            # Prepare chunks for scoring
-            chunks_text = "\n\n".join(
-                [
-                    f"Chunk {i+1}:\n{doc.page_content[:500]}..."
-                    for i, doc in enumerate(documents[:10])
-                ]
-            )
+            candidates = documents[:10]
+            scores = self._score_documents(question, candidates)
+            final_docs = self._select_reranked(candidates, scores)
+            logger.debug(f"Reranked {len(documents)} → {len(final_docs)} documents")
+            return {"documents": final_docs}
 
-            rerank_prompt = f"""Query: "{question}"
+        except Exception as e:
+            logger.error(f"LLM reranking failed: {e}")
+            return {"documents": documents[:3]}
+
+    def _score_documents(self, question: str, documents: List[Document]) -> List[Optional[int]]:
+        """Score documents 1-10 for relevance to a question with the LLM.
+
+        Chunks are packed into prompts under Config.PROMPT_TOKEN_BUDGET, which
+        run concurrently; a chunk is only truncated if it alone would exceed
+        the budget.
+
+        Args:
+            question: Query or statement to score relevance against.
+            documents: Candidate documents.
+
+        Returns:
+            One score per document, or None where the LLM gave no usable score.
+        """
+
+        def build_prompt(chunks: List[str]) -> str:
+            chunks_text = "\n\n".join(f"Chunk {i+1}:\n{chunk}" for i, chunk in enumerate(chunks))
+            return f"""Query: "{question}"
 
 Score each chunk 1-10 for relevance. Filter out headers and boilerplate.
 
 Chunks:
 {chunks_text}
 
-Return JSON array: [8, 3, 9, 1, 7, 2, 6, 4, 5, 3]"""
+Return JSON array with one score per chunk, in order: [8, 3, 9, 1, 7, ...]"""
 
-            response = self.llm_handler.generate(rerank_prompt)
+        def parse_response(response: str, expected: int) -> Optional[List[int]]:
             scores = self._parse_scores(response)
+            return scores if len(scores) == expected else None
 
-            if not scores:
-                return {"documents": documents[:3]}
-
-            # Keep high-scoring chunks and return parent text when available
-            scored_docs = list(zip(documents[: len(scores)], scores))
-            filtered_docs = []
-            for doc, score in scored_docs:
-                # Ensure score is numeric before comparison
-                if isinstance(score, (int, float)) and score >= 6:
-                    filtered_docs.append(doc)
-
-            # Sort by score (highest first)
-            filtered_docs.sort(
-                key=lambda doc: next(
-                    (
-                        score
-                        for d, score in scored_docs
-                        if d == doc and isinstance(score, (int, float))
-                    ),
-                    0,
-                ),
-                reverse=True,
-            )
+        max_chunk_tokens = (
+            Config.PROMPT_TOKEN_BUDGET - count_tokens(build_prompt([])) - ITEM_OVERHEAD_TOKENS
+        )
+        chunks = [truncate_to_tokens(doc.page_content, max_chunk_tokens) for doc in documents]
+        return run_packed(chunks, build_prompt, parse_response, self.llm_handler.generate_batch)
 
-            final_docs = []
-            for doc in filtered_docs[:3]:
-                if doc.metadata.get("parent_text"):
-                    parent_doc = Document(
-                        page_content=doc.metadata["parent_text"], metadata=doc.metadata
-                    )
-                    final_docs.append(parent_doc)
-                else:
-                    final_docs.append(doc)
+    def _select_reranked(
+        self, documents: List[Document], scores: List[Optional[int]]
+    ) -> List[Document]:
+        """Keep the top-scoring documents, swapping in their parent text.
 
-            logger.debug(f"Reranked {len(documents)} → {len(final_docs)} documents")
-            return {"documents": final_docs}
+        Args:
+            documents: Scored documents.
+            scores: Score of each document, None if unscored.
 
-        except Exception as e:
-            logger.error(f"LLM reranking failed: {e}")
-            return {"documents": documents[:3]}
+        Returns:
+            Up to three documents scoring 6 or more, highest first, or the first
+            three documents if none could be scored.
+        """
+        if all(score is None for score in scores):
+            return documents[:3]
+
+        # Keep high-scoring chunks, highest first, and return parent text when available
+        scored_docs = [
+            (doc, score)
+            for doc, score in zip(documents, scores)
+            if score is not None and score >= 6
+        ]
+        scored_docs.sort(key=lambda item: item[1], reverse=True)
+
+        final_docs = []
+        for doc, _ in scored_docs[:3]:
+            if doc.metadata.get("parent_text"):
+                parent_doc = Document(
+                    page_content=doc.metadata["parent_text"], metadata=doc.metadata
+                )
+                final_docs.append(parent_doc)
+            else:
+                final_docs.append(doc)
+        return final_docs
 
     def _parse_scores(self, response: str) -> List[int]:
         """Parse LLM response to extract relevance scores.
@@ -495,61 +529,13 @@ Return JSON array: [8, 3, 9, 1, 7, 2, 6, 4, 5, 3]"""
             return documents[:3]
 
         try:
-            # Prepare chunks for scoring
-            chunks_text = "\n\n".join(
-                [
-                    f"Chunk {i+1}:\n{doc.page_content[:500]}..."
-                    for i, doc in enumerate(documents[:10])
-                ]
-            )
-
-            rerank_prompt = f"""Query: "{statement}"
-
-Score each chunk 1-10 for relevance. Filter out headers and boilerplate.
-
-Chunks:
-{chunks_text}
-
-Return JSON array: [8, 3, 9, 1, 7, 2, 6, 4, 5, 3]"""
-
-            # Run LLM call in thread pool to avoid blocking the event loop
+            candidates = documents[:10]
+            # Run LLM calls in thread pool to avoid blocking the event loop
             loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, self.llm_handler.generate, rerank_prompt)
-            scores = self._parse_scores(response)
-
-            if not scores:
-                return documents[:3]
-
-            # Keep high-scoring chunks and return parent text when available
-            scored_docs = list(zip(documents[: len(scores)], scores))
-            filtered_docs = []
-            for doc, score in scored_docs:
-                if isinstance(score, (int, float)) and score >= 6:
-                    filtered_docs.append(doc)
-
-            # Sort by score (highest first)
-            filtered_docs.sort(
-                key=lambda doc: next(
-                    (
-                        score
-                        for d, score in scored_docs
-                        if d == doc and isinstance(score, (int, float))
-                    ),
-                    0,
-                ),
-                reverse=True,
+            scores = await loop.run_in_executor(
+                None, self._score_documents, statement, candidates
             )
-
-            final_docs = []
-            for doc in filtered_docs[:3]:
-                if doc.metadata.get("parent_text"):
-                    parent_doc = Document(
-                        page_content=doc.metadata["parent_text"], metadata=doc.metadata
-                    )
-                    final_docs.append(parent_doc)
-                else:
-                    final_docs.append(doc)
-
+            final_docs = self._select_reranked(candidates, scores)
             logger.debug(f"Async reranked {len(documents)} → {len(final_docs)} documents")
             return final_docs
 
@@ -631,7 +617,11 @@ Return JSON array: [8, 3, 9, 1, 7, 2, 6, 4, 5, 3]"""
         return filtered_docs[:candidate_pool_size]
 
     def _reformulate_atoms_for_search_batch(self, statements: List[str]) -> List[str]:
-        """Reformulate multiple atomic statements into better search queries in one LLM call.
+        """Reformulate multiple atomic statements into better search queries.
+
+        Statements are packed into prompts under Config.PROMPT_TOKEN_BUDGET,
+        which run concurrently. Prompts whose answer has the wrong length are
+        split and retried; statements without a usable query are searched as is.
 
         Args:
             statements: List of atomic statements to reformulate.
@@ -642,55 +632,48 @@ Return JSON array: [8, 3, 9, 1, 7, 2, 6, 4, 5, 3]"""
         if not self.llm_handler or not statements:
             return statements
 
-        try:
-            # Create numbered list of statements
-            numbered_statements = []
-            for i, statement in enumerate(statements, 1):
-                numbered_statements.append(f"{i}. {statement}")
-
-            statements_text = "\n".join(numbered_statements)
-
-            prompt = f"""Turn these factual statements into search queries to find evidence:
+        def build_prompt(batch: List[str]) -> str:
+            statements_text = "\n".join(
+                f"{i}. {statement}" for i, statement in enumerate(batch, 1)
+            )
+            return f"""Turn these factual statements into search queries to find evidence:
 
 {statements_text}
 
 Focus on key terms, numbers, and specific entities. Remove generic words.
-Return as JSON array: ["query1", "query2", "query3", ...]"""
-
-            response = self.llm_handler.generate(prompt).strip()
+Return as JSON array with one query per statement, in order: ["query1", "query2", "query3", ...]"""
 
-            # Parse the JSON response
+        def parse_response(response: str, expected: int) -> Optional[List[Optional[str]]]:
             try:
+                response = response.strip()
                 start_idx = response.find("[")
                 end_idx = response.rfind("]") + 1
-                if start_idx >= 0 and end_idx > start_idx:
-                    reformulated_queries = json.loads(response[start_idx:end_idx])
-
-                    # Sanity check and fallback
-                    if isinstance(reformulated_queries, list) and len(reformulated_queries) == len(
-                        statements
-                    ):
-
-                        validated_queries = []
-                        for i, query in enumerate(reformulated_queries):
-                            if isinstance(query, str) and len(query.strip()) >= 3:
-                                validated_queries.append(query.strip())
-                            else:
-                                # Fallback to original statement
-                                validated_queries.append(statements[i])
-
-                        logger.debug(f"Batch reformulated {len(statements)} queries")
-                        return validated_queries
+                if start_idx < 0 or end_idx <= start_idx:
+                    return None
+                queries = json.loads(response[start_idx:end_idx])
             except (json.JSONDecodeError, ValueError, TypeError) as e:
                 logger.debug(f"Failed to parse batch reformulation response: {e}")
+                return None
+            if not isinstance(queries, list) or len(queries) != expected:
+                return None
+            return [
+                query.strip() if isinstance(query, str) and len(query.strip()) >= 3 else None
+                for query in queries
+            ]
 
-            # Fallback to original statements
-            return statements
-
+        try:
+            queries = run_packed(
+                statements, build_prompt, parse_response, self.llm_handler.generate_batch
+            )
         except Exception as e:
             logger.warning(f"Batch query reformulation failed: {e}")
             return statements
 
+        reformulated_count = sum(query is not None for query in queries)
+        logger.debug(f"Batch reformulated {reformulated_count}/{len(statements)} queries")
+        # Fallback to the original statement where no usable query came back
+        return [query or statement for query, statement in zip(queries, statements)]
+
     def _reformulate_atom_for_search(self, statement: str) -> str:
         """Reformulate single atomic statement into better search query (fallback method).
 
@@ -796,7 +779,7 @@ Return as JSON array: ["query1", "query2", "query3", ...]"""
     def retrieve_for_statements_batch(self, statements: List[str]) -> List[List[Dict[str, Any]]]:
         """Retrieve relevant documents for multiple factual statements using batch query reformulation.
 
-        More efficient than individual calls as it reformulates all queries in one LLM call.
+        More efficient than individual calls as it reformulates all queries in one batch of LLM prompts.
 
         Args:
             statements: List of factual statements to find evidence for
@@ -812,7 +795,7 @@ Return as JSON array: ["query1", "query2", "query3", ...]"""
 
         logger.debug(f"🔄 Processing {len(statements)} statements with batch reformulation")
 
-        # Batch reformulate all statements at once (single LLM call)
+        # Batch reformulate all statements at once (packed, concurrent prompts)
         reformulated_queries = self._reformulate_atoms_for_search_batch(statements)
 
         # Now process each statement with its reformulated query
@@ -925,7 +908,7 @@ Return as JSON array: ["query1", "query2", "query3", ...]"""
 
         logger.debug(f"🚀 Processing {len(statements)} statements with parallel reranking")
 
-        # Batch reformulate all statements at once (single LLM call)
+        # Batch reformulate all statements at once (packed, concurrent prompts)
         reformulated_queries = self._reformulate_atoms_for_search_batch(statements)
 
         # Collect all document candidates for each statement (sequential part)
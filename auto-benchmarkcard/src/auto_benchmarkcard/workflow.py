@@ -12,9 +12,11 @@ import logging
 import operator
 import os
 import sys
+import time
 import warnings
 from datetime import datetime
-from typing import Annotated, Any, Dict, List, Optional, TypedDict
+from pathlib import Path
+from typing import Annotated, Any, Dict, List, Optional, TypedDict, Union
 
 
 # Conditional logging suppression (will be overridden if --debug is used)
@@ -111,6 +113,8 @@ warnings.filterwarnings("ignore", message=".*TOKENIZERS_PARALLELISM.*")
 from langgraph.graph import END, START, StateGraph
 
 from auto_benchmarkcard.config import Config
+from auto_benchmarkcard.session_index import write_session_manifest
+from auto_benchmarkcard.stage_cache import STAGES, StageCache
 from auto_benchmarkcard.tools.composer.composer_tool import compose_benchmark_card
 from auto_benchmarkcard.tools.docling.docling_tool import extract_paper_with_docling
 from auto_benchmarkcard.tools.extractor.extractor_tool import extract_ids
@@ -250,6 +254,20 @@ class OutputManager:
             os.makedirs(tool_dir, exist_ok=True)
         return tool_dir
 
+    def write_manifest(
+        self, errors: Optional[List[str]] = None, elapsed: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Write the session manifest and add the session to the sessions index.
+
+        Args:
+            errors: Errors the run reported.
+            elapsed: Wall-clock time of the run in seconds.
+
+        Returns:
+            The session manifest.
+        """
+        return write_session_manifest(Path(self.base_dir), errors=errors, elapsed=elapsed)
+
     def get_summary(self) -> Dict[str, str]:
         """Get summary of output locations.
 
@@ -356,10 +374,8 @@ def handle_error(error: Exception, operation: str, state: GraphState) -> Dict[st
     if hasattr(error, "original_error") and error.original_error:
         logger.error("Original error: %s", error.original_error)
 
-    errors = state.get("errors", [])
-    errors.append(error_msg)
-
-    return {"errors": errors, "completed": [f"{operation.lower()} failed"]}
+    # errors is an append-only channel, so parallel branches can both report failures
+    return {"errors": [error_msg], "completed": [f"{operation.lower()} failed"]}
 
 
 class GraphState(TypedDict):
@@ -372,7 +388,7 @@ class GraphState(TypedDict):
     hf_json: Optional[Dict[str, Any]]
     docling_output: Optional[Dict[str, Any]]
     completed: Annotated[list, operator.add]
-    errors: Optional[List[str]]
+    errors: Annotated[List[str], operator.add]
     composed_card: Optional[Dict[str, Any]]
     risk_enhanced_card: Optional[Dict[str, Any]]
     hf_extraction_attempted: Optional[bool]
@@ -381,23 +397,33 @@ class GraphState(TypedDict):
     final_card: Optional[Dict[str, Any]]
 
 
-def orchestrator(state: GraphState) -> Dict[str, str]:
+def orchestrator(state: GraphState) -> Dict[str, Union[str, List[str]]]:
     """Determine next workflow step based on current state.
 
+    The HuggingFace lookup and the paper extraction do not depend on each
+    other, so once both are ready they are returned together and run as
+    parallel branches.
+
     Args:
         state: Current workflow state containing all intermediate results.
 
     Returns:
-        Dictionary with 'next' key indicating the next worker to run.
+        Dictionary with 'next' key indicating the next worker, or list of
+        workers, to run.
     """
     if state["unitxt_json"] is None:
         return {"next": "unitxt_worker"}
     if state["extracted_ids"] is None:
         return {"next": "extractor_worker"}
 
-    # HuggingFace lookup if we have repo ID
+    # Independent metadata fetchers: HuggingFace lookup and paper extraction
+    fetchers = []
     if state["hf_repo"] is not None and state["hf_json"] is None:
-        return {"next": "hf_worker"}
+        fetchers.append("hf_worker")
+    if state.get("extracted_ids", {}).get("paper_url") and state["docling_output"] is None:
+        fetchers.append("docling_worker")
+    if fetchers:
+        return {"next": fetchers if len(fetchers) > 1 else fetchers[0]}
 
     # Try extracting paper URL from HF data if not found in UnitXT
     current_paper_url = state.get("extracted_ids", {}).get("paper_url")
@@ -1022,10 +1048,52 @@ def run_factreasoner(state: GraphState):
         return handle_error(e, "FactReasoner evaluation", state)
 
 
+def cached_stage(stage: str, worker, stage_cache: Optional[StageCache]):
+    """Wrap a workflow worker so it reuses its cached output.
+
+    The worker is skipped when the stage inputs and configuration match a
+    cached run, unless the stage is at or after the cache's from_stage.
+    Successful outputs are cached, failed ones are not.
+
+    Args:
+        stage: Workflow stage name.
+        worker: Worker function taking the workflow state.
+        stage_cache: Stage cache, or None to always run the worker.
+
+    Returns:
+        Worker function for the workflow graph.
+    """
+    if stage_cache is None:
+        return worker
+
+    def run_stage(state: GraphState) -> Dict[str, Any]:
+        key = stage_cache.make_key(stage, state)
+        session_dir = state["output_manager"].base_dir
+
+        if not stage_cache.is_forced(stage):
+            cached = stage_cache.load(stage, key, session_dir)
+            if cached is not None:
+                logger.info("Reusing cached %s output", stage)
+                cached["completed"] = [f"{stage} cached"]
+                return cached
+
+        result = worker(state)
+        if "errors" not in result:
+            update = {k: v for k, v in result.items() if k != "completed"}
+            stage_cache.save(stage, key, update, session_dir)
+        return result
+
+    return run_stage
+
+
 # build the workflow graph
-def build_workflow():
+def build_workflow(stage_cache: Optional[StageCache] = None):
     """Build the LangGraph workflow for metadata extraction.
 
+    Args:
+        stage_cache: Optional stage cache. Stages whose inputs are unchanged
+            since a cached run load their saved output instead of running.
+
     Returns:
         Compiled LangGraph workflow.
     """
@@ -1033,15 +1101,19 @@ def build_workflow():
 
     # Add workflow nodes
     builder.add_node("orchestrator", orchestrator)
-    builder.add_node("unitxt_worker", run_unitxt)
-    builder.add_node("extractor_worker", run_extractor)
-    builder.add_node("hf_extractor_worker", run_hf_extractor)
-    builder.add_node("docling_worker", run_docling)
-    builder.add_node("hf_worker", run_hf)
-    builder.add_node("composer_worker", run_composer)
-    builder.add_node("risk_worker", run_risk_identification)
-    builder.add_node("rag_worker", run_rag)
-    builder.add_node("factreasoner_worker", run_factreasoner)
+    builder.add_node("unitxt_worker", cached_stage("unitxt", run_unitxt, stage_cache))
+    builder.add_node("extractor_worker", cached_stage("extractor", run_extractor, stage_cache))
+    builder.add_node(
+        "hf_extractor_worker", cached_stage("hf_extractor", run_hf_extractor, stage_cache)
+    )
+    builder.add_node("docling_worker", cached_stage("docling", run_docling, stage_cache))
+    builder.add_node("hf_worker", cached_stage("hf", run_hf, stage_cache))
+    builder.add_node("composer_worker", cached_stage("composer", run_composer, stage_cache))
+    builder.add_node("risk_worker", cached_stage("risk", run_risk_identification, stage_cache))
+    builder.add_node("rag_worker", cached_stage("rag", run_rag, stage_cache))
+    builder.add_node(
+        "factreasoner_worker", cached_stage("factreasoner", run_factreasoner, stage_cache)
+    )
 
     # Connect workflow
     builder.add_edge(START, "orchestrator")
@@ -1154,6 +1226,19 @@ def parse_arguments() -> argparse.Namespace:
         help="Number of evidence chunks to retrieve per claim (default=3)",
     )
 
+    # Stage cache configuration
+    parser.add_argument(
+        "--from-stage",
+        choices=STAGES,
+        help="Re-run this stage and all later ones, reusing cached outputs of earlier stages",
+    )
+    parser.add_argument(
+        "--no-stage-cache",
+        dest="stage_cache",
+        action="store_false",
+        help="Run every stage without reading or writing the stage cache",
+    )
+
     return parser.parse_args()
 
 
@@ -1186,12 +1271,15 @@ def create_initial_state(args: argparse.Namespace, output_manager: OutputManager
     }
 
 
-def log_execution_summary(state: Dict[str, Any], output_manager: OutputManager) -> None:
+def log_execution_summary(
+    state: Dict[str, Any], output_manager: OutputManager, elapsed: Optional[float] = None
+) -> None:
     """Log execution summary and results.
 
     Args:
         state: Final workflow state.
         output_manager: Output manager instance.
+        elapsed: End-to-end wall-clock time of the workflow in seconds.
     """
     if state.get("errors"):
         logger.error("Errors encountered:")
@@ -1202,6 +1290,9 @@ def log_execution_summary(state: Dict[str, Any], output_manager: OutputManager)
         final_card_path = output_manager.benchmarkcard_dir
         logger.info(f"Benchmark card saved to: {final_card_path}")
 
+    if elapsed is not None:
+        logger.info(f"Wall-clock time for {state['query']}: {elapsed:.1f}s")
+
     # Debug mode: show detailed workflow steps
     logger.debug("Workflow completed")
     logger.debug("Steps: %s", " → ".join(state["completed"]))
@@ -1246,11 +1337,21 @@ def main() -> None:
         initial_state = create_initial_state(args, output_manager)
 
         # Execute workflow
-        workflow = build_workflow()
+        stage_cache = None
+        if args.stage_cache:
+            stage_cache = StageCache(Config.STAGE_CACHE_DIR, from_stage=args.from_stage)
+        workflow = build_workflow(stage_cache)
+        start_time = time.perf_counter()
         state = workflow.invoke(initial_state)
+        elapsed = time.perf_counter() - start_time
 
         # Log execution summary and results
-        log_execution_summary(state, output_manager)
+        log_execution_summary(state, output_manager, elapsed)
+
+        try:
+            output_manager.write_manifest(state.get("errors"), elapsed)
+        except OSError as e:
+            logger.warning("Could not write session manifest: %s", e)
 
     except KeyboardInterrupt:
         logger.error("Process interrupted by user")
@@ -9,6 +9,10 @@ import os
 import gradio as gr
 import sys
 import base64
+import argparse
+import asyncio
+import json
+import threading
 
 from ai_atlas_nexus import AIAtlasNexus
 
@@ -17,6 +21,14 @@ from ai_atlas_nexus.blocks.inference.params import WMLInferenceEngineParams
 
 #from ai_atlas_nexus.blocks.inference import OllamaInferenceEngine
 
+from intent_cache import IntentTaskCache, normalize_intent
+
+INTENT_CACHE_FILE = os.environ.get("INTENT_CACHE_FILE", ".cache/intent_tasks.json")
+# number of intents per LLM call when resolving a batch
+INTENT_BATCH_SIZE = 16
+# number of Submit clicks that run at the same time
+INFERENCE_CONCURRENCY = 8
+
 
 def load_logo_as_base64(logo_path):
     """Load SVG logo and convert to base64 for embedding"""
@@ -29,29 +41,72 @@ def load_logo_as_base64(logo_path):
         return None
 
 
+def _as_list(value):
+    """Slot values are either a single id or a list of ids"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
 class CapabilitiesNavigator:
     """Main application class for capabilities navigation"""
 
-    def __init__(self):
+    CAPABILITIES_TAXONOMY = "ibm-ai-capabilities"
+
+    def __init__(self, intent_cache_path=INTENT_CACHE_FILE, intent_cache_size=1000):
         """Initialize AI Atlas Nexus"""
         self.aan = AIAtlasNexus()
         self.inference_engine = None
+        self.model_name = None
+        # guards swapping the engine and model together while requests are running
+        self._engine_lock = threading.Lock()
+
+        # intent -> AI tasks, and the LLM calls currently running for the async handler
+        self.intent_cache = IntentTaskCache(intent_cache_path, max_size=intent_cache_size)
+        self._inflight = {}
+
+        self.refresh()
 
         print("✓ AI Atlas Nexus initialized")
-        print(f"  Loaded {len(self.aan.get_all("capabilities"))} capabilities")
-        print(f"  Loaded {len(self.aan.get_all("aitasks"))} AI tasks")
+        print(f"  Loaded {len(self.capabilities)} capabilities")
+        print(f"  Loaded {len(self.tasks)} AI tasks")
+
+    def refresh(self):
+        """(Re)build the lookup indexes, call again after the AI Atlas Nexus data has changed"""
+        self.tasks = self.aan.get_all("aitasks")
+        self.capabilities = self.aan.get_all("capabilities")
+        self.intrinsics = self.aan.get_all("adapters")
+
+        # id -> object
+        self.tasks_by_id = {task.id: task for task in self.tasks}
+        self.capabilities_by_id = {cap.id: cap for cap in self.capabilities}
+        self.intrinsics_by_id = {intr.id: intr for intr in self.intrinsics}
+
+        # task id -> capabilities of the IBM AI Capabilities Framework, in catalogue order
+        self.capabilities_by_task = {}
+        for cap in self.capabilities:
+            if self.CAPABILITIES_TAXONOMY not in _as_list(cap.isDefinedByTaxonomy):
+                continue
+            for task_id in _as_list(cap.requiredByTask):
+                self.capabilities_by_task.setdefault(task_id, []).append(cap)
+
+        # capability id -> intrinsics implementing it
+        self.intrinsics_by_capability = {}
+        for intr in self.intrinsics:
+            for cap_id in _as_list(getattr(intr, "implementsCapability", None)):
+                self.intrinsics_by_capability.setdefault(cap_id, []).append(intr)
 
     def configure_inference(self, model_name="granite3.3:8b", api_url="http://localhost:11434"):
         """Configure Ollama inference engine"""
         try:
             """
-            self.inference_engine = OllamaInferenceEngine(
+            engine = OllamaInferenceEngine(
                 model_name_or_path=model_name,
                 credentials={"api_url": api_url},
                 parameters={"temperature": 0.1, "num_predict": 500}
             )
             """
-            self.inference_engine = WMLInferenceEngine(
+            engine = WMLInferenceEngine(
                 model_name_or_path=model_name,
                 credentials={
                     "api_key": os.environ["WML_API_KEY"],
@@ -62,25 +117,26 @@ class CapabilitiesNavigator:
                     max_new_tokens=500, decoding_method="greedy", repetition_penalty=1
                 ),  # type: ignore
             )
+            with self._engine_lock:
+                self.inference_engine, self.model_name = engine, model_name
             return f"✓ Inference engine configured: {model_name}"
         except Exception as e:
             return f"✗ Failed to configure inference: {str(e)}"
 
-    def identify_tasks_from_intent(self, user_intent):
-        """Step 1: Identify AI tasks from natural language intent"""
+    def identify_tasks_from_intent(self, user_intent, inference=None):
+        """Step 1: Identify AI tasks from natural language intent
+
+        inference is the (engine, model name) pair to use, by default the currently configured one.
+        """
         if not user_intent.strip():
             return "Please enter a use case description.", []
 
-        if not self.inference_engine:
+        inference = inference or self._inference()
+        if not inference[0]:
             return "Please configure the inference engine first.", []
 
         try:
-            task_predictions = self.aan.identify_ai_tasks_from_usecases(
-                usecases=[user_intent],
-                inference_engine=self.inference_engine,
-            )
-
-            identified_tasks = task_predictions[0].prediction
+            identified_tasks = self.identify_tasks_batch([user_intent], inference=inference)[0]
 
             # Format output
             output = "### Identified AI Tasks:\n\n"
@@ -92,6 +148,70 @@ class CapabilitiesNavigator:
         except Exception as e:
             return f"Error identifying tasks: {str(e)}", []
 
+    def _inference(self):
+        """The configured (engine, model name), taken once per request so a model change does not
+        swap the engine under a running request"""
+        with self._engine_lock:
+            return self.inference_engine, self.model_name
+
+    @staticmethod
+    def _cache_context(inference):
+        """Model and engine part of the intent cache key"""
+        engine, model_name = inference
+        return model_name, type(engine).__name__ if engine else None
+
+    def identify_tasks_batch(self, intents, batch_size=INTENT_BATCH_SIZE, inference=None):
+        """Identify AI tasks for a list of intents
+
+        Cached intents are answered from the intent cache, the distinct remaining intents are sent to the
+        LLM in batches of batch_size and cached. Returns the list of tasks for every intent.
+        """
+        inference = inference or self._inference()
+        model, engine = self._cache_context(inference)
+        results = [self.intent_cache.get(intent, model, engine) for intent in intents]
+        hits = sum(tasks is not None for tasks in results)
+
+        # normalized intent -> first original spelling, so duplicates are predicted once
+        missing = {}
+        for intent, tasks in zip(intents, results):
+            if tasks is None:
+                missing.setdefault(normalize_intent(intent), intent)
+
+        predicted = {}
+        pending = list(missing.items())
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            task_predictions = self.aan.identify_ai_tasks_from_usecases(
+                usecases=[intent for _, intent in batch],
+                inference_engine=inference[0],
+            )
+            tasks = [prediction.prediction for prediction in task_predictions]
+            self.intent_cache.put_many(zip([intent for _, intent in batch], tasks), model, engine)
+            predicted.update(zip([key for key, _ in batch], tasks))
+
+        print(f"[intent cache] {hits}/{len(intents)} intents cached, {len(missing)} identified")
+        return [
+            tasks if tasks is not None else predicted[normalize_intent(intent)]
+            for intent, tasks in zip(intents, results)
+        ]
+
+    async def identify_tasks_from_intent_async(self, user_intent):
+        """identify_tasks_from_intent without blocking the event loop
+
+        The LLM call runs in a worker thread, so requests of several users run concurrently, and
+        concurrent requests for the same intent share one call.
+        """
+        inference = self._inference()
+        key = self.intent_cache.make_key(user_intent, *self._cache_context(inference))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                asyncio.to_thread(self.identify_tasks_from_intent, user_intent, inference)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
     def get_capabilities_for_tasks(self, tasks):
         """Step 2: Map tasks to required capabilities"""
         if not tasks:
@@ -107,11 +227,7 @@ class CapabilitiesNavigator:
             print(f"[DEBUG get_capabilities_for_tasks] Processing task: {task} -> {task_id}")
 
             try:
-                capabilities = self.aan.query(
-                    class_name="capabilities", 
-                    requiredByTask=task_id,
-                    isDefinedByTaxonomy="ibm-ai-capabilities"
-                )
+                capabilities = self.capabilities_by_task.get(task_id, [])
 
                 print(f"[DEBUG get_capabilities_for_tasks] Found {len(capabilities)} capabilities")
 
@@ -146,16 +262,13 @@ class CapabilitiesNavigator:
         for cap_id in capability_ids:
             try:
                 # Get capability details
-                all_caps = self.aan.get_all("capabilities")
-                capability = next((c for c in all_caps if c.id == cap_id), None)
+                capability = self.capabilities_by_id.get(cap_id)
 
                 if not capability:
                     continue
 
                 # Get intrinsics for this capability
-                intrinsics = self.aan.query(class_name="adapters",
-                    implementsCapability=cap_id,   
-                )
+                intrinsics = self.intrinsics_by_capability.get(cap_id, [])
 
                 if intrinsics:
                     output += f"**{capability.name}** ({len(intrinsics)} implementation(s))\n\n"
@@ -192,8 +305,7 @@ class CapabilitiesNavigator:
                 return results["tasks"], "", ""
         else:
             # Use all available tasks
-            all_tasks = self.aan.get_all("aitasks")
-            identified_tasks = [task.name for task in all_tasks]
+            identified_tasks = [task.name for task in self.tasks]
             results["tasks"] = "### Using All Available Tasks\n\n" + "\n".join([f"- {t}" for t in identified_tasks])
 
         # Step 2: Map to capabilities
@@ -289,8 +401,8 @@ def create_ui():
         </div>
         <p class="description">
         This tool helps you identify the AI capabilities and model intrinsics needed to implement your use case.
-        Loaded <strong>{len(navigator.aan.get_all("capabilities"))} capabilities</strong> and
-        <strong>{len(navigator.aan.get_all("aitasks"))} AI tasks</strong> from the IBM AI Capabilities Framework.
+        Loaded <strong>{len(navigator.capabilities)} capabilities</strong> and
+        <strong>{len(navigator.tasks)} AI tasks</strong> from the IBM AI Capabilities Framework.
         </p>
         """)
 
@@ -364,7 +476,7 @@ def create_ui():
             )
 
             # Combined handler that shows loading and runs inference
-            def handle_inference_with_loading(intent, model_name, api_url):
+            async def handle_inference_with_loading(intent, model_name, api_url=None):
                 print(f"[DEBUG] handle_inference_with_loading called")
                 print(f"[DEBUG] Intent length: {len(intent) if intent else 0}")
                 print(f"[DEBUG] Intent preview: {intent[:100] if intent else 'EMPTY'}...")
@@ -384,7 +496,7 @@ def create_ui():
                         )
 
                 print("[DEBUG] Identifying tasks from intent...")
-                _, tasks = navigator.identify_tasks_from_intent(intent)
+                _, tasks = await navigator.identify_tasks_from_intent_async(intent)
                 print(f"[DEBUG] Identified tasks: {tasks}")
                 print(f"[DEBUG] Number of tasks: {len(tasks) if tasks else 0}")
                 print(f"[DEBUG] Tasks type: {type(tasks)}")
@@ -412,7 +524,8 @@ def create_ui():
                 fn=handle_inference_with_loading,
                 inputs=[intent_input, model_input, #api_url_input
                         ],
-                outputs=[loading_msg, task_selector, task_section, cascade_group]
+                outputs=[loading_msg, task_selector, task_section, cascade_group],
+                concurrency_limit=INFERENCE_CONCURRENCY
             )
 
             # Step 3: Show loading message immediately when task is selected
@@ -485,8 +598,7 @@ def create_ui():
 
         with gr.Tab("📋 Explore Tasks"):
 
-            all_tasks = navigator.aan.get_all("aitasks")
-            task_names = [task.name for task in all_tasks]
+            task_names = [task.name for task in navigator.tasks]
 
             task_dropdown = gr.Dropdown(
                 choices=task_names,
@@ -517,10 +629,8 @@ def create_ui():
 
         with gr.Tab("🔍 Browse Capabilities"):
 
-            all_capabilities = navigator.aan.get_all("capabilities")
-
             cap_data = []
-            for cap in sorted(all_capabilities, key=lambda x: x.isPartOf):
+            for cap in sorted(navigator.capabilities, key=lambda x: x.isPartOf):
                 desc = cap.description[:100] + "..." if hasattr(cap, 'description') and cap.description and len(cap.description) > 100 else getattr(cap, 'description', '')
                 cap_data.append([cap.name, cap.id, cap.isPartOf, desc])
 
@@ -567,7 +677,43 @@ def create_ui():
     return app
 
 
+def run_batch(intents_file, output_file, model_name):
+    """Identify AI tasks for every intent in a file (one intent per line, or a JSON list) through the intent cache"""
+    with open(intents_file, "r", encoding="utf-8") as f:
+        content = f.read()
+    if intents_file.endswith(".json"):
+        intents = json.loads(content)
+    else:
+        intents = [line.strip() for line in content.splitlines() if line.strip()]
+
+    navigator = CapabilitiesNavigator()
+    print(navigator.configure_inference(model_name))
+    if not navigator.inference_engine:
+        return
+
+    results = [
+        {"intent": intent, "tasks": tasks}
+        for intent, tasks in zip(intents, navigator.identify_tasks_batch(intents))
+    ]
+    if output_file:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Wrote tasks for {len(results)} intents to {output_file}")
+    else:
+        print(json.dumps(results, indent=2))
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", help="file of intents to resolve instead of launching the UI")
+    parser.add_argument("--output", help="JSON file for the batch results")
+    parser.add_argument("--model", default="ibm/granite-3-3-8b-instruct")
+    args = parser.parse_args()
+
+    if args.batch:
+        run_batch(args.batch, args.output, args.model)
+        sys.exit(0)
+
     app = create_ui()
     app.launch(
         server_name="127.0.0.1",
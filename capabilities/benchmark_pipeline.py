@@ -0,0 +1,106 @@
+"""
+Benchmark of the no-LLM full pipeline (all tasks → capabilities → intrinsics).
+
+Compares the lookups through aan.query/aan.get_all per task and per capability, as the navigator
+did before, with the indexes the navigator now builds at start-up, and checks both give the same output.
+
+    python benchmark_pipeline.py --repeat 20
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+from app import CapabilitiesNavigator
+
+
+class QueryNavigator(CapabilitiesNavigator):
+    """The navigator lookups as they were before the indexes."""
+
+    def get_capabilities_for_tasks(self, tasks):
+        output = ""
+        all_capabilities = set()
+        for task in tasks:
+            task_id = task.lower().replace(" ", "-")
+            capabilities = self.aan.query(
+                class_name="capabilities",
+                requiredByTask=task_id,
+                isDefinedByTaxonomy="ibm-ai-capabilities"
+            )
+            if capabilities:
+                for cap in capabilities:
+                    output += f"- **{cap.name}** (`{cap.id}`)\n"
+                    if hasattr(cap, 'description') and cap.description:
+                        desc = cap.description[:150] + "..." if len(cap.description) > 150 else cap.description
+                        output += f"  - {desc}\n"
+                    all_capabilities.add(cap.id)
+                output += "\n"
+            else:
+                output += "*No capability mappings found*\n\n"
+        return output, list(all_capabilities)
+
+    def get_intrinsics_for_capabilities(self, capability_ids):
+        output = ""
+        for cap_id in capability_ids:
+            all_caps = self.aan.get_all("capabilities")
+            capability = next((c for c in all_caps if c.id == cap_id), None)
+            if not capability:
+                continue
+            intrinsics = self.aan.query(class_name="adapters", implementsCapability=cap_id)
+            if intrinsics:
+                output += f"**{capability.name}** ({len(intrinsics)} implementation(s))\n\n"
+                for intr in intrinsics:
+                    output += f"- **{intr.name}** (`{intr.id}`)\n"
+                    if hasattr(intr, 'description') and intr.description:
+                        desc = intr.description[:200] + "..." if len(intr.description) > 200 else intr.description
+                        output += f"  - {desc}\n"
+                output += "\n"
+            else:
+                output += f"**{capability.name}**\n\n*No intrinsics found for this capability*\n\n"
+        return output
+
+    def process_full_pipeline(self, user_intent, use_llm=True):
+        identified_tasks = [task.name for task in self.aan.get_all("aitasks")]
+        tasks_output = "### Using All Available Tasks\n\n" + "\n".join([f"- {t}" for t in identified_tasks])
+        capabilities_output, capability_ids = self.get_capabilities_for_tasks(identified_tasks)
+        return tasks_output, capabilities_output, self.get_intrinsics_for_capabilities(capability_ids)
+
+
+def run(navigator, repeat):
+    # the navigator prints debug output for every task
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = navigator.process_full_pipeline("", use_llm=False)
+        elapsed = (time.perf_counter() - start) / repeat
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    navigator = CapabilitiesNavigator()
+    print(f"Navigator with indexes initialized in {time.perf_counter() - start:.2f}s")
+
+    # same AI Atlas Nexus instance, only the lookups differ
+    query_navigator = QueryNavigator.__new__(QueryNavigator)
+    query_navigator.aan = navigator.aan
+    query_navigator.inference_engine = None
+
+    old, old_time = run(query_navigator, args.repeat)
+    new, new_time = run(navigator, args.repeat)
+
+    # capability ids come from a set, so the order of the intrinsics may differ
+    assert old[:2] == new[:2], "Capabilities differ"
+    assert sorted(old[2].split("\n\n")) == sorted(new[2].split("\n\n")), "Intrinsics differ"
+
+    print(f"aan.query lookups: {old_time * 1000:.1f}ms per pipeline")
+    print(f"indexed lookups:   {new_time * 1000:.1f}ms per pipeline ({old_time / new_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
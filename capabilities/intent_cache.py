@@ -0,0 +1,87 @@
+"""
+Persistent LRU cache of intent → AI task predictions
+"""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+
+def normalize_intent(intent):
+    """Intents that differ only in case or whitespace share a cache entry"""
+    return re.sub(r"\s+", " ", intent).strip().lower()
+
+
+class IntentTaskCache:
+    """
+    Identified AI tasks keyed by (normalized intent, model name, inference engine).
+
+    The least recently used entries are evicted above max_size. The cache is stored as a JSON list
+    of entries in LRU order and rewritten atomically after every change, so it survives restarts.
+    """
+
+    def __init__(self, path=None, max_size=1000):
+        self.path = path
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for entry in json.load(f):
+                        self.entries[self.make_key(entry["intent"], entry["model"], entry["engine"])] = entry
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Could not load intent cache {path}: {e}")
+                self.entries.clear()
+
+    @staticmethod
+    def make_key(intent, model, engine):
+        return (normalize_intent(intent), model or "", engine or "")
+
+    def get(self, intent, model, engine):
+        """Cached tasks for the intent or None"""
+        key = self.make_key(intent, model, engine)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return list(entry["tasks"])
+
+    def put(self, intent, model, engine, tasks):
+        self.put_many([(intent, tasks)], model, engine)
+
+    def put_many(self, results, model, engine):
+        """Store (intent, tasks) pairs identified with the same model and engine"""
+        with self._lock:
+            for intent, tasks in results:
+                key = self.make_key(intent, model, engine)
+                self.entries[key] = {
+                    "intent": key[0],
+                    "model": key[1],
+                    "engine": key[2],
+                    "tasks": list(tasks),
+                }
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+            self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(list(self.entries.values()), f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,83 @@
+"""
+Check the incremental JSON decoding of the JSON prompt adapter.
+
+Decodes JSON arrays and newline delimited JSON with chunk sizes down to a single
+character, so values split across chunk boundaries are exercised, and checks that
+data following a top-level array is reported instead of silently dropped.
+
+    python scripts/check_json_stream.py
+"""
+
+import io
+import json
+
+from gaf_guard.clients.stream_adaptors.json_adapter import iter_json_values
+
+
+VALUES = [
+    {"prompt": "What is the capital of France?", "id": 1},
+    {"prompt": "Ünïcödé, \"quotes\" and \\ escapes", "tags": ["a", "b"]},
+    [1, 2, 3],
+    12345.678,
+    "a string",
+    None,
+]
+
+CHUNK_SIZES = [1, 2, 3, 7, 64, 1 << 16]
+
+
+def decode(text, chunk_size):
+    return list(iter_json_values(io.StringIO(text), chunk_size=chunk_size))
+
+
+def check_decodes():
+    inputs = {
+        "array": json.dumps(VALUES),
+        "pretty array": json.dumps(VALUES, indent=2),
+        "empty array": "[]",
+        "ndjson": "\n".join(json.dumps(value) for value in VALUES[:2] + VALUES[3:]),
+        "ndjson, blank lines": "\n\n".join(json.dumps(v) for v in VALUES[:2]) + "\n\n",
+    }
+    expected = {
+        "array": VALUES,
+        "pretty array": VALUES,
+        "empty array": [],
+        "ndjson": VALUES[:2] + VALUES[3:],
+        "ndjson, blank lines": VALUES[:2],
+    }
+    for name, text in inputs.items():
+        for chunk_size in CHUNK_SIZES:
+            decoded = decode(text, chunk_size)
+            assert decoded == expected[name], (name, chunk_size, decoded)
+
+
+def check_data_after_array():
+    # only whitespace may follow a top-level array
+    for chunk_size in CHUNK_SIZES:
+        assert decode("[1, 2]  \n\n", chunk_size) == [1, 2]
+
+    # newline delimited JSON whose first value is an array must not lose the rest
+    for text in ['[1,2]\n{"a":1}\n{"b":2}\n', "[1]\n2", '[]{"a":1}']:
+        for chunk_size in CHUNK_SIZES:
+            try:
+                decode(text, chunk_size)
+            except ValueError:
+                continue
+            raise AssertionError(f"no error for {text!r} with chunk size {chunk_size}")
+
+
+def check_invalid():
+    for text in ['{"a": 1', "[1, 2", "[1, }"]:
+        for chunk_size in CHUNK_SIZES:
+            try:
+                decode(text, chunk_size)
+            except ValueError:
+                continue
+            raise AssertionError(f"no error for {text!r} with chunk size {chunk_size}")
+
+
+if __name__ == "__main__":
+    check_decodes()
+    check_data_after_array()
+    check_invalid()
+    print("JSON stream decoding checks passed")
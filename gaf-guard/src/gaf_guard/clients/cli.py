@@ -171,6 +171,8 @@ async def run_cli_client(host, port):
                                 if "JSON" in STREAM_ADAPTORS:
                                     prompt = STREAM_ADAPTORS["JSON"].next()
                                 if not prompt or "JSON" not in STREAM_ADAPTORS:
+                                    if "JSON" in STREAM_ADAPTORS:
+                                        STREAM_ADAPTORS["JSON"].disconnect()
                                     console.print(
                                         f"[bold blue]{message.content}[/bold blue]: [bold]JSON[/bold]"
                                     )
@@ -180,9 +182,7 @@ async def run_cli_client(host, port):
                                     )
                                     STREAM_ADAPTORS["JSON"] = get_adapter(
                                         "JSON",
-                                        config={
-                                            "byte_data": Path(prompt_file).read_bytes()
-                                        },
+                                        config={"file_path": prompt_file},
                                     )
                                     prompt = STREAM_ADAPTORS["JSON"].next()
                                 input_message_content = {message.accept: prompt}
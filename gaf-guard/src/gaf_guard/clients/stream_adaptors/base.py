@@ -2,11 +2,24 @@
 Base classes and interfaces for streaming data adapters.
 """
 
+import queue
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Iterator, Optional
 
+from gaf_guard.toolkit.logging import configure_logger
+
+
+logger = configure_logger(__name__)
+
+DEFAULT_QUEUE_SIZE = 128
+PUT_TIMEOUT = 0.5
+
+# Put on the message queue by the producer once the source is exhausted
+_END_OF_STREAM = object()
+
 
 @dataclass
 class StreamMessage:
@@ -55,3 +68,136 @@ class StreamAdapter(ABC):
     def is_connected(self) -> bool:
         """Check if adapter is connected."""
         return self._connected
+
+
+class QueuedStreamAdapter(StreamAdapter):
+    """
+    Base class for adapters whose source is read by a background producer.
+
+    The producer (stream_worker) reads prompts from the source into a bounded queue
+    of config["queue_size"] messages. When the queue is full the producer blocks, so a
+    slow consumer holds back the source instead of buffering it in memory.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.queue_size = config.get("queue_size", DEFAULT_QUEUE_SIZE)
+        self.stop_event = threading.Event()
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._finished = False
+
+    @abstractmethod
+    def open(self) -> None:
+        """Open the streaming source. Called by connect() before the producer starts."""
+        pass
+
+    @abstractmethod
+    def produce(self) -> Iterator[Any]:
+        """
+        Read prompts from the source. Runs in the producer thread and should return
+        soon after stop_event is set.
+
+        Yields:
+            Prompts in source order
+        """
+        pass
+
+    def close(self) -> None:
+        """Release the streaming source. Called by disconnect()."""
+        pass
+
+    def connect(self) -> None:
+        """Open the source and start the background producer."""
+        try:
+            self.open()
+        except Exception as e:
+            raise ConnectionError(
+                f"Failed to open {self.__class__.__name__} source: {e}"
+            )
+
+        self.stop_event.clear()
+        self._finished = False
+        self._queue = queue.Queue(maxsize=self.queue_size)
+        self._worker = threading.Thread(
+            target=stream_worker,
+            args=(self, self._queue, self.stop_event),
+            name=f"{self.__class__.__name__}-producer",
+            daemon=True,
+        )
+        self._connected = True
+        self._worker.start()
+
+    def disconnect(self) -> None:
+        """Stop the background producer and close the source."""
+        self.stop_event.set()
+        if self._queue is not None:
+            # unblock a producer waiting on a full queue
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=5)
+        self.close()
+        self._connected = False
+
+    def next(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the next message, waiting for the producer if needed.
+
+        Args:
+            timeout: Seconds to wait for a message, None waits until one arrives
+
+        Returns:
+            The next message, or None at the end of the stream or on timeout
+        """
+        if not self._connected:
+            raise RuntimeError(
+                f"{self.__class__.__name__} is not connected. Call connect() first."
+            )
+        if self._finished:
+            return None
+
+        try:
+            message = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        if message is _END_OF_STREAM:
+            self._finished = True
+            return None
+        return message
+
+
+def _put(message_queue: queue.Queue, message: Any, stop_event: threading.Event):
+    """Blocking put that gives up once the stream is stopped."""
+    while not stop_event.is_set():
+        try:
+            message_queue.put(message, timeout=PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def stream_worker(
+    adapter: QueuedStreamAdapter,
+    message_queue: queue.Queue,
+    stop_event: threading.Event,
+):
+    """Background thread worker to consume streaming data."""
+    try:
+        for index, prompt in enumerate(adapter.produce(), start=1):
+            message = StreamMessage(
+                timestamp=datetime.now(),
+                prompt_index=str(index),
+                prompt=prompt,
+            ).__dict__
+            if not _put(message_queue, message, stop_event):
+                return
+    except Exception as e:
+        logger.error(f"Stream error in {adapter.__class__.__name__}: {e}")
+    finally:
+        _put(message_queue, _END_OF_STREAM, stop_event)
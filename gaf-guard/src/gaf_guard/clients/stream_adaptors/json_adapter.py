@@ -1,56 +1,135 @@
 """
-Redis streaming adapter implementation.
+JSON streaming adapter implementation.
 """
 
+import io
 import json
-from datetime import datetime
-from io import StringIO
-from typing import Any, Dict, Iterator
+from typing import IO, Any, Dict, Iterator
 
-from gaf_guard.clients.stream_adaptors.base import StreamAdapter, StreamMessage
+from gaf_guard.clients.stream_adaptors.base import QueuedStreamAdapter
 
 
-class JSONAdapter(StreamAdapter):
-    """Adapter for Redis Streams."""
+CHUNK_SIZE = 1 << 16
+WHITESPACE = " \t\r\n"
+
+
+def iter_json_values(stream: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Incrementally decode the values of a JSON array or of newline delimited JSON.
+
+    Only the value being decoded and one chunk are held in memory, so the size of the
+    input is not bounded by the available memory.
+
+    Args:
+        stream: Text stream with a JSON array, or JSON values separated by whitespace
+        chunk_size: Number of characters read at a time
+
+    Yields:
+        The decoded values in order
+
+    Raises:
+        ValueError: If a top-level JSON array is not closed, or anything but
+            whitespace follows it
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+    in_array = None
+
+    while True:
+        # skip whitespace, and the value separators of an array
+        separators = WHITESPACE + "," if in_array else WHITESPACE
+        while True:
+            while pos < len(buffer) and buffer[pos] in separators:
+                pos += 1
+            if pos < len(buffer) or eof:
+                break
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+
+        if pos >= len(buffer):
+            if in_array:
+                raise ValueError("Unexpected end of input in a JSON array.")
+            return
+
+        if in_array is None:
+            in_array = buffer[pos] == "["
+            if in_array:
+                pos += 1
+                continue
+        if in_array and buffer[pos] == "]":
+            # only whitespace may follow the array; newline delimited JSON that starts
+            # with an array would otherwise lose every value after it
+            pos += 1
+            while True:
+                while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                    pos += 1
+                if pos < len(buffer):
+                    raise ValueError(
+                        "Unexpected data after the top-level JSON array: "
+                        f"{buffer[pos : pos + 20]!r}. Newline delimited JSON must not "
+                        "start with an array value."
+                    )
+                if eof:
+                    return
+                chunk = stream.read(chunk_size)
+                eof = not chunk
+                buffer, pos = chunk, 0
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            value, end = None, None
+            if eof:
+                raise
+
+        # the value may continue in the next chunk, e.g. a truncated object or number
+        if end is None or (end == len(buffer) and not eof):
+            chunk = stream.read(max(chunk_size, len(buffer) - pos))
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        pos = end
+        yield value
+
+
+class JSONAdapter(QueuedStreamAdapter):
+    """
+    Adapter for JSON prompt files, either a JSON array or newline delimited JSON.
+
+    Config:
+        file_path: Path of the prompt file, read incrementally from disk
+        byte_data: Contents of the prompt file, when it was uploaded
+        queue_size: Maximum number of decoded prompts waiting to be consumed
+    """
 
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize JSON adapter.
         """
         super().__init__(config)
+        self.input_file = None
 
-    def connect(self) -> None:
-        """Connect to Redis server."""
-        try:
-            stringio = StringIO(self.config["byte_data"].decode("utf-8"))
-            self.input_file = json.loads(stringio.read())
-            self._connected = True
-        except Exception as e:
-            raise ConnectionError(f"Failed to load JSON file: {e}")
-
-    def disconnect(self) -> None:
-        """Disconnect from JSON."""
-        self._connected = False
-
-    def next(self) -> Iterator[StreamMessage]:
-        """Return next message from JSON Stream."""
-        if not hasattr(self, "message_gen"):
-            self.message_gen = self.create_message_gen()
-        try:
-            return next(self.message_gen)
-        except StopIteration:
-            return None
+    def open(self) -> None:
+        """Open the prompt file."""
+        if self.config.get("file_path"):
+            self.input_file = open(self.config["file_path"], "r", encoding="utf-8-sig")
+        elif self.config.get("byte_data") is not None:
+            self.input_file = io.TextIOWrapper(
+                io.BytesIO(self.config["byte_data"]), encoding="utf-8-sig"
+            )
+        else:
+            raise ValueError("JSON adapter needs a file_path or byte_data.")
 
-    def create_message_gen(self):
-        if not self._connected:
-            raise RuntimeError("Not connected to JSON file. Call connect() first.")
-        try:
-            for index, message in enumerate(self.input_file, start=1):
-                yield StreamMessage(
-                    timestamp=datetime.now(),
-                    prompt_index=str(index),
-                    prompt=message,
-                ).__dict__
-
-        except Exception as e:
-            print(f"Error consuming message from JSON file: {e}")
+    def close(self) -> None:
+        """Close the prompt file."""
+        if self.input_file is not None:
+            self.input_file.close()
+            self.input_file = None
+
+    def produce(self) -> Iterator[Any]:
+        for prompt in iter_json_values(self.input_file):
+            if self.stop_event.is_set():
+                return
+            yield prompt
@@ -0,0 +1,41 @@
+"""
+In-process queue streaming adapter implementation.
+"""
+
+import queue
+from typing import Any, Dict, Iterator
+
+from gaf_guard.clients.stream_adaptors.base import QueuedStreamAdapter
+
+
+POLL_TIMEOUT = 0.5
+
+
+class QueueAdapter(QueuedStreamAdapter):
+    """
+    Adapter for prompts put on a queue.Queue by another thread of the same process.
+
+    A bounded source queue makes the publishing thread wait while the consumer is behind.
+
+    Config:
+        queue: The source queue.Queue, a None item ends the stream
+        queue_size: Maximum number of prompts waiting to be consumed
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.source = config.get("queue")
+
+    def open(self) -> None:
+        if self.source is None:
+            raise ValueError("Queue adapter needs a queue.")
+
+    def produce(self) -> Iterator[Any]:
+        while not self.stop_event.is_set():
+            try:
+                prompt = self.source.get(timeout=POLL_TIMEOUT)
+            except queue.Empty:
+                continue
+            if prompt is None:
+                return
+            yield prompt
@@ -0,0 +1,90 @@
+"""
+Local socket streaming adapter implementation.
+"""
+
+import socket
+from typing import Any, Dict, Iterator, Optional
+
+from gaf_guard.clients.stream_adaptors.base import QueuedStreamAdapter
+from gaf_guard.clients.stream_adaptors.tail_adapter import parse_line
+
+
+POLL_TIMEOUT = 0.5
+RECV_SIZE = 1 << 16
+
+
+class SocketAdapter(QueuedStreamAdapter):
+    """
+    Adapter that listens on a local TCP socket for prompts, one prompt per line.
+
+    Lines may hold JSON or plain text. Clients are served one at a time. While the
+    queue is full no more is read from the socket, so TCP flow control slows the
+    sender down.
+
+    Config:
+        host: Interface to listen on (default 127.0.0.1)
+        port: Port to listen on, 0 picks a free port (default 0)
+        max_connections: End the stream after this many clients disconnected,
+            None serves clients until disconnect() (default None)
+        queue_size: Maximum number of prompts waiting to be consumed
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.host = config.get("host", "127.0.0.1")
+        self.port = config.get("port", 0)
+        self.max_connections: Optional[int] = config.get("max_connections")
+        self.server = None
+
+    @property
+    def address(self):
+        """Host and port the adapter listens on."""
+        return self.server.getsockname() if self.server else None
+
+    def open(self) -> None:
+        """Start listening."""
+        self.server = socket.create_server((self.host, self.port))
+        self.server.settimeout(POLL_TIMEOUT)
+
+    def close(self) -> None:
+        """Stop listening."""
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+
+    def _accept(self) -> Optional[socket.socket]:
+        while not self.stop_event.is_set():
+            try:
+                connection, _ = self.server.accept()
+                connection.settimeout(POLL_TIMEOUT)
+                return connection
+            except socket.timeout:
+                continue
+        return None
+
+    def _read_lines(self, connection: socket.socket) -> Iterator[Any]:
+        buffer = b""
+        while not self.stop_event.is_set():
+            try:
+                data = connection.recv(RECV_SIZE)
+            except socket.timeout:
+                continue
+            if not data:
+                break
+            *lines, buffer = (buffer + data).split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield parse_line(line.decode("utf-8").strip())
+        # the client closed without a trailing newline
+        if buffer.strip() and not self.stop_event.is_set():
+            yield parse_line(buffer.decode("utf-8").strip())
+
+    def produce(self) -> Iterator[Any]:
+        served = 0
+        while self.max_connections is None or served < self.max_connections:
+            connection = self._accept()
+            if connection is None:
+                return
+            with connection:
+                yield from self._read_lines(connection)
+            served += 1
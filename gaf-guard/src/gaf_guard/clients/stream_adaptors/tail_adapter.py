@@ -0,0 +1,102 @@
+"""
+File tail streaming adapter implementation.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from gaf_guard.clients.stream_adaptors.base import QueuedStreamAdapter
+
+
+def parse_line(line: str) -> Any:
+    """A JSON encoded prompt, or the line itself for plain text prompt logs."""
+    try:
+        return json.loads(line)
+    except ValueError:
+        return line
+
+
+class FileTailAdapter(QueuedStreamAdapter):
+    """
+    Adapter that follows a growing prompt log, one prompt per line, like tail -f.
+
+    Lines may hold JSON or plain text. A partially written last line is held back
+    until its newline arrives, and the file is reopened when it is rotated or truncated.
+
+    Config:
+        file_path: Path of the prompt log
+        from_start: Also stream the lines already in the file (default True)
+        poll_interval: Seconds between checks for new lines (default 0.5)
+        idle_timeout: End the stream after this many seconds without new lines,
+            None follows the file until disconnect() (default None)
+        queue_size: Maximum number of prompts waiting to be consumed
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.file_path = config.get("file_path")
+        self.from_start = config.get("from_start", True)
+        self.poll_interval = config.get("poll_interval", 0.5)
+        self.idle_timeout: Optional[float] = config.get("idle_timeout")
+        self.log_file = None
+
+    def open(self) -> None:
+        """Open the prompt log."""
+        if not self.file_path:
+            raise ValueError("File tail adapter needs a file_path.")
+        self.log_file = open(self.file_path, "r", encoding="utf-8")
+        if not self.from_start:
+            self.log_file.seek(0, os.SEEK_END)
+
+    def close(self) -> None:
+        """Close the prompt log."""
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    def _reopen_if_replaced(self) -> bool:
+        """Reopen the log from the start if it was rotated or truncated."""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            # rotated and not yet recreated
+            return False
+        current = os.fstat(self.log_file.fileno())
+        if (stat.st_dev, stat.st_ino) != (current.st_dev, current.st_ino) or (
+            stat.st_size < self.log_file.tell()
+        ):
+            self.log_file.close()
+            self.log_file = open(self.file_path, "r", encoding="utf-8")
+            return True
+        return False
+
+    def produce(self) -> Iterator[Any]:
+        partial_line = ""
+        last_activity = time.monotonic()
+        while not self.stop_event.is_set():
+            line = self.log_file.readline()
+            if line:
+                last_activity = time.monotonic()
+                if not line.endswith("\n"):
+                    partial_line += line
+                    continue
+                line, partial_line = partial_line + line, ""
+                if line.strip():
+                    yield parse_line(line.strip())
+                continue
+
+            if self._reopen_if_replaced():
+                partial_line = ""
+                continue
+            if (
+                self.idle_timeout is not None
+                and time.monotonic() - last_activity >= self.idle_timeout
+            ):
+                break
+            self.stop_event.wait(self.poll_interval)
+
+        # the writer finished without a trailing newline
+        if partial_line.strip() and not self.stop_event.is_set():
+            yield parse_line(partial_line.strip())
@@ -191,7 +191,7 @@ def add_sidebar():
                 st.file_uploader(
                     "OK",
                     accept_multiple_files=False,
-                    type="json",
+                    type=["json", "jsonl", "ndjson"],
                     label_visibility="collapsed",
                     on_change=file_uploaded,
                     key="prompt_file_uploader",
@@ -537,7 +537,7 @@ async def app():
     if st.session_state.stream_status == StreamStatus.ACTIVE:
         user_input = st.session_state.stream_adaptor.next()
         if not user_input:
-            del st.session_state["stream_adaptor"]
+            st.session_state.pop("stream_adaptor").disconnect()
             st.session_state.stream_status = StreamStatus.STOPPED
             st.session_state.messages.append(
                 WorkflowMessage(
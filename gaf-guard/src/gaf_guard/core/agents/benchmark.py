@@ -1,11 +1,13 @@
 import json
 import os
 import statistics
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partial
 from glob import glob
 from math import comb
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ai_atlas_nexus.blocks.prompt_builder import ZeroShotPromptBuilder
 from ai_atlas_nexus.blocks.prompt_templates import (
@@ -24,31 +26,45 @@ from pydantic import BaseModel
 from gaf_guard.core import ai_atlas_nexus
 from gaf_guard.core.agents import Agent
 from gaf_guard.toolkit.logging import configure_logger
+from gaf_guard.toolkit.score_cache import ScoreCache
 
 
 logger = configure_logger(__name__)
-model = OllamaModel(model="granite3.2:8b")
-
-relevance = GEval(
-    name="Relevancy",
-    criteria="Check if the actual output is similar to expected output and directly addresses the input.",
-    evaluation_params=[
-        LLMTestCaseParams.ACTUAL_OUTPUT,
-        LLMTestCaseParams.EXPECTED_OUTPUT,
-        LLMTestCaseParams.INPUT,
-    ],
-    model=model,
-)
+MODEL_NAME = "granite3.2:8b"
+model = OllamaModel(model=MODEL_NAME)
+
+METRICS = {
+    "relevance": dict(
+        name="Relevancy",
+        criteria="Check if the actual output is similar to expected output and directly addresses the input.",
+        evaluation_params=[
+            LLMTestCaseParams.ACTUAL_OUTPUT,
+            LLMTestCaseParams.EXPECTED_OUTPUT,
+            LLMTestCaseParams.INPUT,
+        ],
+    ),
+    "relevance_input_output": dict(
+        name="Input/Output Relevancy",
+        criteria="Check if the actual output is similar to expected output.",
+        evaluation_params=[
+            LLMTestCaseParams.ACTUAL_OUTPUT,
+            LLMTestCaseParams.EXPECTED_OUTPUT,
+        ],
+    ),
+}
+
+# GEval keeps the state of its last measurement, so every scoring thread uses its own instances
+_thread_metrics = threading.local()
+
+
+def get_metric(metric_name: str) -> GEval:
+    metrics = getattr(_thread_metrics, "metrics", None)
+    if metrics is None:
+        metrics = _thread_metrics.metrics = {}
+    if metric_name not in metrics:
+        metrics[metric_name] = GEval(**METRICS[metric_name], model=model)
+    return metrics[metric_name]
 
-relevance_input_output = GEval(
-    name="Input/Output Relevancy",
-    criteria="Check if the actual output is similar to expected output.",
-    evaluation_params=[
-        LLMTestCaseParams.ACTUAL_OUTPUT,
-        LLMTestCaseParams.EXPECTED_OUTPUT,
-    ],
-    model=model,
-)
 
 PROMPTS = {
     "Domain Identification": "\n        I want you to play the role of a compliance officer and answer the question based on the given Intent.\n        Return the question, answer and explanation in a json format where question, answer and explanation are keys of the json exactly as shown in the examples.\n        you should answer the question followed by an explanation on how that answer was generated.\n\n        Intent: {{ user_intent }}\n        Question: What domain does your use request fall under? Customer service/support, Technical, Information retrieval, Strategy, Code/software engineering, Communications, IT/business automation, Writing assistant, Financial, Talent and Organization including HR, Product, Marketing, Cybersecurity, Healthcare, User Research, Sales, Risk and Compliance, Design, Other\n        Answer: Strategy\n\n        Intent: Ability to create dialog flows and integrations from natural language instructions.\n        Question: What domain does your use request fall under? Customer service/support, Technical, Information retrieval, Strategy, Code/software engineering, Communications, IT/business automation, Writing assistant, Financial, Talent and Organization including HR, Product, Marketing, Cybersecurity, Healthcare, User Research, Sales, Risk and Compliance, Design, Other\n        Answer: Customer service/support\n\n        Intent: Check if a document has grammatical mistakes.\n        Question: What domain does your use request fall under? Customer service/support, Technical, Information retrieval, Strategy, Code/software engineering, Communications, IT/business automation, Writing assistant, Financial, Talent and Organization including HR, Product, Marketing, Cybersecurity, Healthcare, User Research, Sales, Risk and Compliance, Design, Other\n        Answer: Writing assitant\n\n       Intent: Optimize supply chain management in Investment banks\n       Question: What domain does your use request fall under? Customer service/support, Technical, Information retrieval, Strategy, Code/software engineering, Communications, IT/business automation, Writing assistant, Financial, Talent and Organization including HR, Product, Marketing, Cybersecurity, Healthcare, User Research, Sales, Risk and Compliance, Design, Other\n        Answer: Strategy\n\n        Intent: In the context of drug repurposing, generative AI can be employed to analyze vast databases of existing drugs and their clinical trials data. By identifying patterns and similarities, the AI can suggest potential new therapeutic indications for existing drugs, based on the chemical structure and pharmacological properties of the APIs. This process can help streamline the drug development pipeline, as it would reduce the need for time-consuming and expensive clinical trials for new indications. For instance, a drug like Atorvastatin, which is currently used to lower cholesterol, could be repurposed for the treatment of diabetic nephropathy, a kidney disease, based on the AI's analysis of similar drugs and their clinical data. This would not only save resources but also provide new treatment options for patients suffering from this debilitating condition. \n        Question: What domain does your use request fall under? Customer service/support, Technical, Information retrieval, Strategy, Code/software engineering, Communications, IT/business automation, Writing assistant, Financial, Talent and Organization including HR, Product, Marketing, Cybersecurity, Healthcare, User Research, Sales, Risk and Compliance, Design, Other\n        Answer: Healthcare and strategy\n\n        Intent: {{ user_intent }}\n        Question: What domain does your use request fall under? Customer service/support, Technical, Information retrieval, Strategy, Code/software engineering, Communications, IT/business automation, Writing assistant, Financial, Talent and Organization including HR, Product, Marketing, Cybersecurity, Healthcare, User Research, Sales, Risk and Compliance, Design, Other",
@@ -97,9 +113,45 @@ def display_metrics(state: BenchmarkAgentState, config: RunnableConfig) -> None:
     return {"metrics_results": metrics_results}
 
 
-# Node
-def process_trials(trial_dir: str, state: BenchmarkAgentState, config: RunnableConfig):
-    results = []
+def parse_trials(trial_dir: str, ground_trial: List[Any]) -> List[Dict]:
+    """
+    Read all trial files and build the test cases of every scored step.
+
+    Prompts shared by many steps (risk list, AI tasks, questionnaire prompts) are built
+    once. Steps whose test cases cannot be built are skipped, as they were when scoring.
+
+    Returns:
+        List of {"trial", "step_id", "cases", "reduce"} in trial and step order, where
+        cases is a list of (metric name, LLMTestCase) and reduce turns their scores
+        into the step reward.
+    """
+    shared = {}
+
+    def shared_value(name: str, build: Callable):
+        if name not in shared:
+            shared[name] = build()
+        return shared[name]
+
+    def risks_json():
+        risks = ai_atlas_nexus.get_all_risks(taxonomy="ibm-risk-atlas")
+        return json.dumps(
+            [{"category": risk.name} for risk in risks if risk.name], indent=2
+        )
+
+    def questionnaire_prompt(usecase, question):
+        builder = shared_value(
+            "questionnaire_builder",
+            lambda: ZeroShotPromptBuilder(QUESTIONNAIRE_COT_TEMPLATE),
+        )
+        return shared_value(
+            ("questionnaire", usecase, question),
+            lambda: builder.build(usecase=usecase, question=question),
+        )
+
+    def single(scores):
+        return scores[0]
+
+    steps = []
     if not Path(trial_dir).is_dir():
         logger.error(f"Trial directory: {trial_dir} does not exist.")
     for trial_index, trial_file in enumerate(
@@ -109,133 +161,191 @@ def process_trials(trial_dir: str, state: BenchmarkAgentState, config: RunnableC
         user_prompt = None
         trial_data = json.loads(Path(trial_file).read_text())
         for task_index, (trial_task, gt_task) in enumerate(
-            zip(trial_data, state.ground_trial)
+            zip(trial_data, ground_trial)
         ):
+            step = {
+                "trial": "Trial-" + str(trial_index),
+                "step_id": task_index,
+                "reduce": single,
+            }
             try:
                 if gt_task["step_name"] == "Input Prompt":
                     user_prompt = gt_task["content"]["prompt"]
+                    continue
                 elif gt_task["step_name"] == "User Intent":
                     user_intent = gt_task["content"]["user_intent"]
+                    continue
                 elif gt_task["step_name"] == "Questionnaire Prediction":
-                    scores = []
-                    for trial_question_data, gt_question_data in zip(
-                        trial_task["content"]["risk_questionnaire"],
-                        gt_task["content"]["risk_questionnaire"],
-                    ):
-                        input_prompt = ZeroShotPromptBuilder(
-                            QUESTIONNAIRE_COT_TEMPLATE
-                        ).build(
-                            usecase=user_intent,
-                            question=trial_question_data["question"],
+                    step["cases"] = [
+                        (
+                            "relevance",
+                            LLMTestCase(
+                                input=questionnaire_prompt(
+                                    user_intent, trial_question_data["question"]
+                                ),
+                                actual_output=trial_question_data["answer"],
+                                expected_output=gt_question_data["answer"],
+                            ),
                         )
-                        scores.append(
-                            relevance.measure(
-                                LLMTestCase(
-                                    input=input_prompt,
-                                    actual_output=trial_question_data["answer"],
-                                    expected_output=gt_question_data["answer"],
-                                )
-                            )
+                        for trial_question_data, gt_question_data in zip(
+                            trial_task["content"]["risk_questionnaire"],
+                            gt_task["content"]["risk_questionnaire"],
                         )
-                    results.append(
-                        {
-                            "trial": "Trial-" + str(trial_index),
-                            "step_id": task_index,
-                            "reward": statistics.mean(scores),
-                        }
-                    )
+                    ]
+                    if not step["cases"]:
+                        continue
+                    step["reduce"] = statistics.mean
                 elif gt_task["step_name"] == "Risk Generation":
-                    risks = ai_atlas_nexus.get_all_risks(taxonomy="ibm-risk-atlas")
-                    results.append(
-                        {
-                            "trial": "Trial-" + str(trial_index),
-                            "step_id": task_index,
-                            "reward": relevance_input_output.measure(
-                                LLMTestCase(
-                                    input=Template(
-                                        PROMPTS[gt_task["step_name"]]
-                                    ).render(
-                                        usecase=user_intent,
-                                        risks=json.dumps(
-                                            [
-                                                {"category": risk.name}
-                                                for risk in risks
-                                                if risk.name
-                                            ],
-                                            indent=2,
-                                        ),
-                                    ),
-                                    actual_output=trial_task["content"][
-                                        "identified_risks"
-                                    ],
-                                    expected_output=gt_task["content"][
-                                        "identified_risks"
-                                    ],
-                                )
+                    step["cases"] = [
+                        (
+                            "relevance_input_output",
+                            LLMTestCase(
+                                input=Template(PROMPTS[gt_task["step_name"]]).render(
+                                    usecase=user_intent,
+                                    risks=shared_value("risks", risks_json),
+                                ),
+                                actual_output=trial_task["content"]["identified_risks"],
+                                expected_output=gt_task["content"]["identified_risks"],
                             ),
-                        }
-                    )
+                        )
+                    ]
                 elif gt_task["step_name"] == "AI Tasks":
-                    hf_ai_tasks = load_resource("hf_ai_tasks.json")
-                    input_prompt = Template(AI_TASKS_TEMPLATE).render(
-                        usecase=user_intent,
-                        hf_ai_tasks=hf_ai_tasks,
-                        limit=len(hf_ai_tasks),
+                    hf_ai_tasks = shared_value(
+                        "hf_ai_tasks", lambda: load_resource("hf_ai_tasks.json")
                     )
-                    results.append(
-                        {
-                            "trial": "Trial-" + str(trial_index),
-                            "step_id": task_index,
-                            "reward": relevance.measure(
-                                LLMTestCase(
-                                    input=input_prompt,
-                                    actual_output=trial_task["content"][
-                                        "identified_ai_tasks"
-                                    ],
-                                    expected_output=gt_task["content"][
-                                        "identified_ai_tasks"
-                                    ],
-                                )
+                    step["cases"] = [
+                        (
+                            "relevance",
+                            LLMTestCase(
+                                input=Template(AI_TASKS_TEMPLATE).render(
+                                    usecase=user_intent,
+                                    hf_ai_tasks=hf_ai_tasks,
+                                    limit=len(hf_ai_tasks),
+                                ),
+                                actual_output=trial_task["content"][
+                                    "identified_ai_tasks"
+                                ],
+                                expected_output=gt_task["content"][
+                                    "identified_ai_tasks"
+                                ],
                             ),
-                        }
-                    )
+                        )
+                    ]
                 elif gt_task["step_name"] == "Domain Identification":
-                    results.append(
-                        {
-                            "trial": "Trial-" + str(trial_index),
-                            "step_id": task_index,
-                            "reward": relevance.measure(
-                                LLMTestCase(
-                                    input=(
-                                        Template(PROMPTS[gt_task["step_name"]]).render(
-                                            user_intent=user_intent,
-                                            context=user_prompt,
-                                        )
-                                        if "input_prompt" in gt_task
-                                        else gt_task["step_name"]
-                                    ),
-                                    actual_output=trial_task["content"]["domain"],
-                                    expected_output=gt_task["content"]["domain"],
-                                )
+                    step["cases"] = [
+                        (
+                            "relevance",
+                            LLMTestCase(
+                                input=(
+                                    Template(PROMPTS[gt_task["step_name"]]).render(
+                                        user_intent=user_intent,
+                                        context=user_prompt,
+                                    )
+                                    if "input_prompt" in gt_task
+                                    else gt_task["step_name"]
+                                ),
+                                actual_output=trial_task["content"]["domain"],
+                                expected_output=gt_task["content"]["domain"],
                             ),
-                        }
-                    )
+                        )
+                    ]
                 else:
-                    results.append(
-                        {
-                            "trial": "Trial-" + str(trial_index),
-                            "step_id": task_index,
-                            "reward": relevance_input_output.measure(
-                                LLMTestCase(
-                                    input="",
-                                    actual_output=trial_task["content"],
-                                    expected_output=gt_task["content"],
-                                )
+                    step["cases"] = [
+                        (
+                            "relevance_input_output",
+                            LLMTestCase(
+                                input="",
+                                actual_output=trial_task["content"],
+                                expected_output=gt_task["content"],
                             ),
-                        }
-                    )
+                        )
+                    ]
             except Exception as e:
-                print()
+                logger.warning(
+                    f"Skipping step {task_index} of {trial_file}: {type(e).__name__}: {e}"
+                )
+                continue
+
+            steps.append(step)
+
+    return steps
+
+
+def test_case_key(metric_name: str, test_case: LLMTestCase) -> str:
+    metric = METRICS[metric_name]
+    return ScoreCache.make_key(
+        MODEL_NAME,
+        metric["name"],
+        metric["criteria"],
+        test_case.input,
+        test_case.actual_output,
+        test_case.expected_output,
+    )
+
+
+def score_test_cases(
+    test_cases: Dict[str, tuple], score_cache: ScoreCache, max_workers: int
+) -> Dict[str, float]:
+    """
+    Score the distinct test cases that are not in the score cache with a bounded
+    thread pool. Failed measurements are logged and left out of the result.
+    """
+
+    def measure(key):
+        metric_name, test_case = test_cases[key]
+        return get_metric(metric_name).measure(test_case)
+
+    scores = {key: score_cache.get(key) for key in test_cases if key in score_cache}
+    pending = [key for key in test_cases if key not in scores]
+    logger.info(
+        f"Scoring {len(pending)} test cases ({len(scores)} of {len(test_cases)} distinct test cases cached) with {max_workers} workers"
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(measure, key): key for key in pending}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                scores[key] = future.result()
+                score_cache.put(key, scores[key])
+            except Exception as e:
+                logger.warning(f"Scoring failed: {type(e).__name__}: {e}")
+
+    return scores
+
+
+# Node
+def process_trials(
+    trial_dir: str,
+    state: BenchmarkAgentState,
+    config: RunnableConfig,
+    max_workers: int = 4,
+    score_cache: Optional[str] = None,
+):
+    steps = parse_trials(trial_dir, state.ground_trial)
+
+    # identical (input, actual, expected) test cases across steps and trials are scored once
+    test_cases = {}
+    for step in steps:
+        step["keys"] = []
+        for metric_name, test_case in step["cases"]:
+            key = test_case_key(metric_name, test_case)
+            test_cases.setdefault(key, (metric_name, test_case))
+            step["keys"].append(key)
+
+    scores = score_test_cases(test_cases, ScoreCache(score_cache), max_workers)
+
+    results = []
+    for step in steps:
+        # as before, a step with a failed measurement has no reward
+        if all(key in scores for key in step["keys"]):
+            results.append(
+                {
+                    "trial": step["trial"],
+                    "step_id": step["step_id"],
+                    "reward": step["reduce"]([scores[key] for key in step["keys"]]),
+                }
+            )
 
     return {"trial_results": results}
 
@@ -250,11 +360,25 @@ class BenchmarkAgent(Agent):
     def __init__(self):
         super(BenchmarkAgent, self).__init__(BenchmarkAgentState)
 
-    def _build_graph(self, graph: StateGraph, trial_dir: str):
+    def _build_graph(
+        self,
+        graph: StateGraph,
+        trial_dir: str,
+        max_workers: int = 4,
+        score_cache: Optional[str] = None,
+    ):
 
         # Add nodes
         graph.add_node("display_metrics", display_metrics)
-        graph.add_node("process_trials", partial(process_trials, trial_dir))
+        graph.add_node(
+            "process_trials",
+            partial(
+                process_trials,
+                trial_dir,
+                max_workers=max_workers,
+                score_cache=score_cache,
+            ),
+        )
 
         # Add edges to connect nodes
         graph.add_edge(START, "process_trials")
@@ -0,0 +1,52 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ScoreCache:
+    """
+    Append-only JSON lines cache of metric scores, shared across benchmark runs.
+
+    Every line holds a key and a score. Scores are appended as soon as they are
+    computed, so an interrupted run keeps everything scored so far.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.scores: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            with self.path.open("r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self.scores[record["key"]] = record["score"]
+                    except (ValueError, KeyError, TypeError):
+                        # partially written last line of an interrupted run
+                        continue
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[float]:
+        return self.scores.get(key)
+
+    def put(self, key: str, score: float) -> None:
+        with self._lock:
+            self.scores[key] = score
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a") as f:
+                    f.write(json.dumps({"key": key, "score": score}) + "\n")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.scores
+
+    def __len__(self) -> int:
+        return len(self.scores)
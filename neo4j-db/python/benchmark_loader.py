@@ -0,0 +1,198 @@
+# Local benchmark of the bulk loader against a stand-in Cypher endpoint, no Neo4j server needed.
+#
+# Both paths load the same GraphRows: the baseline sends one parameterized MERGE statement per node
+# and per relationship, each in its own transaction, like the cypher script does; the bulk loader
+# sends UNWIND batches. The stand-in keeps an in-memory graph and understands both statement shapes.
+# A fixed latency per statement stands in for the round trip and commit of a real server. Both paths
+# report the loaded rows (nodes + relationships) per second.
+#
+#   python benchmark_loader.py --latency-ms 1
+#   python benchmark_loader.py --uri bolt://localhost:7687   (run the bulk loader against a server)
+
+import argparse
+import re
+import time
+
+from ai_atlas_nexus import AIAtlasNexus
+
+from bulk_loader import BATCH_SIZE, GraphRows, Neo4jBulkLoader, _quote, constraint_query
+
+NAME = r"`?([^`\s{]+)`?"
+MERGE_NODE = re.compile(rf"MERGE \(node:{NAME} \{{id: \$id\}}\)")
+MATCH_EDGE = re.compile(
+    rf"MATCH \(src:{NAME} \{{id: \$source\}}\) "
+    rf"MATCH \(dst:{NAME} \{{id: \$target\}}\) "
+    rf"MERGE \(src\)-\[:{NAME}\]->\(dst\)"
+)
+UNWIND_NODE = re.compile(rf"UNWIND \$rows AS row MERGE \(node:{NAME} ")
+UNWIND_EDGE = re.compile(
+    rf"UNWIND \$rows AS row MATCH \(src:{NAME} .*MATCH \(dst:{NAME} .*MERGE \(src\)-\[:{NAME}\]"
+)
+
+
+def single_node_query(label):
+    return f"MERGE (node:{_quote(label)} {{id: $id}}) ON CREATE SET node += $properties"
+
+
+def single_relationship_query(relationship_type, source_label, target_label):
+    return (
+        f"MATCH (src:{_quote(source_label)} {{id: $source}}) "
+        f"MATCH (dst:{_quote(target_label)} {{id: $target}}) "
+        f"MERGE (src)-[:{_quote(relationship_type)}]->(dst)"
+    )
+
+
+class StandInGraph:
+    """In-memory graph with MERGE semantics for the statements above."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.nodes = {}
+        self.relationships = set()
+        self.statements = 0
+
+    def merge_node(self, label, node_id, properties):
+        self.nodes.setdefault((label, node_id), properties)
+
+    def merge_relationship(self, relationship_type, source, target):
+        if source in self.nodes and target in self.nodes:
+            self.relationships.add((relationship_type, source, target))
+
+    def run(self, query, rows=None, **params):
+        self.statements += 1
+        time.sleep(self.latency)
+
+        if query.startswith("CREATE CONSTRAINT"):
+            return
+        if match := UNWIND_NODE.match(query):
+            for row in rows:
+                self.merge_node(match.group(1), row["id"], row["properties"])
+        elif match := UNWIND_EDGE.match(query):
+            source_label, target_label, relationship_type = match.groups()
+            for row in rows:
+                self.merge_relationship(
+                    relationship_type, (source_label, row["source"]), (target_label, row["target"])
+                )
+        elif match := MATCH_EDGE.match(query):
+            source_label, target_label, relationship_type = match.groups()
+            self.merge_relationship(
+                relationship_type, (source_label, params["source"]), (target_label, params["target"])
+            )
+        elif match := MERGE_NODE.match(query):
+            self.merge_node(match.group(1), params["id"], params["properties"])
+        else:
+            raise ValueError(f"Unsupported statement: {query[:80]}")
+
+
+class _Result:
+    def consume(self):
+        return None
+
+
+class StandInSession:
+    """The subset of the neo4j session API used by Neo4jBulkLoader."""
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def run(self, query, rows=None, **params):
+        self.graph.run(query, rows, **params)
+        return _Result()
+
+    def execute_write(self, work):
+        return work(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class StandInDriver:
+    def __init__(self, latency):
+        self.graph = StandInGraph(latency)
+
+    def session(self, database=None):
+        return StandInSession(self.graph)
+
+
+def run_statements(driver, graph_rows):
+    """
+    Loads GraphRows with one statement and transaction per node and per relationship, as the cypher
+    script does, after the same uniqueness constraints as the bulk loader.
+
+    Returns:
+        dict: counts of statements and rows and the rows per second, as Neo4jBulkLoader.load
+    """
+    stats = {"statements": 0, "nodes": 0, "relationships": 0}
+    start = time.perf_counter()
+
+    def write(session, query, **params):
+        session.execute_write(lambda tx: tx.run(query, **params).consume())
+
+    with driver.session() as session:
+        for label in graph_rows.nodes:
+            write(session, constraint_query(label))
+
+        for label, nodes in graph_rows.nodes.items():
+            query = single_node_query(label)
+            for node_id, properties in nodes.items():
+                write(session, query, id=node_id, properties=properties)
+                stats["statements"] += 1
+                stats["nodes"] += 1
+
+        for key, pairs in graph_rows.relationships.items():
+            query = single_relationship_query(*key)
+            for source, target in pairs:
+                write(session, query, source=source, target=target)
+                stats["statements"] += 1
+                stats["relationships"] += 1
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["rows_per_second"] = (stats["nodes"] + stats["relationships"]) / max(stats["seconds"], 1e-9)
+    return stats
+
+
+def report(name, stats, graph):
+    print(
+        f"{name}: {stats['nodes'] + stats['relationships']} rows in {stats['statements']} statements, "
+        f"{stats['seconds']:.2f}s, {stats['rows_per_second']:.0f} rows/s "
+        f"({len(graph.nodes)} nodes, {len(graph.relationships)} relationships loaded)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--uri", default=None)
+    parser.add_argument("--user", default="neo4j")
+    parser.add_argument("--password", default="aiatlasnexus")
+    args = parser.parse_args()
+
+    graph_rows = GraphRows(AIAtlasNexus()._ontology)
+
+    if args.uri:
+        from neo4j import GraphDatabase
+
+        with GraphDatabase.driver(args.uri, auth=(args.user, args.password)) as driver:
+            stats = Neo4jBulkLoader(driver, batch_size=args.batch_size).load(graph_rows)
+        print(f"bulk loader: {stats['statements']} statements, {stats['rows_per_second']:.0f} rows/s")
+        return
+
+    latency = args.latency_ms / 1000
+    print(
+        f"{graph_rows.node_count()} nodes and {graph_rows.relationship_count()} relationships, "
+        f"{graph_rows.resolved_relationship_count} of them load only with a resolved endpoint label"
+    )
+
+    driver = StandInDriver(latency)
+    report("per statement", run_statements(driver, graph_rows), driver.graph)
+
+    driver = StandInDriver(latency)
+    stats = Neo4jBulkLoader(driver, batch_size=args.batch_size).load(graph_rows)
+    report("bulk loader  ", stats, driver.graph)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+# Bulk loader for the AI Atlas Nexus graph into Neo4j.
+#
+# Instead of running one MERGE statement per node and relationship (examples/ai-risk-ontology.cypher),
+# nodes are grouped by label and relationships by type and sent as parameterized UNWIND batches.
+# The same rows can be exported as CSV files for an offline `neo4j-admin database import`.
+#
+#   python bulk_loader.py --uri bolt://localhost:7687 --user neo4j --password aiatlasnexus
+#   python bulk_loader.py --csv-dir ./import
+
+import argparse
+import csv
+import os
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from pathlib import Path
+
+import ai_atlas_nexus
+from ai_atlas_nexus import AIAtlasNexus
+from ai_atlas_nexus.ai_risk_ontology.util.export_cypher import (
+    convert_entity_to_graph_node,
+    get_linkml_types,
+)
+from linkml_runtime.utils.schemaview import SchemaView
+
+
+SCHEMA_DIR = os.path.join(os.path.dirname(ai_atlas_nexus.__file__), "ai_risk_ontology", "schema")
+SCHEMA_FILE = "ai-risk-ontology.yaml"
+BATCH_SIZE = 1000
+
+
+def _quote(name):
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def _property_value(value):
+    """Neo4j property value: scalars and lists of scalars are kept, dates and other values become strings."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_property_value(v) for v in value if v is not None]
+    return str(value)
+
+
+class GraphRows:
+    """
+    Nodes grouped by label and relationships grouped by (type, source label, target label) of a
+    container, built with the same entity conversion as the AI Atlas Nexus cypher export.
+    Like the MERGE ... ON CREATE SET statements of the export, the first definition of a node wins
+    and duplicate relationships are dropped.
+
+    The export labels relationship endpoints with the range of the slot, e.g. Taxonomy for nodes
+    created as RiskTaxonomy, so their MATCH finds nothing. Endpoints that do not exist under the
+    range label are resolved to the label the node was created with; relationships to undefined
+    nodes are kept and skipped by the MATCH of the load, as before.
+    """
+
+    def __init__(self, container, schema_dir=SCHEMA_DIR, schema_file=SCHEMA_FILE):
+        importmap = {
+            Path(name).stem: str(Path(schema_dir, Path(name).stem).resolve())
+            for name in os.listdir(schema_dir)
+            if name.endswith(".yaml")
+        }
+        schema_view = SchemaView(
+            str(Path(schema_dir, schema_file).resolve()), merge_imports=True, importmap=importmap
+        )
+        linkml_types = get_linkml_types(schema_view)
+
+        # label -> id -> properties
+        self.nodes = defaultdict(dict)
+        # (type, source label, target label) -> {(source id, target id)}
+        self.relationships = defaultdict(dict)
+        edges = []
+
+        for container_slot in schema_view.class_induced_slots("Container"):
+            if container_slot.range in linkml_types:
+                continue
+            for entity in getattr(container, container_slot.name) or []:
+                for node in convert_entity_to_graph_node(
+                    entity, str(container_slot.range), schema_view, linkml_types
+                ):
+                    if node.id not in self.nodes[node.label]:
+                        self.nodes[node.label][node.id] = {
+                            key: _property_value(value) for key, value in node.properties.items()
+                        }
+                    edges.extend(node.edges)
+
+        labels = defaultdict(list)
+        for label, nodes in self.nodes.items():
+            for node_id in nodes:
+                labels[node_id].append(label)
+
+        def resolve(label, node_id):
+            if node_id in self.nodes.get(label, ()) or not labels.get(node_id):
+                return label
+            return labels[node_id][0]
+
+        # relationships that load only because an endpoint label was resolved
+        resolved = set()
+        for edge in edges:
+            key = (
+                edge.label,
+                resolve(edge.source_label, edge.source_id),
+                resolve(edge.target_label, edge.target_id),
+            )
+            self.relationships[key][(edge.source_id, edge.target_id)] = None
+            if (
+                key[1:] != (edge.source_label, edge.target_label)
+                and edge.source_id in self.nodes.get(key[1], ())
+                and edge.target_id in self.nodes.get(key[2], ())
+            ):
+                resolved.add((key, edge.source_id, edge.target_id))
+        self.resolved_relationship_count = len(resolved)
+
+    def node_count(self):
+        return sum(len(nodes) for nodes in self.nodes.values())
+
+    def relationship_count(self):
+        return sum(len(pairs) for pairs in self.relationships.values())
+
+    def node_batches(self, batch_size=BATCH_SIZE):
+        """Yields (label, rows) with rows of {"id", "properties"}."""
+        for label, nodes in self.nodes.items():
+            rows = [{"id": node_id, "properties": properties} for node_id, properties in nodes.items()]
+            for start in range(0, len(rows), batch_size):
+                yield label, rows[start : start + batch_size]
+
+    def relationship_batches(self, batch_size=BATCH_SIZE):
+        """Yields ((type, source label, target label), rows) with rows of {"source", "target"}."""
+        for key, pairs in self.relationships.items():
+            rows = [{"source": source, "target": target} for source, target in pairs]
+            for start in range(0, len(rows), batch_size):
+                yield key, rows[start : start + batch_size]
+
+
+def constraint_query(label):
+    return (
+        f"CREATE CONSTRAINT {_quote(label + '_id')} IF NOT EXISTS "
+        f"FOR (n:{_quote(label)}) REQUIRE n.id IS UNIQUE"
+    )
+
+
+def node_query(label):
+    return (
+        f"UNWIND $rows AS row "
+        f"MERGE (node:{_quote(label)} {{id: row.id}}) ON CREATE SET node += row.properties"
+    )
+
+
+def relationship_query(relationship_type, source_label, target_label):
+    return (
+        f"UNWIND $rows AS row "
+        f"MATCH (src:{_quote(source_label)} {{id: row.source}}) "
+        f"MATCH (dst:{_quote(target_label)} {{id: row.target}}) "
+        f"MERGE (src)-[:{_quote(relationship_type)}]->(dst)"
+    )
+
+
+class Neo4jBulkLoader:
+    """
+    Loads GraphRows through a neo4j driver: uniqueness constraints on the id of every label first,
+    then one parameterized UNWIND statement per batch of nodes and of relationships.
+    """
+
+    def __init__(self, driver, database=None, batch_size=BATCH_SIZE):
+        self.driver = driver
+        self.database = database
+        self.batch_size = batch_size
+
+    def _write(self, session, query, rows=None):
+        params = {} if rows is None else {"rows": rows}
+        session.execute_write(lambda tx: tx.run(query, **params).consume())
+
+    def load(self, graph_rows):
+        """
+        Returns:
+            dict: counts of constraints, statements and rows and the rows per second
+        """
+        stats = {"constraints": 0, "statements": 0, "nodes": 0, "relationships": 0}
+        start = time.perf_counter()
+
+        with self.driver.session(database=self.database) as session:
+            for label in graph_rows.nodes:
+                self._write(session, constraint_query(label))
+                stats["constraints"] += 1
+
+            # relationships MATCH their endpoints, so all nodes are loaded first
+            for label, rows in graph_rows.node_batches(self.batch_size):
+                self._write(session, node_query(label), rows)
+                stats["statements"] += 1
+                stats["nodes"] += len(rows)
+
+            for key, rows in graph_rows.relationship_batches(self.batch_size):
+                self._write(session, relationship_query(*key), rows)
+                stats["statements"] += 1
+                stats["relationships"] += len(rows)
+
+        stats["seconds"] = time.perf_counter() - start
+        stats["rows_per_second"] = (stats["nodes"] + stats["relationships"]) / max(
+            stats["seconds"], 1e-9
+        )
+        return stats
+
+
+def export_csv(graph_rows, output_dir):
+    """
+    Writes one CSV file per node label and per relationship group in the neo4j-admin import format,
+    with an id space per label. Relationships whose endpoints are not defined are skipped, as the
+    MATCH of the cypher statements would.
+
+    Returns:
+        list: the neo4j-admin database import arguments for the written files
+    """
+    os.makedirs(os.path.join(output_dir, "nodes"), exist_ok=True)
+    os.makedirs(os.path.join(output_dir, "relationships"), exist_ok=True)
+    arguments = []
+
+    for label, nodes in graph_rows.nodes.items():
+        keys = list(dict.fromkeys(key for properties in nodes.values() for key in properties))
+        arrays = {
+            key
+            for properties in nodes.values()
+            for key, value in properties.items()
+            if isinstance(value, list)
+        }
+        header = [f"id:ID({label})"] + [f"{key}:string[]" if key in arrays else key for key in keys]
+
+        path = os.path.join("nodes", f"{label}.csv")
+        with open(os.path.join(output_dir, path), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header + [":LABEL"])
+            for node_id, properties in nodes.items():
+                row = [node_id]
+                for key in keys:
+                    value = properties.get(key)
+                    if key in arrays and value is not None:
+                        value = ";".join(map(str, value if isinstance(value, list) else [value]))
+                    row.append("" if value is None else value)
+                writer.writerow(row + [label])
+        arguments.append(f"--nodes={label}={path}")
+
+    skipped = 0
+    for (relationship_type, source_label, target_label), pairs in graph_rows.relationships.items():
+        sources, targets = graph_rows.nodes.get(source_label, {}), graph_rows.nodes.get(target_label, {})
+        path = os.path.join(
+            "relationships", f"{relationship_type}__{source_label}__{target_label}.csv"
+        )
+        with open(os.path.join(output_dir, path), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([f":START_ID({source_label})", f":END_ID({target_label})", ":TYPE"])
+            for source, target in pairs:
+                if source in sources and target in targets:
+                    writer.writerow([source, target, relationship_type])
+                else:
+                    skipped += 1
+        arguments.append(f"--relationships={relationship_type}={path}")
+
+    if skipped:
+        print(f"Skipped {skipped} relationships with undefined endpoints")
+    return arguments
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uri", default="bolt://localhost:7687")
+    parser.add_argument("--user", default="neo4j")
+    parser.add_argument("--password", default="aiatlasnexus")
+    parser.add_argument("--database", default=None)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument(
+        "--csv-dir", default=None, help="write neo4j-admin import files instead of loading"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph_rows = GraphRows(AIAtlasNexus()._ontology)
+    print(
+        f"Prepared {graph_rows.node_count()} nodes and {graph_rows.relationship_count()} "
+        f"relationships in {time.perf_counter() - start:.2f}s"
+    )
+
+    if args.csv_dir:
+        arguments = export_csv(graph_rows, args.csv_dir)
+        print(f"Wrote CSV files to {args.csv_dir}, import them from that directory with:")
+        print("neo4j-admin database import full " + " ".join(arguments) + " neo4j")
+        return
+
+    from neo4j import GraphDatabase
+
+    with GraphDatabase.driver(args.uri, auth=(args.user, args.password)) as driver:
+        stats = Neo4jBulkLoader(driver, args.database, args.batch_size).load(graph_rows)
+    print(
+        f"Loaded {stats['nodes']} nodes and {stats['relationships']} relationships "
+        f"in {stats['statements']} statements, {stats['seconds']:.2f}s "
+        f"({stats['rows_per_second']:.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,8 @@ export interface NodeData {
   tag: string;
   URL: string;
   cluster: string;
-  x: number;
-  y: number;
+  x?: number;
+  y?: number;
 }
 
 export interface EdgeData {
@@ -29,11 +29,47 @@ export interface Tag {
   image: string;
 }
 
+export interface OverviewNode {
+  key: string;
+  cluster: string;
+  x: number;
+  y: number;
+  radius: number;
+  nodes: number;
+}
+
+export interface Overview {
+  nodes: OverviewNode[];
+  edges: { source: string; target: string; count: number }[];
+  layout_time: number;
+}
+
 export interface Dataset {
   nodes: NodeData[];
   edges: EdgeData[];
   clusters: Cluster[];
   tags: Tag[];
+  overview?: Overview;
+}
+
+export interface ClusterShard extends Cluster {
+  nodes: number;
+  edges: number;
+  nodes_url?: string;
+  edges_url?: string;
+  layout_url?: string;
+}
+
+export interface Manifest {
+  format: string;
+  version: number;
+  clusters: ClusterShard[];
+  tags: Tag[];
+  metadata: {
+    total_nodes: number;
+    total_edges: number;
+  };
+  overview?: Overview;
 }
 
 export interface FiltersState {
@@ -5,10 +5,9 @@ function getMouseLayer() {
   return document.querySelector(".sigma-mouse");
 }
 
-const GraphEventsController: FC<PropsWithChildren<{ setHoveredNode: (node: string | null) => void }>> = ({
-  setHoveredNode,
-  children,
-}) => {
+const GraphEventsController: FC<
+  PropsWithChildren<{ setHoveredNode: (node: string | null) => void; onClickNode?: (node: string) => void }>
+> = ({ setHoveredNode, onClickNode, children }) => {
   //const sigma = useSigma();
   //const graph = sigma.getGraph();
   const registerEvents = useRegisterEvents();
@@ -19,6 +18,9 @@ const GraphEventsController: FC<PropsWithChildren<{ setHoveredNode: (node: strin
    */
   useEffect(() => {
     registerEvents({
+      clickNode({ node }) {
+        if (onClickNode) onClickNode(node);
+      },
       //clickNode({ node }) {
       //  if (!graph.getNodeAttribute(node, "hidden")) {
          //window.open(graph.getNodeAttribute(node, "URL"), "_blank");
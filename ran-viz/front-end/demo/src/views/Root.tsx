@@ -5,14 +5,14 @@ import forceAtlas2 from "graphology-layout-forceatlas2";
 import FA2Layout from "graphology-layout-forceatlas2/worker";
 import betweennessCentrality from "graphology-metrics/centrality/betweenness";
 import { constant, keyBy, mapValues, omit } from "lodash";
-import { FC, useEffect, useMemo, useState } from "react";
+import { FC, useEffect, useMemo, useRef, useState } from "react";
 import { BiBookContent, BiRadioCircleMarked } from "react-icons/bi";
 import { BsArrowsFullscreen, BsFullscreenExit, BsZoomIn, BsZoomOut } from "react-icons/bs";
 import { GrClose } from "react-icons/gr";
 import { Settings } from "sigma/settings";
 
 import { drawHover, drawLabel } from "../canvas-utils";
-import { Dataset, FiltersState } from "../types";
+import { Cluster, ClusterShard, Dataset, EdgeData, FiltersState, Manifest, NodeData, Tag } from "../types";
 import ClustersPanel from "./ClustersPanel";
 import DescriptionPanel from "./DescriptionPanel";
 import GraphDataController from "./GraphDataController";
@@ -22,6 +22,12 @@ import GraphTitle from "./GraphTitle";
 import SearchField from "./SearchField";
 import TagsPanel from "./TagsPanel";
 
+// manifest fields of a cluster that are not node attributes
+const SHARD_FIELDS = ["key", "nodes", "edges", "nodes_url", "edges_url", "layout_url"];
+
+// tag of the cluster centroid nodes of the overview
+const OVERVIEW_TAG: Tag = { key: "cluster", image: "concept.svg" };
+
 const Root: FC = () => {
   const graph = useMemo(() => new MultiDirectedGraph(), []);
   const [showContents, setShowContents] = useState(false);
@@ -32,6 +38,7 @@ const Root: FC = () => {
     tags: {},
   });
   const [hoveredNode, setHoveredNode] = useState<string | null>(null);
+  const expandCluster = useRef<(node: string) => void>(() => undefined);
   const sigmaSettings: Partial<Settings> = useMemo(
     () => ({
       nodeProgramClasses: {
@@ -55,61 +62,155 @@ const Root: FC = () => {
 
   // Load data on mount:
   useEffect(() => {
-    fetch(`./ai-risk-ontology.json`)
-      .then((res) => res.json())
-      .then((dataset: Dataset) => {
-        const clusters = keyBy(dataset.clusters, "key");
-        const tags = keyBy(dataset.tags, "key");
-
-        let lenDataset = dataset.nodes.length
-        dataset.nodes.forEach((node) =>
-          graph.addNode(node.key, {
-            ...node,
-            x: Math.random() * lenDataset, // 100 * Math.cos(2 * i * Math.PI / lenDataset),
-            y: Math.random() * lenDataset, // 00 * Math.sin(2 * i * Math.PI / lenDataset),
-            ...omit(clusters[node.cluster], "key"),
-            image: `./images/${tags[node.tag].image}`,
-          }),
-        );
-        
-        dataset.edges.forEach((edge) => graph.addEdge(edge.source, edge.target, { type: "arrow", label: edge.label, size: 1 }));
-
-        betweennessCentrality.assign(graph, {nodeCentralityAttribute: 'score'});
-
-        // Use degrees as node sizes:
-        const scores = graph.nodes().map((node) => graph.getNodeAttribute(node, "score"));
-        const minDegree = Math.min(...scores);
-        const maxDegree = Math.max(...scores);
-        const MIN_NODE_SIZE = 3;
-        const MAX_NODE_SIZE = 30;
-
-        graph.forEachNode((node) =>
-          graph.setNodeAttribute(
-            node,
-            "size",
-            ((graph.getNodeAttribute(node, "score") - minDegree) / (maxDegree - minDegree)) *
-              (MAX_NODE_SIZE - MIN_NODE_SIZE) +
-              MIN_NODE_SIZE,
-          ),
-        );
-
-        setFiltersState({
-          clusters: mapValues(keyBy(dataset.clusters, "key"), constant(true)),
-          tags: mapValues(keyBy(dataset.tags, "key"), constant(true)),
+    const addNodes = (nodes: NodeData[], clusters: Record<string, Cluster>, tags: Record<string, Tag>, spread: number) =>
+      nodes.forEach((node) => {
+        if (graph.hasNode(node.key)) return;
+        graph.addNode(node.key, {
+          ...node,
+          // positions precomputed by the export (app.py --layout) are kept
+          x: node.x ?? Math.random() * spread, // 100 * Math.cos(2 * i * Math.PI / lenDataset),
+          y: node.y ?? Math.random() * spread, // 00 * Math.sin(2 * i * Math.PI / lenDataset),
+          ...omit(clusters[node.cluster], SHARD_FIELDS),
+          image: `./images/${tags[node.tag].image}`,
         });
-        setDataset(dataset);
-        requestAnimationFrame(() => setDataReady(true));
+      });
 
-        const sensibleSettings = forceAtlas2.inferSettings(graph);
-        const fa2Layout = new FA2Layout(graph, {
-          settings: sensibleSettings,
-        });
+    // edges are only added once both endpoints exist, the others wait for later shards
+    let pendingEdges: EdgeData[] = [];
+    const addEdges = (edges: EdgeData[]) => {
+      const waiting: EdgeData[] = [];
+      pendingEdges.concat(edges).forEach((edge) => {
+        if (graph.hasNode(edge.source) && graph.hasNode(edge.target))
+          graph.addEdge(edge.source, edge.target, { type: "arrow", label: edge.label, size: 1 });
+        else waiting.push(edge);
+      });
+      pendingEdges = waiting;
+    };
+
+    const sizeNodes = () => {
+      betweennessCentrality.assign(graph, {nodeCentralityAttribute: 'score'});
 
-        fa2Layout.start()
+      // Use degrees as node sizes:
+      const scores = graph.nodes().map((node) => graph.getNodeAttribute(node, "score"));
+      const minDegree = Math.min(...scores);
+      const maxDegree = Math.max(...scores);
+      const MIN_NODE_SIZE = 3;
+      const MAX_NODE_SIZE = 30;
 
+      graph.forEachNode((node, { overview }) =>
+        graph.setNodeAttribute(
+          node,
+          "size",
+          overview
+            ? MAX_NODE_SIZE
+            : ((graph.getNodeAttribute(node, "score") - minDegree) / (maxDegree - minDegree || 1)) *
+                (MAX_NODE_SIZE - MIN_NODE_SIZE) +
+                MIN_NODE_SIZE,
+        ),
+      );
+    };
+
+    const showDataset = (dataset: Dataset) => {
+      setFiltersState({
+        clusters: mapValues(keyBy(dataset.clusters, "key"), constant(true)),
+        tags: mapValues(keyBy(dataset.tags, "key"), constant(true)),
+      });
+      setDataset(dataset);
+      requestAnimationFrame(() => setDataReady(true));
+    };
+
+    const startLayout = () => {
+      const sensibleSettings = forceAtlas2.inferSettings(graph);
+      const fa2Layout = new FA2Layout(graph, {
+        settings: sensibleSettings,
       });
 
+      fa2Layout.start()
+    };
+
+    const fetchShard = <T,>(url: string): Promise<T[]> =>
+      fetch(`./ai-risk-ontology/${url}`)
+        .then((res) => res.text())
+        .then((text) => text.split("\n").filter((line) => line.length).map((line) => JSON.parse(line)));
+
+    // Sharded export (app.py --stream): the manifest is shown first and the cluster shards are
+    // added to the graph as they arrive
+    const loadShards = (manifest: Manifest) => {
+      const clusters = keyBy(manifest.clusters, "key");
+      const tags = keyBy([...manifest.tags, OVERVIEW_TAG], "key");
+      const spread = manifest.metadata.total_nodes;
+
+      const loadCluster = (cluster: ClusterShard) =>
+        Promise.all([
+          cluster.nodes_url ? fetchShard<NodeData>(cluster.nodes_url) : Promise.resolve([]),
+          cluster.edges_url ? fetchShard<EdgeData>(cluster.edges_url) : Promise.resolve([]),
+          cluster.layout_url
+            ? fetch(`./ai-risk-ontology/${cluster.layout_url}`).then((res) => res.json())
+            : Promise.resolve({}),
+        ]).then(([nodes, edges, positions]: [NodeData[], EdgeData[], Record<string, [number, number]>]) => {
+          nodes.forEach((node) => {
+            if (positions[node.key]) [node.x, node.y] = positions[node.key];
+          });
+          addNodes(nodes, clusters, tags, spread);
+          addEdges(edges);
+        });
+
+      if (!manifest.overview) {
+        showDataset({ nodes: [], edges: [], clusters: manifest.clusters, tags: manifest.tags });
+        return Promise.all(manifest.clusters.map(loadCluster)).then(() => {
+          sizeNodes();
+          startLayout();
+        });
+      }
+
+      // Precomputed layout (app.py --stream --layout): only the cluster overview is drawn at first,
+      // a cluster is replaced by its nodes when its centroid is clicked
+      manifest.overview.nodes.forEach((centroid) =>
+        graph.addNode(centroid.key, {
+          ...centroid,
+          ...omit(clusters[centroid.cluster], SHARD_FIELDS),
+          label: `${clusters[centroid.cluster]?.clusterLabel} (${centroid.nodes})`,
+          tag: OVERVIEW_TAG.key,
+          image: `./images/${OVERVIEW_TAG.image}`,
+          overview: true,
+        }),
+      );
+      manifest.overview.edges.forEach((edge) =>
+        graph.addEdge(edge.source, edge.target, { type: "arrow", label: `${edge.count}`, size: Math.log1p(edge.count) }),
+      );
+      sizeNodes();
+
+      expandCluster.current = (node: string) => {
+        if (!graph.hasNode(node) || !graph.getNodeAttribute(node, "overview")) return;
+        const cluster = clusters[graph.getNodeAttribute(node, "cluster")];
+        graph.dropNode(node);
+        if (cluster) loadCluster(cluster).then(sizeNodes);
+      };
+
+      showDataset({ nodes: [], edges: [], clusters: manifest.clusters, tags: [...manifest.tags, OVERVIEW_TAG] });
+      return Promise.resolve();
+    };
+
+    const loadDataset = () =>
+      fetch(`./ai-risk-ontology.json`)
+        .then((res) => res.json())
+        .then((dataset: Dataset) => {
+          const clusters = keyBy(dataset.clusters, "key");
+          const tags = keyBy(dataset.tags, "key");
+
+          addNodes(dataset.nodes, clusters, tags, dataset.nodes.length);
+          addEdges(dataset.edges);
+          sizeNodes();
+          showDataset(dataset);
+          if (!dataset.overview) startLayout();
+        });
 
+    fetch(`./ai-risk-ontology/manifest.json`)
+      .then((res) => (res.ok ? res.json() : null))
+      .catch(() => null)
+      .then((manifest: Manifest | null) =>
+        manifest && manifest.format === "ran-viz-shards" ? loadShards(manifest) : loadDataset(),
+      );
   }, []);
 
   
@@ -119,7 +220,7 @@ const Root: FC = () => {
     <div id="app-root" className={showContents ? "show-contents" : ""}>
       <SigmaContainer graph={graph} settings={sigmaSettings} className="react-sigma">
         <GraphSettingsController hoveredNode={hoveredNode} />
-        <GraphEventsController setHoveredNode={setHoveredNode} />
+        <GraphEventsController setHoveredNode={setHoveredNode} onClickNode={(node) => expandCluster.current(node)} />
         <GraphDataController filters={filtersState} />
 
         {dataReady && (
@@ -1,10 +1,14 @@
 # Convenience script to export a json graph version or IBM AI risk atlas from the yaml
 # in src/ai_atlas_nexus/data/knowledge_graph
 
+import argparse
+
 from ai_atlas_nexus import AIAtlasNexus
 from util.json_graph_dumper import JSONGraphDumper
 
 OUTPUT_FILE = "../front-end/demo/public/ai-risk-ontology.json"
+# per-cluster NDJSON shards and manifest.json, loaded progressively by the front end
+OUTPUT_DIR = "../front-end/demo/public/ai-risk-ontology"
 SCHEMA_FILE = "https://raw.githubusercontent.com/IBM/ai-atlas-nexus/refs/heads/main/src/ai_atlas_nexus/ai_risk_ontology/schema/ai-risk-ontology.yaml"
 
 ran = AIAtlasNexus()
@@ -12,12 +16,46 @@ ran = AIAtlasNexus()
 # export IBM AI risk atlas from graph
 container = ran._ontology
 
-def generate_graph_data():
+def print_layout_time(dumper):
+    if dumper.overview is not None:
+        print(f"Layout of {len(dumper.node_index)} nodes took {dumper.overview['layout_time']:.2f}s")
+
+
+def generate_graph_data(layout=False):
 
+    dumper = JSONGraphDumper(schema_path=SCHEMA_FILE, layout=layout)
     with open(OUTPUT_FILE, "+tw", encoding="utf-8") as output_file:
-        print(JSONGraphDumper(schema_path=SCHEMA_FILE).dumps(container), file=output_file)
+        print(dumper.dumps(container), file=output_file)
         output_file.close()
+    print_layout_time(dumper)
+
+
+def generate_graph_shards(layout=False):
+
+    dumper = JSONGraphDumper(schema_path=SCHEMA_FILE, layout=layout)
+    manifest = dumper.dump_shards(container, OUTPUT_DIR)
+    print(
+        f"Wrote {manifest['metadata']['total_nodes']} nodes and "
+        f"{manifest['metadata']['total_edges']} edges in {len(manifest['clusters'])} clusters to {OUTPUT_DIR}"
+    )
+    print_layout_time(dumper)
 
 
 if __name__ == "__main__":
-    generate_graph_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="stream the graph to per-cluster shards instead of a single json file",
+    )
+    parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="precompute node positions and a cluster overview instead of laying out in the browser",
+    )
+    args = parser.parse_args()
+
+    if args.stream:
+        generate_graph_shards(layout=args.layout)
+    else:
+        generate_graph_data(layout=args.layout)
\ No newline at end of file
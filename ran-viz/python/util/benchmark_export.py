@@ -0,0 +1,67 @@
+# Benchmark of the JSON graph export on a synthetically enlarged AI Atlas Nexus ontology.
+# Every instance list of the container is cloned `scale` times with new ids, relations are kept.
+#
+#   python -m util.benchmark_export --scales 1 2 4 8
+#
+# With --stream the sharded export (JSONGraphDumper.dump_shards) is measured instead of dumps().
+# Peak memory is traced with tracemalloc. With --layout the offline layout stage is included and
+# its share of the time is reported.
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+from ai_atlas_nexus import AIAtlasNexus
+from util.json_graph_dumper import JSONGraphDumper
+
+SCHEMA_FILE = "https://raw.githubusercontent.com/IBM/ai-atlas-nexus/refs/heads/main/src/ai_atlas_nexus/ai_risk_ontology/schema/ai-risk-ontology.yaml"
+
+
+def enlarge(container, scale):
+    """Return a copy of the container where every instance appears `scale` times."""
+    fields = {}
+    for name, value in container.__dict__.items():
+        if isinstance(value, list) and len(value) and hasattr(value[0], "id"):
+            fields[name] = value + [
+                item.model_copy(update={"id": f"{item.id}-copy{copy}"})
+                for copy in range(1, scale)
+                for item in value
+            ]
+    return container.model_copy(update=fields)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--schema", default=SCHEMA_FILE)
+    parser.add_argument("--stream", action="store_true")
+    parser.add_argument("--layout", action="store_true")
+    args = parser.parse_args()
+
+    container = AIAtlasNexus()._ontology
+
+    for scale in args.scales:
+        enlarged = enlarge(container, scale)
+        dumper = JSONGraphDumper(schema_path=args.schema, layout=args.layout)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        if args.stream:
+            with tempfile.TemporaryDirectory() as output_dir:
+                dumper.dump_shards(enlarged, output_dir)
+        else:
+            dumper.dumps(enlarged)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(
+            f"scale={scale:<3} nodes={len(dumper.node_index):<7} edges={len(dumper.edge_index):<7} "
+            f"time={elapsed:.2f}s peak={peak / 2**20:.1f}MiB"
+            + (f" layout={dumper.overview['layout_time']:.2f}s" if args.layout else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import time
+
+import numpy as np
+
+
+# size of the pairwise repulsion blocks, in number of node pairs
+BLOCK_PAIRS = 2**22
+
+
+def force_layout(
+    n_nodes,
+    edges,
+    weights=None,
+    masses=None,
+    iterations=200,
+    gravity=1.0,
+    scaling=2.0,
+    seed=0,
+):
+    """
+    ForceAtlas2-style layout: degree weighted repulsion between all nodes, linear attraction along
+    edges and gravity towards the origin. Repulsion is computed in blocks so memory stays bounded.
+
+    Args:
+        n_nodes: int
+            number of nodes
+        edges: np.ndarray
+            (E, 2) array of node indices
+        weights: np.ndarray
+            optional (E,) array of edge weights
+        masses: np.ndarray
+            optional (n_nodes,) node masses, defaults to degree + 1 as in ForceAtlas2
+        iterations: int
+            number of layout iterations
+
+    Returns:
+        np.ndarray: (n_nodes, 2) positions
+    """
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(-1.0, 1.0, (n_nodes, 2)) * np.sqrt(max(n_nodes, 1))
+    if n_nodes < 2:
+        return np.zeros((n_nodes, 2))
+
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    weights = np.ones(len(edges)) if weights is None else np.asarray(weights, dtype=float)
+    if masses is None:
+        masses = np.bincount(edges.ravel(), minlength=n_nodes) + 1.0
+    masses = np.asarray(masses, dtype=float)
+    masses32 = masses.astype(np.float32)
+
+    block = max(1, BLOCK_PAIRS // n_nodes)
+    temperature = np.sqrt(n_nodes)
+    cooling = (0.01) ** (1.0 / iterations)
+
+    for _ in range(iterations):
+        displacement = np.zeros_like(pos)
+        # the pairwise blocks dominate the cost and are computed in single precision
+        pos32 = pos.astype(np.float32)
+
+        # repulsion k * m_i * m_j / d, along the unit vector between the nodes
+        for start in range(0, n_nodes, block):
+            end = min(start + block, n_nodes)
+            dx = pos32[start:end, 0, None] - pos32[None, :, 0]
+            dy = pos32[start:end, 1, None] - pos32[None, :, 1]
+            force = dx * dx
+            force += dy * dy
+            force += 1e-2
+            np.divide(masses32[None, :], force, out=force)
+            force *= scaling * masses32[start:end, None]
+            force[np.arange(end - start), np.arange(start, end)] = 0.0
+            # sum_j f_ij * (p_i - p_j) without materializing the pairwise vectors
+            displacement[start:end] += pos32[start:end] * force.sum(axis=1)[:, None] - force @ pos32
+
+        # attraction proportional to the distance
+        if len(edges):
+            delta = (pos[edges[:, 0]] - pos[edges[:, 1]]) * weights[:, None]
+            np.add.at(displacement, edges[:, 0], -delta)
+            np.add.at(displacement, edges[:, 1], delta)
+
+        # gravity
+        norm = np.linalg.norm(pos, axis=1, keepdims=True) + 1e-9
+        displacement -= gravity * masses[:, None] * pos / norm
+
+        # heavy nodes move slower, steps are capped by a cooling temperature
+        step = displacement / masses[:, None]
+        length = np.linalg.norm(step, axis=1, keepdims=True) + 1e-9
+        pos += step * np.minimum(1.0, temperature / length)
+        temperature *= cooling
+
+    return pos - pos.mean(axis=0)
+
+
+def layout_graph(node_clusters, edge_pairs, iterations=200, spacing=10.0, seed=0):
+    """
+    Two level layout: every cluster is laid out on its own, then the clusters are laid out as a
+    weighted graph of cluster nodes and each cluster is placed around its centroid.
+
+    Args:
+        node_clusters: Dict[str, str]
+            node key to cluster
+        edge_pairs: Iterable[Tuple[str, str]]
+            source and target node keys, edges with unknown endpoints are ignored
+        iterations: int
+            number of layout iterations per level
+        spacing: float
+            distance unit between neighbouring nodes
+
+    Returns:
+        Tuple[Dict[str, Tuple[float, float]], Dict]: node positions and the cluster overview with
+        one centroid node per cluster and the inter-cluster edge counts
+    """
+    start = time.perf_counter()
+
+    keys = list(node_clusters)
+    index = {key: i for i, key in enumerate(keys)}
+    cluster_keys = list(dict.fromkeys(node_clusters.values()))
+    cluster_index = {cluster: i for i, cluster in enumerate(cluster_keys)}
+    node_cluster = np.array([cluster_index[node_clusters[key]] for key in keys], dtype=np.int64)
+
+    edges = np.array(
+        [
+            (index[source], index[target])
+            for source, target in edge_pairs
+            if source in index and target in index and source != target
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    source_cluster, target_cluster = node_cluster[edges[:, 0]], node_cluster[edges[:, 1]]
+    intra = source_cluster == target_cluster
+
+    # local layout of every cluster, scaled to a disc with area proportional to the cluster size
+    pos = np.zeros((len(keys), 2))
+    sizes = np.bincount(node_cluster, minlength=len(cluster_keys))
+    radii = spacing * np.sqrt(sizes)
+    for c in range(len(cluster_keys)):
+        members = np.flatnonzero(node_cluster == c)
+        local = np.full(len(keys), -1, dtype=np.int64)
+        local[members] = np.arange(len(members))
+        cluster_edges = local[edges[intra & (source_cluster == c)]]
+
+        cluster_pos = force_layout(len(members), cluster_edges, iterations=iterations, seed=seed)
+        extent = np.abs(cluster_pos).max() if len(members) > 1 else 1.0
+        pos[members] = cluster_pos / max(extent, 1e-9) * radii[c]
+
+    # cluster graph weighted by the number of edges between clusters
+    pairs = np.stack([source_cluster[~intra], target_cluster[~intra]], axis=1)
+    pairs.sort(axis=1)
+    cluster_pairs, counts = np.unique(pairs, axis=0, return_counts=True)
+    centroids = force_layout(
+        len(cluster_keys),
+        cluster_pairs,
+        weights=np.log1p(counts),
+        masses=np.sqrt(sizes) + 1.0,
+        iterations=iterations,
+        seed=seed,
+    )
+
+    # spread the centroids until no two cluster discs overlap
+    if len(cluster_keys) > 1:
+        delta = centroids[:, None, :] - centroids[None, :, :]
+        dist = np.linalg.norm(delta, axis=2) + np.eye(len(cluster_keys))
+        required = (radii[:, None] + radii[None, :] + spacing) * (1 - np.eye(len(cluster_keys)))
+        centroids *= max(1.0, (required / dist).max())
+
+    pos += centroids[node_cluster]
+
+    # directed inter-cluster edge counts for the overview
+    directed, directed_counts = np.unique(
+        np.stack([source_cluster[~intra], target_cluster[~intra]], axis=1),
+        axis=0,
+        return_counts=True,
+    )
+    overview = {
+        "nodes": [
+            {
+                "key": f"cluster:{cluster}",
+                "cluster": cluster,
+                "x": round(float(centroids[c, 0]), 2),
+                "y": round(float(centroids[c, 1]), 2),
+                "radius": round(float(radii[c]), 2),
+                "nodes": int(sizes[c]),
+            }
+            for c, cluster in enumerate(cluster_keys)
+        ],
+        "edges": [
+            {
+                "source": f"cluster:{cluster_keys[s]}",
+                "target": f"cluster:{cluster_keys[t]}",
+                "count": int(count),
+            }
+            for (s, t), count in zip(directed.tolist(), directed_counts.tolist())
+        ],
+        "layout_time": round(time.perf_counter() - start, 3),
+    }
+
+    positions = {
+        key: (round(float(x), 2), round(float(y), 2)) for key, (x, y) in zip(keys, pos)
+    }
+    return positions, overview
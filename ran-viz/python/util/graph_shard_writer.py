@@ -0,0 +1,135 @@
+import json
+import os
+import re
+
+
+class GraphShardWriter:
+    """
+    Writes graph nodes and edges incrementally as NDJSON shards, one pair of shards per cluster,
+    plus a small manifest so the front end can fetch the shards lazily.
+
+    Layout of output_dir:
+        manifest.json
+        nodes/<cluster>.ndjson
+        edges/<cluster>.ndjson   (edges are sharded by the cluster of their source node)
+        layout/<cluster>.json    (node positions, only if a layout was computed)
+    """
+
+    FORMAT = "ran-viz-shards"
+    VERSION = 1
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        os.makedirs(os.path.join(output_dir, "nodes"), exist_ok=True)
+        os.makedirs(os.path.join(output_dir, "edges"), exist_ok=True)
+        os.makedirs(os.path.join(output_dir, "layout"), exist_ok=True)
+
+        self._files = {}
+        self.shard_names = {}
+        self.node_counts = {}
+        self.edge_counts = {}
+        self.positions = {}
+
+    def _shard_name(self, cluster):
+        if cluster not in self.shard_names:
+            slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", str(cluster)).strip("-") or "unknown"
+            # keep names unique if two clusters map to the same slug
+            name, i = slug, 1
+            while name in self.shard_names.values():
+                i += 1
+                name = f"{slug}-{i}"
+            self.shard_names[cluster] = name
+        return self.shard_names[cluster]
+
+    def _write(self, kind, cluster, record):
+        path = f"{kind}/{self._shard_name(cluster)}.ndjson"
+        if path not in self._files:
+            self._files[path] = open(
+                os.path.join(self.output_dir, path), "w", encoding="utf-8"
+            )
+        self._files[path].write(json.dumps(record) + "\n")
+
+    def write_node(self, node):
+        cluster = node.get("cluster", "unknown")
+        self._write("nodes", cluster, node)
+        self.node_counts[cluster] = self.node_counts.get(cluster, 0) + 1
+
+    def write_edge(self, edge, cluster):
+        self._write("edges", cluster, edge)
+        self.edge_counts[cluster] = self.edge_counts.get(cluster, 0) + 1
+
+    def write_position(self, cluster, key, position):
+        self.positions.setdefault(cluster, {})[key] = position
+
+    def _shard_urls(self, shard, key):
+        name = self.shard_names.get(key)
+        if name is None:
+            return shard
+        if shard["nodes"]:
+            shard["nodes_url"] = f"nodes/{name}.ndjson"
+        if shard["edges"]:
+            shard["edges_url"] = f"edges/{name}.ndjson"
+        if key in self.positions:
+            shard["layout_url"] = f"layout/{name}.json"
+        return shard
+
+    def close(self, clusters, tags, metadata, overview=None):
+        """
+        Close all shards and write the positions and the manifest.
+
+        Args:
+            clusters: list of {"key", "color", "clusterLabel"} dicts
+            tags: list of {"key", "image"} dicts
+            metadata: dict of graph level counts
+            overview: optional cluster overview with centroid nodes and inter-cluster edges
+        """
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+        for cluster, positions in self.positions.items():
+            with open(
+                os.path.join(self.output_dir, f"layout/{self._shard_name(cluster)}.json"),
+                "w",
+                encoding="utf-8",
+            ) as f:
+                json.dump(positions, f)
+
+        shards = []
+        for cluster in clusters:
+            key = cluster["key"]
+            shard = {
+                **cluster,
+                "nodes": self.node_counts.get(key, 0),
+                "edges": self.edge_counts.get(key, 0),
+            }
+            shards.append(self._shard_urls(shard, key))
+
+        # shards of clusters that are not listed, e.g. edges from nodes outside any cluster
+        listed = {cluster["key"] for cluster in clusters}
+        for key in list(self.shard_names):
+            if key not in listed:
+                shard = {
+                    "key": key,
+                    "color": "#999999",
+                    "clusterLabel": key,
+                    "nodes": self.node_counts.get(key, 0),
+                    "edges": self.edge_counts.get(key, 0),
+                }
+                shards.append(self._shard_urls(shard, key))
+
+        manifest = {
+            "format": self.FORMAT,
+            "version": self.VERSION,
+            "clusters": shards,
+            "tags": tags,
+            "metadata": metadata,
+        }
+        if overview is not None:
+            manifest["overview"] = overview
+        with open(
+            os.path.join(self.output_dir, "manifest.json"), "w", encoding="utf-8"
+        ) as f:
+            json.dump(manifest, f, indent=2)
+
+        return manifest
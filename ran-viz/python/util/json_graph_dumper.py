@@ -1,4 +1,6 @@
+from collections import Counter
 from datetime import date, datetime
+import hashlib
 import json
 from typing import Any, Dict, Union
 import uuid
@@ -13,21 +15,99 @@ from pydantic import BaseModel
 from ai_atlas_nexus.ai_risk_ontology.datamodel.ai_risk_ontology import (
     Container,
 )
+from util.graph_layout import layout_graph
+from util.graph_shard_writer import GraphShardWriter
 
 
 class JSONGraphDumper(Dumper):
 
-    def __init__(self, schema_path):
+    def __init__(self, schema_path, writer: GraphShardWriter = None, layout: bool = False):
         super().__init__()
         self.schema_view = SchemaView(schema_path)
         self.nodes = []
         self.edges = []
 
+        # when a writer is given nodes and edges are streamed to it instead of kept in memory
+        self.writer = writer
+
+        # when layout is set node positions and a cluster overview are computed offline and exported,
+        # only the edge endpoints are kept for it
+        self.layout = layout
+        self.edge_pairs = []
+        self.overview = None
+
         self.clusters = []
         self.processed_ids = set()
         self.processed_tags = set()
         self.processed_clusters = set()
-        
+
+        # key-indexed registries so that dedup is a set/dict lookup instead of a list scan,
+        # node keys map to the node cluster and edges are identified by a digest of their content
+        self.node_index = {}
+        self.edge_index = set()
+        self.node_type_counts = Counter()
+
+        # schema lookups are repeated for every instance, so they are computed once
+        self._all_classes = None
+        self._class_slots = {}
+        self._slots = {}
+
+    def _add_node(self, node):
+        """Add a node unless a node with the same key was already added."""
+        if node["key"] in self.node_index:
+            return False
+
+        self.node_index[node["key"]] = node.get("cluster", "unknown")
+        self.node_type_counts[node.get("node_type")] += 1
+        if self.writer is not None:
+            self.writer.write_node(node)
+        else:
+            self.nodes.append(node)
+        return True
+
+    def _add_edge(self, edge):
+        """Add an edge unless an identical edge was already added."""
+        edge_id = hashlib.blake2b(
+            repr(tuple(edge.items())).encode("utf-8"), digest_size=16
+        ).digest()
+        if edge_id in self.edge_index:
+            return False
+
+        self.edge_index.add(edge_id)
+        if self.layout:
+            self.edge_pairs.append((edge["source"], edge["target"]))
+        if self.writer is not None:
+            self.writer.write_edge(
+                edge, self.node_index.get(edge["source"], "unknown")
+            )
+        else:
+            self.edges.append(edge)
+        return True
+
+    def all_classes(self):
+        if self._all_classes is None:
+            classes = list(self.schema_view.all_classes())
+            self._all_classes = (classes, set(classes))
+        return self._all_classes[0]
+
+    def is_class(self, name):
+        self.all_classes()
+        return name in self._all_classes[1]
+
+    def class_slots(self, class_name):
+        if class_name not in self._class_slots:
+            slots = self.schema_view.class_slots(class_name)
+            self._class_slots[class_name] = (slots, set(slots))
+        return self._class_slots[class_name][0]
+
+    def has_slot(self, class_name, slot_name):
+        self.class_slots(class_name)
+        return slot_name in self._class_slots[class_name][1]
+
+    def get_slot(self, slot_name):
+        if slot_name not in self._slots:
+            self._slots[slot_name] = self.schema_view.get_slot(slot_name)
+        return self._slots[slot_name]
 
     def _export_schema_structure(self):
         """Export schema classes and slots as nodes, with relationships as edges."""
@@ -48,7 +128,7 @@ class JSONGraphDumper(Dumper):
                     "definition_uri": cls.definition_uri,
                 },
             }
-            self.nodes.append(class_node)
+            self._add_node(class_node)
             self.processed_ids.add(class_node["key"])
             self.processed_tags.add("schema_class")
 
@@ -69,28 +149,22 @@ class JSONGraphDumper(Dumper):
                     "slot_uri": slot.slot_uri,
                 },
             }
-            self.nodes.append(slot_node)
+            self._add_node(slot_node)
             self.processed_ids.add(slot_node["key"])
             self.processed_tags.add("schema_slot")
 
         # Export schema relationships as edges
         self._export_schema_relationships()
-        self.nodes = [
-            i for n, i in enumerate(self.nodes) if i not in self.nodes[n + 1 :]
-        ]
-        self.edges = [
-            i for n, i in enumerate(self.edges) if i not in self.edges[n + 1 :]
-        ]
 
     def _export_schema_relationships(self):
         """Export relationships between schema elements."""
 
-        for class_name in self.schema_view.all_classes():
+        for class_name in self.all_classes():
             cls = self.schema_view.get_class(class_name)
 
             # Inheritance relationships (is_a)
             if cls.is_a:
-                self.edges.append(
+                self._add_edge(
                     {
                         "key": f"{class_name}_is_a_{cls.is_a}",
                         "source": f"{class_name}",
@@ -103,7 +177,7 @@ class JSONGraphDumper(Dumper):
             # Mixin relationships
             if cls.mixins:
                 for mixin in cls.mixins:
-                    self.edges.append(
+                    self._add_edge(
                         {
                             "key": f"{class_name}_mixin_{mixin}",
                             "source": f"{class_name}",
@@ -114,11 +188,11 @@ class JSONGraphDumper(Dumper):
                     )
 
             # Class-slot relationships
-            for slot_name in self.schema_view.class_slots(class_name):
-                slot = self.schema_view.get_slot(slot_name)
+            for slot_name in self.class_slots(class_name):
+                slot = self.get_slot(slot_name)
 
                 # Class has slot
-                self.edges.append(
+                self._add_edge(
                     {
                         "key": f"{class_name}_has_slot_{slot_name}",
                         "source": f"{class_name}",
@@ -129,8 +203,8 @@ class JSONGraphDumper(Dumper):
                 )
 
                 # Slot points to range (if it's another class)
-                if slot.range and slot.range in self.schema_view.all_classes():
-                    self.edges.append(
+                if slot.range and self.is_class(slot.range):
+                    self._add_edge(
                         {
                             "key": f"{slot_name}_range_{slot.range}",
                             "source": f"schema_slot:{slot_name}",
@@ -181,7 +255,8 @@ class JSONGraphDumper(Dumper):
                             )
                             # Create data instance node
                             data_node_id = f"{item.id}"
-                            if data_node_id not in self.processed_ids:
+                            is_new_node = data_node_id not in self.processed_ids
+                            if is_new_node:
                                 data_node = {
                                     "key": data_node_id,
                                     "node_type": "data_instance",
@@ -193,29 +268,28 @@ class JSONGraphDumper(Dumper):
                                     "attributes": {},
                                 }
                             obj_dict = item.dict()
-                            # Add simple attributes (non-relational data)
-                            for key, value in obj_dict.items():
-                                if (
-                                    not isinstance(value, (dict, list))
-                                    and not key.startswith("_")
-                                    and not isinstance(value, (date, datetime))
-                                ):
-                                    data_node["attributes"][key] = value
-
-                            self.nodes.append(data_node)
-                            self.processed_ids.add(data_node_id)
-                            self.processed_tags.add(type(item).__name__ or "")
-                            self.clusters.append(obj_cluster)
-                            self.processed_clusters.add(obj_cluster)
+                            if is_new_node:
+                                # Add simple attributes (non-relational data)
+                                for key, value in obj_dict.items():
+                                    if (
+                                        not isinstance(value, (dict, list))
+                                        and not key.startswith("_")
+                                        and not isinstance(value, (date, datetime))
+                                    ):
+                                        data_node["attributes"][key] = value
+
+                                self._add_node(data_node)
+                                self.processed_ids.add(data_node_id)
+                                self.processed_tags.add(type(item).__name__ or "")
+                                self.clusters.append(obj_cluster)
+                                self.processed_clusters.add(obj_cluster)
 
                             # Connect to schema class if it exists
                             schema_class_id = f"{obj_type}"
-                            if any(
-                                n["key"] == schema_class_id for n in self.nodes
-                            ):
-                                self.edges.append(
+                            if schema_class_id in self.node_index:
+                                self._add_edge(
                                     {
-                                        "key": f"{obj_id}_instance_of_{obj_type}",
+                                        "key": f"{data_node_id}_instance_of_{obj_type}",
                                         "source": data_node_id,
                                         "target": schema_class_id,
                                         "edge_type": "instance_of",
@@ -242,10 +316,9 @@ class JSONGraphDumper(Dumper):
             # Get slot information from schema if available
             slot_info = None
             try:
-                if source_type in self.schema_view.all_classes():
-                    class_slots = self.schema_view.class_slots(source_type)
-                    if slot_name in class_slots:
-                        slot_info = self.schema_view.get_slot(slot_name)
+                if self.is_class(source_type):
+                    if self.has_slot(source_type, slot_name):
+                        slot_info = self.get_slot(slot_name)
             except:
                 pass
 
@@ -268,7 +341,7 @@ class JSONGraphDumper(Dumper):
                         )
 
                         # Create relationship edge
-                        self.edges.append(
+                        self._add_edge(
                             {
                                 "key": f"{source_id}_{slot_name}_{target_id}",
                                 "source": source_id,
@@ -281,11 +354,11 @@ class JSONGraphDumper(Dumper):
                     elif (
                         isinstance(item, str)
                         and slot_info
-                        and slot_info.range in self.schema_view.all_classes()
+                        and self.is_class(slot_info.range)
                     ):
                         # String reference to another object
                         target_node_id = f"{item}"
-                        self.edges.append(
+                        self._add_edge(
                             {
                                 "key": f"{source_id}_{slot_name}_{item}",
                                 "source": source_id,
@@ -310,7 +383,7 @@ class JSONGraphDumper(Dumper):
                 )
 
                 # Create relationship edge
-                self.edges.append(
+                self._add_edge(
                     {
                         "key": f"{source_id}_{slot_name}_{target_id}",
                         "source": source_id,
@@ -324,11 +397,11 @@ class JSONGraphDumper(Dumper):
             elif (
                 isinstance(value, str)
                 and slot_info
-                and slot_info.range in self.schema_view.all_classes()
+                and self.is_class(slot_info.range)
             ):
                 # String reference to another object
                 target_node_id = f"{value}"
-                self.edges.append(
+                self._add_edge(
                     {
                         "key": f"{source_id}_{slot_name}_{value}",
                         "source": source_id,
@@ -387,93 +460,118 @@ class JSONGraphDumper(Dumper):
         # Then, export the data instances if provided
         self._export_data_object(element.__dict__)
 
-
-        def _tag_output_format(tag):
-            if tag == None or tag == "unknown":
-                return {"key": "unknown", "image": "unknown.svg"}
-            if tag == "Stakeholder":
-                return {"key": "Stakeholder", "image": "person.svg"}
-            if tag == "StakeholderGroup":
-                return {"key": "StakeholderGroup", "image": "StakeholderGroup.svg"}
-            if tag == "Action":
-                return {"key": "Action", "image": "Action.svg"}
-            if tag == "Organization":
-                return {"key": "Organization", "image": "Organization.svg"}
-            if tag == "Documentation":
-                return {"key": "Documentation", "image": "Documentation.svg"}
-            if tag == "Risk":
-                return {"key": "Risk", "image": "Risk.svg"}
-            if tag == "RiskIncident":
-                return {"key": "RiskIncident", "image": "RiskIncident.svg"}
-            if tag == "RiskGroup":
-                return {"key": "RiskGroup", "image": "RiskGroup.svg"}
-            if tag == "RiskTaxonomy":
-                return {"key": "RiskTaxonomy", "image": "RiskTaxonomy.svg"}
-            if tag == "Dataset":
-                return {"key": "Dataset", "image": "Dataset.svg"}
-            if tag == "License":
-                return {"key": "License", "image": "License.svg"}
-            if tag == "Principle":
-                return {"key": "Principle", "image": "Principle.svg"}
-            if tag == "Adapter":
-                return {"key": "Adapter", "image": "Adapter.svg"}
-            if tag == "LargeLanguageModel":
-                return {"key": "LargeLanguageModel", "image": "LargeLanguageModel.svg"}
-            else:
-                return {"key": tag, "image": "unknown.svg"}
-
-        self.edges = [
-            i for n, i in enumerate(self.edges) if i not in self.edges[:n]
-        ]
-
-        def get_color_array(length):
-            colors = []
-            i = 0
-            while True:
-                r = random.randint(0, 255)
-                g = random.randint(0, 255)
-                b = random.randint(0, 255)
-                colors.append(f"#{r:02x}{g:02x}{b:02x}")
-                i += 1
-                if i > length: 
-                    break
-            return colors
-
-        color_arr = get_color_array(len(self.processed_clusters))
-
         output = {
             "nodes": self.nodes,
             "edges": self.edges,
+            **self._graph_summary(),
+        }
+
+        if self.layout:
+            positions = self._compute_layout()
+            for node in self.nodes:
+                node["x"], node["y"] = positions[node["key"]]
+            output["overview"] = self.overview
+
+        return json.dumps(output)
+
+    def dump_shards(self, element: Union[BaseModel, YAMLRoot], output_dir: str) -> Dict:
+        """
+        Stream element to output_dir as per-cluster NDJSON node/edge shards with a manifest.
+        Nodes and edges are written as they are exported and are not kept in memory.
+
+        Args:
+            element: Union[BaseModel, YAMLRoot],
+                LinkML object to be emitted
+            output_dir: str
+                directory for manifest.json and the shards
+
+        Returns:
+            Dict: the manifest
+        """
+        self.writer = GraphShardWriter(output_dir)
+        self._export_data_object(element.__dict__)
+
+        if self.layout:
+            positions = self._compute_layout()
+            for key, cluster in self.node_index.items():
+                self.writer.write_position(cluster, key, positions[key])
+
+        summary = self._graph_summary()
+        return self.writer.close(
+            summary["clusters"], summary["tags"], summary["metadata"], self.overview
+        )
+
+    def _compute_layout(self) -> Dict:
+        """Lay out the exported graph, returns the node positions and sets the cluster overview."""
+        positions, self.overview = layout_graph(self.node_index, self.edge_pairs)
+        self.edge_pairs = []
+        return positions
+
+    def _graph_summary(self) -> Dict:
+        """Clusters with colors, tags with images and node/edge counts of the exported graph."""
+        clusters = list(self.processed_clusters)
+        color_arr = self._get_color_array(len(clusters))
+
+        return {
             "clusters": [
                 {"key": cluster, "color": color_arr[index], "clusterLabel": cluster}
-                for index, cluster in enumerate(self.processed_clusters)
+                for index, cluster in enumerate(clusters)
             ],
-            "tags": [_tag_output_format(tag) for tag in self.processed_tags],
+            "tags": [self._tag_output_format(tag) for tag in self.processed_tags],
             "metadata": {
-                "schema_classes": len(
-                    [
-                        n
-                        for n in self.nodes
-                        if n.get("node_type") == "schema_class"
-                    ]
-                ),
-                "schema_slots": len(
-                    [
-                        n
-                        for n in self.nodes
-                        if n.get("node_type") == "schema_slot"
-                    ]
-                ),
-                "data_instances": len(
-                    [
-                        n
-                        for n in self.nodes
-                        if n.get("node_type") == "data_instance"
-                    ]
-                ),
-                "total_nodes": len(self.nodes),
-                "total_edges": len(self.edges),
+                "schema_classes": self.node_type_counts["schema_class"],
+                "schema_slots": self.node_type_counts["schema_slot"],
+                "data_instances": self.node_type_counts["data_instance"],
+                "total_nodes": len(self.node_index),
+                "total_edges": len(self.edge_index),
             },
         }
 
-        return json.dumps(output)
+    @staticmethod
+    def _tag_output_format(tag):
+        if tag == None or tag == "unknown":
+            return {"key": "unknown", "image": "unknown.svg"}
+        if tag == "Stakeholder":
+            return {"key": "Stakeholder", "image": "person.svg"}
+        if tag == "StakeholderGroup":
+            return {"key": "StakeholderGroup", "image": "StakeholderGroup.svg"}
+        if tag == "Action":
+            return {"key": "Action", "image": "Action.svg"}
+        if tag == "Organization":
+            return {"key": "Organization", "image": "Organization.svg"}
+        if tag == "Documentation":
+            return {"key": "Documentation", "image": "Documentation.svg"}
+        if tag == "Risk":
+            return {"key": "Risk", "image": "Risk.svg"}
+        if tag == "RiskIncident":
+            return {"key": "RiskIncident", "image": "RiskIncident.svg"}
+        if tag == "RiskGroup":
+            return {"key": "RiskGroup", "image": "RiskGroup.svg"}
+        if tag == "RiskTaxonomy":
+            return {"key": "RiskTaxonomy", "image": "RiskTaxonomy.svg"}
+        if tag == "Dataset":
+            return {"key": "Dataset", "image": "Dataset.svg"}
+        if tag == "License":
+            return {"key": "License", "image": "License.svg"}
+        if tag == "Principle":
+            return {"key": "Principle", "image": "Principle.svg"}
+        if tag == "Adapter":
+            return {"key": "Adapter", "image": "Adapter.svg"}
+        if tag == "LargeLanguageModel":
+            return {"key": "LargeLanguageModel", "image": "LargeLanguageModel.svg"}
+        else:
+            return {"key": tag, "image": "unknown.svg"}
+
+    @staticmethod
+    def _get_color_array(length):
+        colors = []
+        i = 0
+        while True:
+            r = random.randint(0, 255)
+            g = random.randint(0, 255)
+            b = random.randint(0, 255)
+            colors.append(f"#{r:02x}{g:02x}{b:02x}")
+            i += 1
+            if i > length: 
+                break
+        return colors
@@ -0,0 +1,129 @@
+"""
+Benchmark of loading a local explanation CSV into a BipartiteGraph.
+
+Compares the row-wise loader (DataFrame.apply + ast.literal_eval + set(product))
+with the columnar loader used by Pipeline.get_graph_expl on a synthetic CSV.
+
+    python examples/benchmarks/graph_loading.py --rows 50000
+"""
+
+import argparse
+import ast
+import itertools
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from risk_policy_distillation.explanation.bipartite_graph import (
+    BipartiteGraph,
+    Edge,
+    Node,
+)
+from risk_policy_distillation.pipeline.pipeline import parse_concept_column
+
+
+LABELS = [0, 1]
+LABEL_NAMES = ["harmless", "harmful"]
+
+
+def generate_csv(path, n_rows, n_concepts=2000, seed=0):
+    rng = random.Random(seed)
+    vocabulary = ["concept {}".format(i) for i in range(n_concepts)]
+
+    records = []
+    for i in range(n_rows):
+        records.append(
+            [i, "prompt {}".format(i), "harm", rng.choice(LABELS), rng.choice(LABELS)]
+            + [str(rng.sample(vocabulary, rng.randint(0, 4))) for _ in LABEL_NAMES]
+        )
+
+    pd.DataFrame(
+        records,
+        columns=["Index", "Prompt", "Criterion", "GG Label", "True Label"] + LABEL_NAMES,
+    ).to_csv(path, index=False)
+
+
+def rowwise_graph(df):
+    """The loader as it was before the columnar implementation."""
+
+    def custom_zipp(concepts):
+        max_len = max(len(c) for c in concepts)
+        if not max_len:
+            return []
+        for c in concepts:
+            if len(c) < max_len:
+                c += ["none"] * (max_len - len(c))
+        return list(set(itertools.product(*concepts)))
+
+    graph = BipartiteGraph(LABELS)
+    for i in LABELS:
+        cds = df[df["GG Label"] == i].copy()
+        zipped = cds.apply(
+            lambda x: custom_zipp([ast.literal_eval(x[LABEL_NAMES[d]]) for d in LABELS]),
+            axis=1,
+        )
+        for c in [item for sublist in zipped.values.tolist() for item in sublist]:
+            if c[i] != "none":
+                central_node = Node(id=graph.counts[i], value=c[i])
+                graph.add_node(central_node, i)
+                for l in LABELS:
+                    if l != i and c[l] != "none":
+                        node = Node(id=graph.counts[l], value=c[l])
+                        graph.add_node(node, l)
+                        graph.add_edge(Edge(len(graph.edges), central_node.id, node.id, source_side=i))
+        graph.start_sizes[i] = len(graph.nodes[i])
+
+    return graph
+
+
+def columnar_graph(df):
+    graph = BipartiteGraph(LABELS)
+    parsed = {}
+    for i in LABELS:
+        cds = df[df["GG Label"] == i]
+        columns = [parse_concept_column(cds[LABEL_NAMES[d]].tolist(), parsed) for d in LABELS]
+        graph.load_concepts(columns, label=i)
+
+    return graph
+
+
+def signature(graph):
+    nodes = {l: sorted(n.value for n in graph.nodes[l]) for l in graph.labels}
+    values = {(l, n.id): n.value for l in graph.labels for n in graph.nodes[l]}
+    edges = sorted(
+        (values[(e.source_side, e.source)], values[(1 - e.source_side, e.target)])
+        for e in graph.edges
+    )
+    return nodes, edges
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp, "local_expl.csv")
+        generate_csv(path, args.rows)
+        df = pd.read_csv(path, header=0)
+
+    start = time.perf_counter()
+    old = rowwise_graph(df)
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = columnar_graph(df)
+    new_time = time.perf_counter() - start
+
+    assert signature(old) == signature(new), "Loaders produced different graphs"
+
+    print("Rows: {}  Nodes: {}  Edges: {}".format(args.rows, new.size(), len(new.edges)))
+    print("Row-wise loader: {:.2f}s".format(old_time))
+    print("Columnar loader: {:.2f}s ({:.1f}x)".format(new_time, old_time / new_time))
+
+
+if __name__ == "__main__":
+    main()
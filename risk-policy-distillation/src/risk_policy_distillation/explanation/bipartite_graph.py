@@ -1,11 +1,29 @@
-import copy
+import itertools
 import logging
 
 import numpy as np
 
+
 logger = logging.getLogger('logger')
 
 
+def zip_concepts(concepts):
+    """
+    Pairs up concepts of a single local explanation across labels
+    :param concepts: A list of concept lists, one per label
+    :return: All unique combinations of concepts, shorter lists are padded with 'none'
+    """
+    max_len = max((len(c) for c in concepts), default=0)
+
+    if not max_len:
+        return []
+
+    padded = [list(c) + ['none'] * (max_len - len(c)) for c in concepts]
+
+    # dict keeps the first-seen order, so the graph is the same between runs
+    return list(dict.fromkeys(itertools.product(*padded)))
+
+
 class Node:
 
     def __init__(self, id, value, probability=1.0, subnodes=[]):
@@ -14,7 +32,7 @@ class Node:
         self.probability = probability
         self.subnodes = subnodes
 
-        self.num_subnodes = sum([s.num_subnodes for s in self.subnodes]) + len(subnodes)
+        self.num_subnodes = (sum(s.num_subnodes for s in subnodes) + len(subnodes)) if subnodes else 0
 
     def get_importance(self, n):
         # TODO: this should be normalized to [0, 1]
@@ -89,17 +107,32 @@ class BipartiteGraph:
         :param label: A partition to assign the nodes to
         :return:
         """
+        # nodes and edges are built in bulk with local counters -- ids match adding them one by one
+        counts = dict(self.counts)
+        new_nodes = {l: [] for l in self.labels}
+        new_edges = []
+        n_edges = len(self.edges)
+        others = [l for l in self.labels if l != label]
+
         for c in connected_nodes:
-            if c[label] != 'none':
-                central_node = Node(id=self.counts[label], value=c[label])
-                self.add_node(central_node, label)
+            if c[label] == 'none':
+                continue
+
+            central_id = counts[label]
+            new_nodes[label].append(Node(id=central_id, value=c[label]))
+            counts[label] += 1
 
-                for l in self.labels:
-                    if l != label and c[l] != 'none':
-                        node = Node(id=self.counts[l], value=c[l])
-                        self.add_node(node, l)
-                        edge = Edge(len(self.edges), central_node.id, node.id, source_side=label)
-                        self.add_edge(edge)
+            for l in others:
+                if c[l] != 'none':
+                    new_nodes[l].append(Node(id=counts[l], value=c[l]))
+                    new_edges.append(Edge(n_edges, central_id, counts[l], source_side=label))
+                    counts[l] += 1
+                    n_edges += 1
+
+        for l in self.labels:
+            self.nodes[l].extend(new_nodes[l])
+        self.counts = counts
+        self.edges.extend(new_edges)
 
         self.start_sizes[label] = len(self.nodes[label])
 
@@ -107,6 +140,19 @@ class BipartiteGraph:
                                                                                                         [len(self.nodes[k]) for k in self.labels],
                                                                                                         len(self.edges)))
 
+    def load_concepts(self, concept_columns, label=0):
+        """
+        Creates the graph from per-label columns of already parsed concept lists
+        :param concept_columns: A list with one column per label, each holding a list of concepts for every row
+        :param label: A partition to assign the nodes to
+        :return:
+        """
+        connected_nodes = []
+        for row in zip(*concept_columns):
+            connected_nodes.extend(zip_concepts(row))
+
+        self.load_graph(connected_nodes, label=label)
+
     def merge_nodes(self, node_ids, new_label, probability, side, cleanup=False):
         """
         Merges nodes with ids in node_ids into a new node with new_label as label
@@ -119,7 +165,8 @@ class BipartiteGraph:
         logger.info('\n\t\t\tMerging {} nodes on {} side.'.format(len(node_ids), side))
         merging = self.nodes[side]
 
-        old_nodes = copy.deepcopy([n for n in merging if n.id in node_ids])
+        # merged nodes are removed from the graph below, so they can be kept as subnodes without copying
+        old_nodes = [n for n in merging if n.id in node_ids]
 
         old_edges_source = [e for e in self.edges if e.source in node_ids and e.source_side == side]
         old_edges_target = [e for e in self.edges if e.target in node_ids and e.source_side != side]
@@ -207,7 +254,7 @@ class BipartiteGraph:
                 importance = n.get_importance(size)
                 prediction = side
 
-                r = Rule(argument_because=n.value, argument_despite=despites, prediction=prediction, importance=importance)
+                r = Rule(argument_because=n.value, argument_despite=despites, prediction=prediction, importance=importance, node_id=n.id)
                 rules.append(r)
 
         return rules
@@ -221,11 +268,12 @@ class BipartiteGraph:
 
 class Rule:
 
-    def __init__(self, argument_because, argument_despite, prediction, importance):
+    def __init__(self, argument_because, argument_despite, prediction, importance, node_id=None):
         self.argument_because = argument_because
         self.argument_despite = argument_despite
         self.prediction = prediction
         self.importance = importance
+        self.node_id = node_id
 
     def print(self):
         return '({} | {}) Pred: {} Importance:{}'.format(self.argument_because, ','.join(self.argument_despite), self.prediction, self.importance)
\ No newline at end of file
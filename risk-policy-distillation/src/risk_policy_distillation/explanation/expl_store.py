@@ -0,0 +1,115 @@
+import itertools
+import json
+import logging
+
+
+logger = logging.getLogger('logger')
+
+FORMAT_NAME = 'glove-explanation'
+FORMAT_VERSION = 1
+
+
+def flatten_provenance(graph):
+    """
+    Flattens the merge history of all nodes in the graph into a list of node records
+    :param graph: BipartiteGraph
+    :return: a list of node records where subnodes are referenced by integer ids,
+             and a dict mapping (side, node id) of the graph nodes to the record ids
+    """
+    records = []
+    graph_ids = {}
+
+    def add(node, side):
+        subnode_ids = [add(s, side) for s in node.subnodes]
+        record_id = len(records)
+        records.append({'id': record_id,
+                        'side': side,
+                        'value': node.value,
+                        'probability': float(node.probability),
+                        'subnodes': subnode_ids})
+        return record_id
+
+    for side in graph.labels:
+        for n in graph.nodes[side]:
+            graph_ids[(side, n.id)] = add(n, side)
+
+    return records, graph_ids
+
+
+def save_explanation(path, rules, provenance, labels):
+    """
+    Writes a global explanation as JSON lines: a header, one line per rule and one line per provenance node
+    :param path: Path to the explanation file
+    :param rules: A list of rule records with because, despite, prediction, importance and node keys
+    :param provenance: A list of node records as returned by flatten_provenance
+    :param labels: List of possible labels in the task
+    :return:
+    """
+    header = {'format': FORMAT_NAME,
+              'version': FORMAT_VERSION,
+              'labels': labels,
+              'n_rules': len(rules),
+              'n_nodes': len(provenance)}
+
+    with open(path, 'w') as f:
+        f.write(json.dumps(header) + '\n')
+        for record in rules:
+            f.write(json.dumps(record) + '\n')
+        for record in provenance:
+            f.write(json.dumps(record) + '\n')
+
+    logger.info('Stored global explanation with {} rules to {}'.format(len(rules), path))
+
+
+def read_header(path):
+    """
+    Reads only the header of an explanation file
+    :param path: Path to the explanation file
+    :return: the header dict or None if the file is not a global explanation
+    """
+    try:
+        with open(path, 'r') as f:
+            header = json.loads(f.readline())
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(header, dict) or header.get('format') != FORMAT_NAME:
+        return None
+
+    if header['version'] > FORMAT_VERSION:
+        raise ValueError('Global explanation {} has version {}, only versions up to {} are supported.'.format(
+            path, header['version'], FORMAT_VERSION))
+
+    return header
+
+
+def load_rules(path):
+    """
+    Loads the rules of an explanation without reading the provenance section
+    :param path: Path to the explanation file
+    :return: the header and a list of rule records
+    """
+    header = read_header(path)
+    if header is None:
+        raise ValueError('{} is not a global explanation file.'.format(path))
+
+    with open(path, 'r') as f:
+        lines = itertools.islice(f, 1, 1 + header['n_rules'])
+        rules = [json.loads(line) for line in lines]
+
+    return header, rules
+
+
+def load_provenance(path):
+    """
+    Loads the provenance section of an explanation file
+    :param path: Path to the explanation file
+    :return: a list of node records
+    """
+    header = read_header(path)
+    if header is None:
+        raise ValueError('{} is not a global explanation file.'.format(path))
+
+    with open(path, 'r') as f:
+        lines = itertools.islice(f, 1 + header['n_rules'], None)
+        return [json.loads(line) for line in lines]
@@ -0,0 +1,133 @@
+# coding=utf-8
+# Copyright 2023-present the International Business Machines.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Persistent cache of NLI relationships (in-memory LRU in front of SQLite)
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+
+class NLICache:
+    """
+    Memoizes NLI relationships keyed by (model, prompt_version, premise, hypothesis).
+
+    Lookups go to a bounded in-memory LRU first and fall back to an optional
+    SQLite file, so repeated pairs are only sent to the inference engine once
+    across iterations and across runs.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_size: int = 100000,
+    ):
+        """
+        :param path: Path to the SQLite file. If None the cache lives in memory only.
+        :param max_size: Maximum number of entries kept in the in-memory LRU.
+        """
+        self.path = Path(path) if path is not None else None
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS nli ("
+                "key TEXT PRIMARY KEY, label TEXT NOT NULL, probability REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, premise: str, hypothesis: str) -> str:
+        payload = "\x1f".join([model, prompt_version, premise, hypothesis])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        :param key: Key generated by make_key
+        :return: the cached {"label", "probability"} dict or None
+        """
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return dict(self._lru[key])
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT label, probability FROM nli WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    result = {"label": row[0], "probability": row[1]}
+                    self._remember(key, result)
+                    self.hits += 1
+                    return dict(result)
+
+            self.misses += 1
+            return None
+
+    def get_many(self, keys: List[str]) -> List[Optional[Dict]]:
+        return [self.get(key) for key in keys]
+
+    def put(self, key: str, result: Dict):
+        self.put_many([(key, result)])
+
+    def put_many(self, items: List[Tuple[str, Dict]]):
+        """
+        :param items: A list of (key, {"label", "probability"}) pairs
+        """
+        with self._lock:
+            for key, result in items:
+                self._remember(
+                    key,
+                    {
+                        "label": result["label"],
+                        "probability": float(result["probability"]),
+                    },
+                )
+
+            if self._conn is not None and len(items):
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO nli (key, label, probability) VALUES (?, ?, ?)",
+                    [(k, r["label"], float(r["probability"])) for k, r in items],
+                )
+                self._conn.commit()
+
+    def _remember(self, key, result):
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def __len__(self):
+        if self._conn is not None:
+            return self._conn.execute("SELECT COUNT(*) FROM nli").fetchone()[0]
+        return len(self._lru)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -24,6 +24,7 @@ import numpy as np
 from tqdm import tqdm
 
 from risk_policy_distillation.fm_factual.llm_handler import LLMHandler
+from risk_policy_distillation.fm_factual.nli_cache import NLICache
 from risk_policy_distillation.fm_factual.utils import (
     DEFAULT_PROMPT_BEGIN,
     DEFAULT_PROMPT_END,
@@ -297,6 +298,10 @@ class NLIExtractor:
     v1 - original
     v2 - more recent (with reasoning)
     v3 - only for Google search results
+
+    If a NLICache is given, relationships are memoized by
+    (model, prompt_version, premise, hypothesis) and only cache misses
+    are sent to the inference engine.
     """
 
     def __init__(
@@ -308,8 +313,10 @@ class NLIExtractor:
         debug: bool = False,
         is_bert: bool = False,
         RITS: bool = True,
+        cache: NLICache = None,
     ):
         self.inference_engine = inference_engine
+        self.cache = cache
         self.model = model
         self.method = method
         self.prompt_version = prompt_version
@@ -457,7 +464,58 @@ class NLIExtractor:
 
         return label, probability
 
+    def cache_key(self, premise: str, hypothesis: str) -> str:
+        model = "bert" if self.is_bert else self.model
+        return NLICache.make_key(model, self.prompt_version, premise, hypothesis)
+
     def run(self, premise: str, hypothesis: str):
+        if self.cache is None:
+            return self._run(premise, hypothesis)
+
+        key = self.cache_key(premise, hypothesis)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._run(premise, hypothesis)
+            self.cache.put(key, result)
+
+        return result
+
+    def runall(self, premises: List[str], hypotheses: List[str]):
+        if self.cache is None:
+            return self._runall(premises, hypotheses)
+
+        keys = [
+            self.cache_key(premise, hypothesis)
+            for premise, hypothesis in zip(premises, hypotheses)
+        ]
+        results = self.cache.get_many(keys)
+
+        # send each distinct uncached pair to the engine only once
+        missing = {}
+        for i, (key, result) in enumerate(zip(keys, results)):
+            if result is None and key not in missing:
+                missing[key] = i
+
+        print(
+            f"[NLIExtractor] Cache hits: {len(keys) - len(missing)}/{len(keys)}"
+        )
+
+        if len(missing):
+            computed = self._runall(
+                [premises[i] for i in missing.values()],
+                [hypotheses[i] for i in missing.values()],
+            )
+            computed = dict(zip(missing.keys(), computed))
+            self.cache.put_many(list(computed.items()))
+
+            results = [
+                result if result is not None else dict(computed[key])
+                for key, result in zip(keys, results)
+            ]
+
+        return results
+
+    def _run(self, premise: str, hypothesis: str):
 
         if not self.is_bert:  # check if LLM is used
             prompt = self.make_prompt(premise, hypothesis)
@@ -480,7 +538,7 @@ class NLIExtractor:
 
         return result
 
-    def runall(self, premises: List[str], hypotheses: List[str]):
+    def _runall(self, premises: List[str], hypotheses: List[str]):
 
         if not self.is_bert:  # check if LLM is used
             generated_texts = []
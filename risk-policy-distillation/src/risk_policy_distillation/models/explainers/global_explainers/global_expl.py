@@ -1,27 +1,74 @@
 import json
 import logging
-import os
 import pickle
-from datetime import datetime, timedelta
+import time
 from json import JSONDecodeError
+from pathlib import Path
+
+from risk_policy_distillation.explanation.bipartite_graph import Rule
+from risk_policy_distillation.explanation.expl_store import (
+    flatten_provenance,
+    load_provenance,
+    load_rules,
+    read_header,
+    save_explanation,
+)
+
 
 logger = logging.getLogger("logger")
 
+COVERAGE_CONTEXT = """You are a verifier model that can evaluate whether a specific concept is contained in a text.
+                   """
+
+COVERAGE_PROMPT = """
+                  Here is a text: {sentence}.
+
+                  Can this text be described by the following concept: {clause}?
+
+                  Answer with Yes only if you are certain the concept is present in the text.
+
+                  Answer with Yes or No and your step-by-step reasoning <REASONING> in the following JSON format:
+                  {{
+                     "reasoning": <REASONING>,
+                     "answer": "Yes"/"No"
+                  }}
+                  """
+
+COVERAGE_RESPONSE_FORMAT = {
+    "type": "object",
+    "properties": {
+        "reasoning": {"type": "string"},
+        "answer": {"type": "string", "enum": ["Yes", "No"]},
+    },
+    "required": ["reasoning", "answer"],
+}
+
 
 class GlobalExplainer:
 
     def __init__(
-        self, expl_graph=None, expl_path=None, guardian=None, name="GloVE", perc=1.0
+        self,
+        expl_graph=None,
+        expl_path=None,
+        guardian=None,
+        name="GloVE",
+        perc=1.0,
+        inference_engine=None,
     ):
         self.expl_graph = expl_graph
         self.expl_path = expl_path
 
         self.guardian = guardian
+        # LLM used to verify if a rule clause covers an input
+        self.inference_engine = inference_engine
+
+        self._provenance = None
 
         if expl_graph is None and expl_path is not None:
-            self.expl_graph = self.load(self.expl_path)
+            self.expl = self.load(self.expl_path)
+        else:
+            self.expl = self.expl_graph.get_expl()
 
-        self.expl = self.expl_graph.get_expl()
         self.rules, self.despites, self.predictions, self.importances = (
             self.unpack_expl(self.expl)
         )
@@ -30,14 +77,16 @@ class GlobalExplainer:
         self.rules = self.rules[0:keep_rules]
         self.despites = self.despites[0:keep_rules]
         self.predictions = self.predictions[0:keep_rules]
+        self.importances = self.importances[0:keep_rules]
 
         logger.info("Loaded {} rules".format(len(self.rules)))
 
         self.name = name
 
-        # self.verifier = RITSInferenceEngine("meta-llama/llama-3-3-70b-instruct",
-        #                                     credentials={"api_key": os.getenv('RITS_API_KEY'),
-        #                                                  "api_url": "https://inference-3scale-apicast-production.apps.rits.fmaas.res.ibm.com"})
+        # memoized answers of the verifier LLM for (clause, input) pairs
+        self.coverage = {}
+        self.embedding_model = None
+        self.throughput = None
 
     def unpack_expl(self, rules):
         arguments = []
@@ -62,82 +111,210 @@ class GlobalExplainer:
         return arguments, despites, predictions, importances
 
     def predict(self, x):
-        start_time = datetime.now()
-
-        for i, r in enumerate(self.rules):
-            current_time = datetime.now()
-            time_difference = current_time - start_time
-            three_minutes = timedelta(minutes=3)
-
-            time_expired = time_difference >= three_minutes
-            if time_expired:
-                logger.info("Time expired")
-                return None
-
-            # check if main clause is covered
-            if not self.covers(r, x):
-                continue
-
-            # check if one of the despite clauses is covered
-            if self.despites[i] != "none":
-                for d in self.despites[i]:
-                    if self.covers(d, x):
-                        return self.predictions[i]
-            else:
-                return self.predictions[i]
+        return self.predict_batch([x])[0]
+
+    def predict_batch(self, inputs, batch_size=32, prefilter_threshold=None):
+        """
+        Predicts a list of inputs with the global explanation, keeping rule order semantics of predict.
+        All coverage questions needed in a round are sent as batched inference requests and
+        repeated (clause, input) pairs are answered from memory.
+        :param inputs: a list of textual inputs
+        :param batch_size: number of coverage questions sent in a single chat call
+        :param prefilter_threshold: if set, (clause, input) pairs with embedding cosine similarity below
+                                    the threshold are treated as not covered without asking the LLM
+        :return: a list of predictions, None for inputs not covered by any rule
+        """
+        start_time = time.perf_counter()
+
+        if prefilter_threshold is not None:
+            self.prefilter(inputs, prefilter_threshold)
+
+        predictions = [None] * len(inputs)
+        # position of each unresolved input: (rule index, checking despite clauses)
+        states = {j: (0, False) for j in range(len(inputs))}
+
+        while len(states):
+            questions = []
+            for j, (i, despite) in states.items():
+                if i >= len(self.rules):
+                    continue
+                if not despite:
+                    questions.append((self.rules[i], inputs[j]))
+                elif self.despites[i] != "none":
+                    questions.extend((d, inputs[j]) for d in self.despites[i])
+
+            self.covers_batch(questions, batch_size=batch_size)
+
+            next_states = {}
+            for j, (i, despite) in states.items():
+                if i >= len(self.rules):
+                    continue
+
+                if not despite:
+                    if not self.covers(self.rules[i], inputs[j]):
+                        next_states[j] = (i + 1, False)
+                    elif self.despites[i] == "none":
+                        predictions[j] = self.predictions[i]
+                    else:
+                        next_states[j] = (i, True)
+                elif any(self.covers(d, inputs[j]) for d in self.despites[i]):
+                    predictions[j] = self.predictions[i]
+                else:
+                    next_states[j] = (i + 1, False)
+
+            states = next_states
+
+        elapsed = time.perf_counter() - start_time
+        self.throughput = len(inputs) / elapsed if elapsed > 0 else float("inf")
+        logger.info(
+            "Predicted {} inputs in {:.2f}s ({:.2f} inputs/s)".format(
+                len(inputs), elapsed, self.throughput
+            )
+        )
 
-        return None
+        return predictions
 
-    def covers(self, expl_clause, x):
-        context = """You are a verifier model that can evaluate whether a specific concept is contained in a text.
-                         """
+    def prefilter(self, inputs, threshold):
+        """
+        Marks (clause, input) pairs that clearly do not match as not covered using sentence embeddings
+        :param inputs: a list of textual inputs
+        :param threshold: minimum cosine similarity for a pair to be sent to the LLM
+        :return:
+        """
+        from sentence_transformers import SentenceTransformer, util
 
-        prompt = """
-                        Here is a text: {sentence}.
+        clauses = list(dict.fromkeys(
+            self.rules + [d for ds in self.despites if ds != "none" for d in ds]
+        ))
+        unique_inputs = list(dict.fromkeys(inputs))
 
-                        Can this text be described by the following concept: {clause}?
+        if self.embedding_model is None:
+            self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
 
-                        Answer with Yes only if you are certain the concept is present in the text.
-
-                        Answer with Yes or No and your step-by-step reasoning <REASONING> in the following JSON format:
-                        {{
-                           "reasoning": <REASONING>,
-                           "answer": "Yes"/"No"
-                        }}
-                        """.format(
-            sentence=x, clause=expl_clause
+        similarities = util.cos_sim(
+            self.embedding_model.encode(clauses), self.embedding_model.encode(unique_inputs)
         )
 
-        try_num = 1
-        i = 0
-        response = ""
+        skipped = 0
+        for c, clause in enumerate(clauses):
+            for j, x in enumerate(unique_inputs):
+                if similarities[c][j] < threshold and (clause, x) not in self.coverage:
+                    self.coverage[(clause, x)] = False
+                    skipped += 1
 
-        while i < try_num:
-            try:
-                response = self.verifier.send_request(context, prompt, temperature=0.0)
-                response = json.loads(response)["answer"]
-                break
-            except JSONDecodeError:
-                i += 1
+        logger.info("Embedding pre-filter skipped {} coverage questions".format(skipped))
 
-        return response == "Yes"
+    def covers(self, expl_clause, x):
+        if (expl_clause, x) not in self.coverage:
+            self.covers_batch([(expl_clause, x)])
+
+        return self.coverage[(expl_clause, x)]
+
+    def covers_batch(self, questions, batch_size=32):
+        """
+        Answers coverage questions that are not memoized yet in batched chat calls
+        :param questions: a list of (clause, input) pairs
+        :param batch_size: number of questions sent in a single chat call
+        :return:
+        """
+        pending = [q for q in dict.fromkeys(questions) if q not in self.coverage]
+        if len(pending) and self.inference_engine is None:
+            raise ValueError(
+                "GlobalExplainer needs an inference_engine to check which rules cover "
+                "an input."
+            )
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            messages = [
+                [
+                    {"role": "system", "content": COVERAGE_CONTEXT},
+                    {
+                        "role": "user",
+                        "content": COVERAGE_PROMPT.format(sentence=x, clause=clause),
+                    },
+                ]
+                for clause, x in batch
+            ]
+
+            outputs = self.inference_engine.chat(
+                messages,
+                response_format=COVERAGE_RESPONSE_FORMAT,
+                postprocessors=["json_object"],
+            )
+
+            for q, output in zip(batch, outputs):
+                try:
+                    self.coverage[q] = output.prediction["answer"] == "Yes"
+                except (JSONDecodeError, KeyError, TypeError):
+                    self.coverage[q] = False
+
+    @property
+    def provenance(self):
+        """
+        Merge history of the explanation as node records whose subnodes are referenced by integer ids.
+        Read from the explanation file only when first accessed.
+        """
+        if self._provenance is None:
+            if self.expl_graph is not None:
+                self._provenance, _ = flatten_provenance(self.expl_graph)
+            else:
+                self._provenance = load_provenance(self.expl_path)
+
+        return self._provenance
 
     def load(self, path):
-        with open(path, "rb") as file:
-            graph = pickle.load(file)
-            logger.info("Loaded graph explanation from {}".format(path))
-            return graph
+        path = Path(path)
+        if read_header(path) is None:
+            # explanations stored by earlier versions are pickled BipartiteGraph objects
+            with open(path, "rb") as file:
+                self.expl_graph = pickle.load(file)
+                logger.info("Loaded graph explanation from {}".format(path))
+                return self.expl_graph.get_expl()
+
+        header, records = load_rules(path)
+        self.labels = header["labels"]
+        logger.info("Loaded global explanation from {}".format(path))
+
+        return [
+            Rule(
+                argument_because=r["because"],
+                argument_despite=r["despite"],
+                prediction=r["prediction"],
+                importance=r["importance"],
+                node_id=r["node"],
+            )
+            for r in records
+        ]
 
     def save(self, path):
-        with open(path, "wb") as file:
-            pickle.dump(self.expl_graph, file)
-            logger.info(f"Stored global explanation to {path}")
+        if self.expl_graph is not None:
+            provenance, graph_ids = flatten_provenance(self.expl_graph)
+            labels = self.expl_graph.labels
+            node_ids = [graph_ids.get((r.prediction, r.node_id)) for r in self.expl]
+        else:
+            provenance = self.provenance
+            labels = self.labels
+            node_ids = [r.node_id for r in self.expl]
+
+        records = [
+            {
+                "because": r.argument_because,
+                "despite": r.argument_despite,
+                "prediction": r.prediction,
+                "importance": r.importance,
+                "node": node_id,
+            }
+            for r, node_id in zip(self.expl, node_ids)
+        ]
+
+        save_explanation(path, records, provenance, labels)
 
     def save_as_json(self, path):
         json_format = self.print()
-        with open(path, 'wb') as f:
-            json.dumps(json_format, f)
-            print(f'Saved json format of the explantion at {path}')
+        with open(path, "w") as f:
+            json.dump(json_format, f, indent=2)
+            logger.info(f"Saved json format of the explanation at {path}")
 
     def print(self):
         json_format = {}
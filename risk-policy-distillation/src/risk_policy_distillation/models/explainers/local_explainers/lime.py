@@ -2,23 +2,28 @@ from lime.lime_text import LimeTextExplainer
 
 from risk_policy_distillation.models.explainers.local_explainers.local_explainer import (
     LocalExplainer,
+    sample_schedule,
 )
 
 
 class LIME(LocalExplainer):
 
-    def __init__(self, dataset_name, label_names, n_words=6, n_samples=1000):
+    def __init__(self, dataset_name, label_names, n_words=6, n_samples=1000, adaptive=False, min_samples=100):
         """
         Lime explainer for word-based explanations.
         :param dataset_name: name of the datasets
         :param label_names: list of label names
         :param n_words: number of the most important words to be extracted
         :param n_samples: neighbourhood size to be generated by LIME
+        :param adaptive: if True the neighbourhood size is doubled from min_samples until the word rankings stop changing
+        :param min_samples: neighbourhood size of the first round in the adaptive mode
         """
         super().__init__()
         self.dataset_name = dataset_name
         self.n_words = n_words
         self.n_samples = n_samples
+        self.adaptive = adaptive
+        self.min_samples = min_samples
 
         self.explainer = LimeTextExplainer(class_names=label_names)
 
@@ -35,11 +40,20 @@ class LIME(LocalExplainer):
         if not len(text.strip(' ')):
             return {d: [] for d in decisions}
 
-        exp = self.explainer.explain_instance(text,
-                                              prediction_func,
-                                              num_features=self.n_words,
-                                              labels=decisions,
-                                              num_samples=self.n_samples)
+        rankings = None
+        for num_samples in sample_schedule(self.n_samples, self.min_samples, self.adaptive):
+            exp = self.explainer.explain_instance(text,
+                                                  prediction_func,
+                                                  num_features=self.n_words,
+                                                  labels=decisions,
+                                                  num_samples=num_samples)
+
+            # stop once a larger neighbourhood does not change the word rankings
+            previous_rankings = rankings
+            rankings = {d: [w for w, _ in exp.as_list(d)] for d in decisions}
+            if rankings == previous_rankings:
+                break
+
         res = {}
         for d in decisions:
             scores = exp.as_list(d)
@@ -1,10 +1,30 @@
 from typing import Dict
 
 
+def sample_schedule(n_samples, min_samples=100, adaptive=False):
+    """
+    Neighbourhood sizes tried by a local explainer
+    :param n_samples: maximum number of samples
+    :param min_samples: number of samples in the first round of the adaptive mode
+    :param adaptive: if False only n_samples is used, otherwise the size is doubled from min_samples up to n_samples
+    :return: a list of neighbourhood sizes
+    """
+    if not adaptive or min_samples >= n_samples:
+        return [n_samples]
+
+    schedule = []
+    size = min_samples
+    while size < n_samples:
+        schedule.append(size)
+        size *= 2
+
+    return schedule + [n_samples]
+
+
 class LocalExplainer:
 
     def __init__(self):
         pass
 
     def explain(self, x) -> Dict:
-        return {}
\ No newline at end of file
+        return {}
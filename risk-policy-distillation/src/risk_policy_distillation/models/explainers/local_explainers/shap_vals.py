@@ -5,6 +5,7 @@ import shap
 
 from risk_policy_distillation.models.explainers.local_explainers.local_explainer import (
     LocalExplainer,
+    sample_schedule,
 )
 
 
@@ -13,18 +14,22 @@ logger = logging.getLogger("logger")
 
 class SHAP(LocalExplainer):
 
-    def __init__(self, dataset_name, label_names, n_words=6, n_samples=1000):
+    def __init__(self, dataset_name, label_names, n_words=6, n_samples=1000, adaptive=False, min_samples=100):
         """
         Lime explainer for word-based explanations.
         :param dataset_name: name of the datasets
         :param label_names: list of label names
         :param n_words: number of the most important words to be extracted
-        :param n_samples: neighbourhood size to be generated by LIME
+        :param n_samples: maximum number of evaluations of the prediction function in the adaptive mode
+        :param adaptive: if True the number of evaluations is doubled from min_samples until the supporting words stop changing
+        :param min_samples: number of evaluations in the first round of the adaptive mode
         """
         super().__init__()
         self.dataset_name = dataset_name
         self.n_words = n_words
         self.n_samples = n_samples
+        self.adaptive = adaptive
+        self.min_samples = min_samples
         self.label_names = label_names
 
         self.tokenizer = shap.maskers.Text(r"\W")
@@ -54,7 +59,19 @@ class SHAP(LocalExplainer):
             prediction_func, self.tokenizer, output_names=self.label_names
         )
 
-        shap_values = explainer([text])
+        if not self.adaptive:
+            shap_values = explainer([text])
+        else:
+            supporting = None
+            for num_samples in sample_schedule(self.n_samples, self.min_samples, self.adaptive):
+                shap_values = explainer([text], max_evals=num_samples)
+
+                # stop once more evaluations do not change which words support each decision
+                previous_supporting = supporting
+                supporting = [tuple(shap_values.values[0][:, d] > 0) for d in decisions]
+                if supporting == previous_supporting:
+                    break
+
         words = shap_values.data[0]
 
         res = {}
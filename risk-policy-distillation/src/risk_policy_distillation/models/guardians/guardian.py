@@ -1,6 +1,7 @@
 import math
 import random
 import re
+from collections import OrderedDict
 
 import numpy as np
 
@@ -9,11 +10,16 @@ from risk_policy_distillation.models.guardians.judge import Judge
 
 class Guardian(Judge):
 
-    def __init__(self, inference_engine, config):
+    def __init__(self, inference_engine, config, batch_size=32, cache_size=100000):
         super().__init__(config)
 
         self.inference_engine = inference_engine
 
+        # LIME and SHAP perturbations repeat across labels and inputs
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self.proba_cache = OrderedDict()
+
     def ask_guardian(self, message):
         if (isinstance(message, tuple) or isinstance(message, list)) and len(
             message
@@ -42,35 +48,53 @@ class Guardian(Judge):
         return self.label_names[output_id]
 
     def predict_proba(self, inputs):
-        messages = []
-        for i in inputs:
-            messages.append([{"role": "user", "content": i.strip()}])
-
-        responses = self.inference_engine.chat(messages)
-        probs = []
-        for response in responses:
-            try:
-                prediction = re.findall("<score>(.*?)</score>", response.prediction)[
-                    0
-                ].strip()
-            except IndexError as e:
-                prediction = response.prediction
-
-            if prediction == self.output_labels[0]:
-                prob_no = response.logprobs.get(prediction, response.logprobs.get(' ' + prediction))
-                probs.append(
-                    [
-                        math.e**prob_no,
-                        1 - math.e**prob_no,
-                    ]
-                )
-            elif prediction == self.output_labels[1]:
-                prob_yes = response.logprobs.get(prediction, response.logprobs.get(' ' + prediction))
-                probs.append(
-                    [
-                        1 - math.e**prob_yes,
-                        math.e**prob_yes,
-                    ]
-                )
-
-        return np.array(probs)
+        """
+        Predicts label probabilities for a list of texts, e.g. perturbations generated by LIME or SHAP.
+        Predictions are cached by text and only uncached texts are sent to the guardian in batches.
+        :param inputs: a list of texts
+        :return: an array of probabilities for each input
+        """
+        texts = [i.strip() for i in inputs]
+
+        probs = {t: self.proba_cache[t] for t in texts if t in self.proba_cache}
+        missing = [t for t in dict.fromkeys(texts) if t not in probs]
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            messages = [[{"role": "user", "content": t}] for t in batch]
+
+            responses = self.inference_engine.chat(messages)
+            for t, response in zip(batch, responses):
+                probs[t] = self.response_proba(response)
+
+        for t in texts:
+            self.proba_cache[t] = probs[t]
+            self.proba_cache.move_to_end(t)
+        while len(self.proba_cache) > self.cache_size:
+            self.proba_cache.popitem(last=False)
+
+        # responses with an unknown label are left out
+        return np.array([probs[t] for t in texts if probs[t] is not None])
+
+    def response_proba(self, response):
+        try:
+            prediction = re.findall("<score>(.*?)</score>", response.prediction)[
+                0
+            ].strip()
+        except IndexError as e:
+            prediction = response.prediction
+
+        if prediction == self.output_labels[0]:
+            prob_no = response.logprobs.get(prediction, response.logprobs.get(' ' + prediction))
+            return [
+                math.e**prob_no,
+                1 - math.e**prob_no,
+            ]
+        elif prediction == self.output_labels[1]:
+            prob_yes = response.logprobs.get(prediction, response.logprobs.get(' ' + prediction))
+            return [
+                1 - math.e**prob_yes,
+                math.e**prob_yes,
+            ]
+
+        return None
@@ -5,6 +5,7 @@ from json import JSONDecodeError
 import numpy as np
 from sentence_transformers import SentenceTransformer, util
 
+from risk_policy_distillation.fm_factual.nli_cache import NLICache
 from risk_policy_distillation.fm_factual.nli_extractor import NLIExtractor
 from risk_policy_distillation.models.components.labeller import Labeller
 
@@ -25,6 +26,7 @@ class Clusterer:
         min_community_size=2,
         n_labels=10,
         n_iter=200,
+        nli_cache=None,
     ):
         self.inference_engine = inference_engine
         self.criterion = criterion
@@ -39,6 +41,10 @@ class Clusterer:
 
         self.labeller = Labeller(inference_engine)
 
+        # the same (name, concept) pairs are verified repeatedly across iterations
+        self.nli_cache = nli_cache if nli_cache is not None else NLICache()
+        self.nli_extractor = None
+
     def cluster(self, clustering_input, threshold=0.75, min_community_size=2):
         logger.info("Clustering {} instances".format(len(clustering_input)))
 
@@ -98,9 +104,15 @@ class Clusterer:
             for i, c in enumerate(contexts)
         ]
 
-        nli_extractor = NLIExtractor(self.inference_engine, model, prompt_version=nli_prompt_version)
+        if self.nli_extractor is None:
+            self.nli_extractor = NLIExtractor(
+                self.inference_engine,
+                model,
+                prompt_version=nli_prompt_version,
+                cache=self.nli_cache,
+            )
 
-        relations = nli_extractor.runall(
+        relations = self.nli_extractor.runall(
             atoms * len(contexts),  # fill in the atoms to be the same length as contexts
             contexts
         )
@@ -1,7 +1,6 @@
 import logging
 from pathlib import Path
 
-import pandas as pd
 from sentence_transformers import SentenceTransformer
 
 from tqdm import tqdm
@@ -10,6 +9,7 @@ from risk_policy_distillation.models.components.reasoner import Reasoner
 from risk_policy_distillation.models.components.summarizer import Summarizer
 from risk_policy_distillation.models.components.verifier import Verifier
 from risk_policy_distillation.models.guardians.judge import Judge
+from risk_policy_distillation.pipeline.expl_writer import LocalExplanationWriter
 
 
 logger = logging.getLogger("logger")
@@ -43,30 +43,36 @@ class Extractor:
 
         self.local_explainer = local_explainer
 
-    def extract_concepts(self, dataset, save_path: Path, use_lime=False, verbose=False):
-        try:
-            ds = pd.read_csv(save_path, header=0)
-            if len(ds) == dataset.size():
-                # if all inputs are processed already
-                logger.info("Loaded concepts from {}".format(save_path))
-            else:
-                # start extracting from the last processed index
-                last_index = ds.iloc[-1].Index
-                last_id = ds[ds.Index == last_index].index.item() + 1
-                logger.info(
-                    "Loaded concepts from {} inputs. Continuing from index = {}".format(
-                        len(ds), last_index
-                    )
-                )
-                return self._extract_concepts(
-                    dataset, save_path, use_lime, verbose, start_id=last_id
+    def extract_concepts(
+        self, dataset, save_path: Path, use_lime=False, verbose=False, flush_every=50
+    ):
+        writer = LocalExplanationWriter(save_path, flush_every=flush_every)
+
+        if writer.n_rows == dataset.size():
+            # if all inputs are processed already
+            logger.info("Loaded concepts from {}".format(save_path))
+            return
+
+        if writer.n_rows:
+            # start extracting after the last processed index
+            logger.info(
+                "Loaded concepts from {} inputs. Continuing from index = {}".format(
+                    writer.n_rows, writer.last_index
                 )
+            )
 
-        except FileNotFoundError:
-            return self._extract_concepts(dataset, save_path, use_lime, verbose)
+        with writer:
+            self._extract_concepts(
+                dataset, writer, use_lime, verbose, start_id=writer.n_rows
+            )
 
     def _extract_concepts(
-        self, dataset, save_path: Path, use_lime=False, verbose=False, start_id=0
+        self,
+        dataset,
+        writer: LocalExplanationWriter,
+        use_lime=False,
+        verbose=False,
+        start_id=0,
     ):
         logger.info("Generating local explanations...")
         for i, row in tqdm(dataset.train[start_id:].iterrows()):
@@ -106,7 +112,7 @@ class Extractor:
                 guardian_response,
                 true_label,
                 bulletpoints,
-                save_path,
+                writer,
             )
 
             if verbose:
@@ -118,7 +124,7 @@ class Extractor:
 
         logger.info(
             "Explained {} instances. Results saved in {}".format(
-                dataset.size(), save_path
+                dataset.size(), writer.save_path
             )
         )
 
@@ -180,7 +186,7 @@ class Extractor:
         guardian_response,
         true_label,
         bulletpoints,
-        save_path: Path,
+        writer: LocalExplanationWriter,
     ):
         if isinstance(message, list) or isinstance(message, tuple):
             message_names = [dataset.prompt_col, dataset.response_col]
@@ -207,16 +213,11 @@ class Extractor:
                 + [bulletpoints[d] for d in self.guardian.labels]
             ]
 
-        # save dataset periodically
-        df = pd.DataFrame(
-            records,
-            columns=["Index"]
+        # rows are buffered and flushed to the csv periodically
+        writer.append(
+            records[0],
+            ["Index"]
             + message_names
             + ["Criterion", "GG Label", "True Label"]
             + self.guardian.label_names,
         )
-
-        if save_path.exists():
-            df.to_csv(save_path, mode="a", index=False, header=False)
-        else:
-            df.to_csv(save_path, mode="w", index=False)
@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+from pathlib import Path
+
+import pandas as pd
+
+
+logger = logging.getLogger("logger")
+
+
+def to_python(value):
+    # numpy scalars are not json serializable
+    return value.item() if hasattr(value, "item") else value
+
+
+class LocalExplanationWriter:
+
+    def __init__(self, save_path: Path, flush_every=50):
+        """
+        Buffered writer for local explanations with a checkpoint sidecar for resuming.
+        Rows are appended to the csv every flush_every records and the checkpoint stores the number of
+        processed rows, the last processed index and the byte size of the csv after the last flush.
+        :param save_path: path to the local explanation csv file
+        :param flush_every: number of buffered rows written to the file at once
+        """
+        self.save_path = Path(save_path)
+        self.checkpoint_path = self.save_path.with_name(self.save_path.name + ".ckpt.json")
+        self.flush_every = flush_every
+
+        self.buffer = []
+        self.columns = None
+
+        self.n_rows, self.last_index, self.offset = self.load_checkpoint()
+
+    def load_checkpoint(self):
+        """
+        :return: number of processed rows, last processed index and csv size in bytes
+        """
+        if not self.save_path.exists():
+            return 0, None, 0
+
+        if self.checkpoint_path.exists():
+            with open(self.checkpoint_path, "r") as f:
+                checkpoint = json.load(f)
+
+            if self.save_path.stat().st_size >= checkpoint["offset"]:
+                # drop rows written after the last checkpoint, e.g. by an interrupted flush
+                os.truncate(self.save_path, checkpoint["offset"])
+                return checkpoint["n_rows"], checkpoint["last_index"], checkpoint["offset"]
+
+        # results written without a (valid) checkpoint -- read the csv once and create the checkpoint
+        ds = pd.read_csv(self.save_path, header=0)
+        last_index = to_python(ds.iloc[-1].Index) if len(ds) else None
+        offset = self.save_path.stat().st_size
+        self.write_checkpoint(len(ds), last_index, offset)
+
+        return len(ds), last_index, offset
+
+    def write_checkpoint(self, n_rows, last_index, offset):
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"n_rows": n_rows, "last_index": last_index, "offset": offset}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def append(self, record, columns):
+        """
+        Buffers a single row of local explanations
+        :param record: list of values in the row
+        :param columns: names of the columns
+        :return:
+        """
+        self.columns = columns
+        self.buffer.append(record)
+
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not len(self.buffer):
+            return
+
+        df = pd.DataFrame(self.buffer, columns=self.columns)
+        with open(self.save_path, "a", newline="") as f:
+            df.to_csv(f, index=False, header=self.offset == 0)
+
+        self.n_rows += len(self.buffer)
+        self.last_index = to_python(df["Index"].iloc[-1])
+        self.offset = self.save_path.stat().st_size
+        self.write_checkpoint(self.n_rows, self.last_index, self.offset)
+
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,13 +1,18 @@
 import ast
-import itertools
+import json
 import logging
 import os
+import sys
 from pathlib import Path
 
 import pandas as pd
 
 from risk_policy_distillation.datasets.abs_dataset import AbstractDataset
-from risk_policy_distillation.explanation.bipartite_graph import BipartiteGraph
+from risk_policy_distillation.explanation.bipartite_graph import (
+    BipartiteGraph,
+    zip_concepts,
+)
+from risk_policy_distillation.explanation.expl_store import read_header
 from risk_policy_distillation.models.explainers.global_explainers.global_expl import (
     GlobalExplainer,
 )
@@ -18,6 +23,34 @@ from risk_policy_distillation.pipeline.concept_extractor import Extractor
 logger = logging.getLogger("logger")
 
 
+def parse_concept_column(values, parsed=None):
+    """
+    Parses a column of stringified concept lists from a local explanation file
+    :param values: a list of cells such as "['concept 1', 'concept 2']"
+    :param parsed: a dict of already parsed cells, reused across columns
+    :return: a list of concept tuples, one per cell, with concept strings interned
+    """
+    if parsed is None:
+        parsed = {}
+
+    # a repr'd list of strings without double quotes or escapes is valid JSON once quotes are swapped
+    slow_cells = []
+    for v in dict.fromkeys(v for v in values if v not in parsed):
+        if '"' in v or "\\" in v:
+            slow_cells.append(v)
+        else:
+            parsed[v] = tuple(sys.intern(c) for c in json.loads(v.replace("'", '"')))
+
+    # literal_eval is dominated by per-call compile overhead, so the remaining cells are parsed in one call
+    if len(slow_cells):
+        for v, concepts in zip(
+            slow_cells, ast.literal_eval("[{}]".format(",".join(slow_cells)))
+        ):
+            parsed[v] = tuple(sys.intern(c) for c in concepts)
+
+    return [parsed[v] for v in values]
+
+
 class Pipeline:
 
     def __init__(
@@ -28,6 +61,7 @@ class Pipeline:
         lime=True,
         fr=True,
         verbose=0,
+        inference_engine=None,
     ):
         """
         Pipeline for generating local and global explanations.
@@ -37,6 +71,8 @@ class Pipeline:
         :param lime: If the pipeline uses a local word-based explainer like LIME to verify local concept-based explanations
         :param fr: If the pipeline uses a factuality assessor like FactReasoner to verify global explanations
         :param verbose: amount of logs generated -- 0 for very little logging, 1 for practically everything logged.
+        :param inference_engine: LLM the global explainer uses to check which rules cover an input.
+                                 Defaults to the inference engine of the clusterer.
         """
         self.extractor = extractor
         self.clusterer = clusterer
@@ -47,6 +83,10 @@ class Pipeline:
 
         self.verbose = verbose
 
+        if inference_engine is None and clusterer is not None:
+            inference_engine = clusterer.inference_engine
+        self.inference_engine = inference_engine
+
         logger.info("Built pipeline.")
         logger.info("Using LIME = {}".format(self.lime))
         logger.info("Using FactReasoner = {}".format(self.fr))
@@ -70,9 +110,20 @@ class Pipeline:
             f"Results directory for {dataset.dataset_name}: [{local_expl_path}, {global_expl_path}]"
         )
 
-        # if the global explanation already exists load it
-        if global_expl_path.exists():
-            global_expl = GlobalExplainer(expl_path=global_expl_path)
+        # if the global explanation already exists load it -- only the header is read to detect it
+        if read_header(global_expl_path) is not None:
+            global_expl = GlobalExplainer(
+                expl_path=global_expl_path, inference_engine=self.inference_engine
+            )
+            return global_expl
+
+        # explanations pickled by earlier versions are converted to the current format
+        legacy_expl_path = global_expl_path.with_suffix(".pkl")
+        if legacy_expl_path.exists():
+            global_expl = GlobalExplainer(
+                expl_path=legacy_expl_path, inference_engine=self.inference_engine
+            )
+            global_expl.save(global_expl_path)
             return global_expl
 
         if self.concept_dataset is None:
@@ -102,24 +153,15 @@ class Pipeline:
             )
 
             # get a global explanation from the summarized graph
-            global_expl = GlobalExplainer(expl_graph=best_graph)
+            global_expl = GlobalExplainer(
+                expl_graph=best_graph, inference_engine=self.inference_engine
+            )
             global_expl.save(global_expl_path)
 
             return global_expl
 
     def custom_zipp(self, concepts):
-        max_len = max(len(c) for c in concepts)
-
-        if not max_len:
-            return []
-
-        for c in concepts:
-            if len(c) < max_len:
-                c += ["none"] * (max_len - len(c))
-
-        combinations = list(set(itertools.product(*concepts)))
-
-        return combinations
+        return zip_concepts(concepts)
 
     def get_graph_expl(self, concept_dataset, labels) -> BipartiteGraph:
         """
@@ -131,25 +173,19 @@ class Pipeline:
         expl_graph = BipartiteGraph(labels)
         label_names = self.extractor.guardian.label_names
 
-        concept_datasets = []
-        for i in labels:
-            cs = concept_dataset[concept_dataset["GG Label"] == i]
-            concept_datasets.append(cs)
+        # shared between partitions so each distinct cell is parsed only once
+        parsed = {}
 
-        for i, cds in enumerate(concept_datasets):
+        for i in labels:
+            cds = concept_dataset[concept_dataset["GG Label"] == i]
             if not len(cds):
                 continue
 
-            cds["Zipped"] = cds.apply(
-                lambda x: self.custom_zipp(
-                    [ast.literal_eval(x[label_names[d]]) for d in labels]
-                ),
-                axis=1,
-            )
-
-            concept_pairs = cds["Zipped"].values.tolist()
-            flattened_concepts = [item for sublist in concept_pairs for item in sublist]
-            expl_graph.load_graph(flattened_concepts, label=i)
+            concept_columns = [
+                parse_concept_column(cds[label_names[d]].tolist(), parsed)
+                for d in labels
+            ]
+            expl_graph.load_concepts(concept_columns, label=i)
 
         return expl_graph
 
@@ -170,6 +206,6 @@ class Pipeline:
                 os.makedirs(dir_path)
 
         local_expl_path = local_expl_path.joinpath("local_expl.csv")
-        global_expl_path = global_expl_path.joinpath("global_expl.pkl")
+        global_expl_path = global_expl_path.joinpath("global_expl.jsonl")
 
         return local_expl_path, global_expl_path